@@ -2,6 +2,8 @@
 
 import hashlib
 import json
+import os
+import sys
 from typing import BinaryIO
 
 from BuildClasses import PointerFile, ROMPointerFile, TableEntry, pointer_tables
@@ -393,6 +395,13 @@ def dumpPointerTableDetails(filename: str, fr: BinaryIO, generate_json: bool):
                         # del file["compressed_size"]
                         del file["index"]
             fh.write(json.dumps(dataset))
+        # The randomizer looks files up in this index instead of parsing the JSON, tagged with the JSON's size so it can tell if they drift apart
+        # It's written with the randomizer's own code, so the two never disagree on its layout
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+        from randomizer.Patching.Library.PointerIndex import PointerTableIndex
+
+        with open("../static/patches/pointer_index.bin", "wb") as fh:
+            fh.write(PointerTableIndex.FromTables(dataset).ToBytes(os.path.getsize("../static/patches/pointer_addresses.json")))
 
 
 def dumpPointerTableDetailsLegacy(filename: str, fr: BinaryIO):
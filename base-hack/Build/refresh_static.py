@@ -17,5 +17,6 @@ def downloadStatic(file: str):
 
 downloadStatic("static/patches/shrink-dk64.bps")
 downloadStatic("static/patches/pointer_addresses.json")
+downloadStatic("static/patches/pointer_index.bin")
 downloadStatic("static/patches/symbols.json")
 print("Complete")
@@ -0,0 +1,201 @@
+"""Benchmark seed generation across presets and a range of seeds.
+
+Usage: python benchmark.py [--presets FILE ...] [--preset NAME ...] [--settings-string STRING] [--seed-start N] [--seed-count N] [--processes N] [--output FILE]
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from statistics import mean
+
+import randomizer.Lists.Exceptions as Ex
+
+DEFAULT_PRESET_FOLDER = "./static/presets"
+DEFAULT_OUTPUT = "benchmark-result.json"
+# The same settings string tests/test_spoiler.py generates, used when no presets with settings strings are found
+DEFAULT_PRESETS = [
+    {
+        "name": "Custom",
+        "settings_string": "fjNPw8MxDKY6IJUtjnqSszmCCXBHofUA4IhkQlS2Nc+EZ+PxGiUiWxClFcdqgQmC9AAO/AAbBAADDAADFAACbzgSGIyGOhbgKQWiltsC3ASSAaZM1UQoxSClFMBkyyvV+CgLcAQYCbwEDgbgAwgEcQIEgrkBQoGcwMFg7oBwwIuQQmQ1AdWRXgAynEpq1hJQlHdVqyWJGZitIEcnaFalL0VEWARMRQBWLLHI3ZLxd5FA5DsZe09AzycYcgDKpwRCAAXCgAXDAATDgATEAAPWgAPEgALFAAHFgAPGAALGgAHXAAWnyvQJLlS2eyyejYfAwjmSu1gYDOXVYDiqKymVFoxxSgBQVg0oBOKi0SRcQyKnjWlkGkRGujsADoBeEIQEhQWHVhGWCAiJEhaKCosSlwwMjRMXjg6PE5gQEJEUFN8DGpoGBpWZYAGVGZjhAGIAToBZACiAA",
+    }
+]
+PERCENTILES = (50, 90, 95, 99)
+
+
+def load_presets(paths=None, names=None):
+    """Load every preset with a settings string from the given preset files, or from the preset folder if none are given."""
+    if not paths:
+        paths = sorted(glob.glob(os.path.join(DEFAULT_PRESET_FOLDER, "**", "*.json"), recursive=True))
+    presets = []
+    for path in paths:
+        with open(path, "r") as fh:
+            data = json.load(fh)
+        # Files are either a list of presets, or a list of presets per branch like the controller's local_presets.json
+        if isinstance(data, dict):
+            data = [preset for branch in data.values() for preset in branch]
+        # Weighted presets describe how to roll random settings rather than holding a settings string, so they can't be generated directly
+        presets.extend(preset for preset in data if isinstance(preset, dict) and preset.get("settings_string"))
+    if not presets:
+        presets = list(DEFAULT_PRESETS)
+    if names:
+        presets = [preset for preset in presets if preset.get("name") in names]
+    return presets
+
+
+def generate_one(preset_name, settings_string, seed):
+    """Generate a single seed and return how long it took along with its metrics, or why it failed."""
+    # Imported here so each pool process loads the randomizer itself
+    from randomizer.Fill import Generate_Spoiler
+    from randomizer.Settings import Settings
+    from randomizer.SettingStrings import decrypt_settings_string_enum
+    from randomizer.Spoiler import Spoiler
+
+    result = {"preset": preset_name, "seed": seed, "success": False, "failure": None, "time": 0.0, "metrics": None}
+    spoiler = None
+    start = time.perf_counter()
+    try:
+        settings_dict = decrypt_settings_string_enum(settings_string)
+        settings_dict["seed"] = seed
+        spoiler = Spoiler(Settings(settings_dict))
+        Generate_Spoiler(spoiler)
+        result["success"] = True
+    except Exception as e:
+        result["failure"] = get_failure_reason(e)
+        result["traceback"] = traceback.format_exc()
+    result["time"] = time.perf_counter() - start
+    if spoiler is not None:
+        result["metrics"] = spoiler.metrics.ToDict()
+    return result
+
+
+def get_failure_reason(exception):
+    """Name the failure after the randomizer exception that caused it, or mark it as unexpected."""
+    name = type(exception).__name__
+    if getattr(Ex, name, None) is type(exception):
+        return name
+    return f"Unexpected {name}"
+
+
+def run_task(task):
+    """Unpack a task for the process pool."""
+    return generate_one(*task)
+
+
+def percentile(values, percent):
+    """Get the given percentile of a list of values by linear interpolation."""
+    if not values:
+        return None
+    values = sorted(values)
+    position = (len(values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(results, elapsed):
+    """Summarize a set of generation results."""
+    successes = [result for result in results if result["success"]]
+    times = [result["time"] for result in successes]
+    failures = {}
+    for result in results:
+        if not result["success"]:
+            failures[result["failure"]] = failures.get(result["failure"], 0) + 1
+    measured = [result["metrics"] for result in results if result["metrics"] is not None]
+    fill_retries = [metrics["fill_retries"] for metrics in measured]
+    phases = {}
+    for metrics in measured:
+        for name, phase in metrics["phases"].items():
+            phases.setdefault(name, {"wall": [], "cpu": []})
+            phases[name]["wall"].append(phase["wall"])
+            phases[name]["cpu"].append(phase["cpu"])
+    searches = {}
+    for metrics in measured:
+        for mode, count in metrics["searches"].items():
+            searches[mode] = searches.get(mode, 0) + count
+    return {
+        "seeds": len(results),
+        "successes": len(successes),
+        "failure_rate": round((len(results) - len(successes)) / len(results), 4) if results else 0,
+        "failures": failures,
+        "seeds_per_minute": round(len(successes) * 60 / elapsed, 4) if elapsed > 0 else 0,
+        "latency": {
+            "mean": round(mean(times), 4) if times else None,
+            "max": round(max(times), 4) if times else None,
+            **{f"p{percent}": round(percentile(times, percent), 4) if times else None for percent in PERCENTILES},
+        },
+        "fill_retries": {
+            "total": sum(fill_retries),
+            "per_seed": round(sum(fill_retries) / len(fill_retries), 4) if fill_retries else 0,
+            "seeds_retried": round(len([retries for retries in fill_retries if retries > 0]) / len(fill_retries), 4) if fill_retries else 0,
+        },
+        "phases": {name: {"mean_wall": round(mean(phase["wall"]), 4), "mean_cpu": round(mean(phase["cpu"]), 4), "total_wall": round(sum(phase["wall"]), 4)} for name, phase in phases.items()},
+        "searches": searches,
+        "peak_rss": max([metrics["peak_rss"] for metrics in measured], default=0),
+    }
+
+
+def run_benchmark(presets, seed_start=0, seed_count=10, processes=None):
+    """Generate every seed in the range for each preset and summarize the results per preset and overall."""
+    tasks = [(preset["name"], preset["settings_string"], seed) for preset in presets for seed in range(seed_start, seed_start + seed_count)]
+    processes = processes or os.cpu_count() or 1
+    start = time.perf_counter()
+    if processes == 1:
+        results = [run_task(task) for task in tasks]
+    else:
+        # Every seed gets its own process so nothing left over from one generation can affect the next
+        with multiprocessing.Pool(processes, maxtasksperchild=1) as pool:
+            results = pool.map(run_task, tasks, chunksize=1)
+    elapsed = time.perf_counter() - start
+    return {
+        "generated_time": time.time(),
+        "seed_start": seed_start,
+        "seed_count": seed_count,
+        "processes": processes,
+        "elapsed": round(elapsed, 4),
+        "overall": summarize(results, elapsed),
+        # Each preset's throughput is measured against the whole run, as seeds from every preset share the pool
+        "presets": {preset["name"]: summarize([result for result in results if result["preset"] == preset["name"]], elapsed) for preset in presets},
+        "failed_seeds": [{"preset": result["preset"], "seed": result["seed"], "failure": result["failure"], "traceback": result["traceback"]} for result in results if not result["success"]],
+    }
+
+
+def main(argv=None):
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark seed generation across presets and a range of seeds.")
+    parser.add_argument("--presets", nargs="*", help="Preset files to load, defaults to every file in static/presets")
+    parser.add_argument("--preset", nargs="*", dest="names", help="Only benchmark presets with these names")
+    parser.add_argument("--settings-string", help="Benchmark this settings string instead of any presets")
+    parser.add_argument("--seed-start", type=int, default=0, help="First seed to generate")
+    parser.add_argument("--seed-count", type=int, default=10, help="Number of seeds to generate for each preset")
+    parser.add_argument("--processes", type=int, default=None, help="Number of processes to generate with, defaults to the CPU count")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="File to write the results to")
+    args = parser.parse_args(argv)
+
+    if args.settings_string:
+        presets = [{"name": "Custom", "settings_string": args.settings_string}]
+    else:
+        presets = load_presets(args.presets, args.names)
+    if not presets:
+        print("No presets to benchmark.")
+        return 1
+    if not os.path.exists("dk64.z64"):
+        print("No ROM was loaded, please make sure you have dk64.z64 in the root directory of the project.")
+        return 1
+    results = run_benchmark(presets, args.seed_start, args.seed_count, args.processes)
+    with open(args.output, "w") as fh:
+        json.dump(results, fh, indent=4)
+    overall = results["overall"]
+    print(f"{overall['successes']}/{overall['seeds']} seeds in {results['elapsed']}s ({overall['seeds_per_minute']} seeds/min), p50 {overall['latency']['p50']}s")
+    for failure, count in overall["failures"].items():
+        print(f"{failure}: {count}")
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ import pytest
 def pytest_addoption(parser):
     """Add a command line option to specify the maximum acceptable failure rate for the test suite."""
     parser.addoption("--max-failure-rate", action="store", default=0.4, type=float, help="Max acceptable failure rate (default: 0.4 for 40%)")
+    parser.addoption("--benchmark-seeds", action="store", default=0, type=int, help="Number of seeds per preset to benchmark (default: 0, which skips the benchmark)")
+    parser.addoption("--benchmark-output", action="store", default="benchmark-result.json", help="File to write the benchmark results to")
 
 
 @pytest.hookimpl(tryfirst=True)
@@ -1,15 +1,18 @@
 """Controller Router manages all the worker nodes."""
 
+import codecs
 import json
 import logging
 import os
 import copy
+import random
 import secrets
 import threading
 import time
 import sys
 import socket
 from datetime import timezone, datetime
+from io import BytesIO
 from os import environ, path, walk
 
 import requests
@@ -40,6 +43,7 @@ from waitress import serve
 from werkzeug.utils import secure_filename
 from cleanup import enable_cleanup
 from oauth import DiscordAuth
+from randomizer.SeedArtifact import ARTIFACT_EXTENSION, ReadSeedArtifactHeader, ReadSeedArtifactSection, ReadSpoilerLog
 from functools import wraps
 from swagger_ui import flask_api_doc
 from werkzeug.middleware.proxy_fix import ProxyFix
@@ -232,6 +236,36 @@ def get_user_ip():
     return request.remote_addr
 
 
+def get_worker_url(branch):
+    """Get the URL of the worker for a branch."""
+    url = environ.get("WORKER_URL_DEV") if branch == "dev" else environ.get("WORKER_URL_MASTER")
+    if not url:
+        url = "http://127.0.0.1:8000"
+    return url
+
+
+# The worker answers settings checks without generating a seed, so anything slower than this means it's stuck or busy
+CHECK_SETTINGS_TIMEOUT = 5
+# A check takes the worker tens of milliseconds, a submission waits no longer than this on one before it's queued unchecked
+SUBMIT_CHECK_SETTINGS_TIMEOUT = 1
+
+
+def check_settings_feasibility(settings_data, branch):
+    """Ask the worker whether the settings can generate a seed, returning why not if they can't.
+
+    Anything short of a clear answer lets the seed through, the worker will still catch it when it generates.
+    """
+    try:
+        response = requests.post(f"{get_worker_url(branch)}/check_settings", json={"settings_data": settings_data}, timeout=SUBMIT_CHECK_SETTINGS_TIMEOUT)
+        result = response.json() if response.status_code == 200 else {}
+    except Exception as e:
+        logger.info(f"Unable to check settings feasibility: {e}")
+        return None
+    if result.get("feasible") is False:
+        return result.get("error")
+    return None
+
+
 @api.route("/submit-task", methods=["POST"])
 @enforce_api_restrictions()
 def submit_task():
@@ -255,6 +289,13 @@ def submit_task():
         settings_data = json.loads(data.get("settings_data"))
     else:
         settings_data = data.get("settings_data")
+    # Random settings are resolved from the seed, so it's picked here for the check to resolve them the same way the job will
+    if not settings_data.get("seed"):
+        settings_data["seed"] = random.randint(0, 100000000)
+    # Settings that can never generate would otherwise hold up a worker through every retry
+    infeasible = check_settings_feasibility(settings_data, branch)
+    if infeasible is not None:
+        return set_response(json.dumps({"error": infeasible}), 400)
     user_ip = get_user_ip()
     # Check the last submission time for this IP
     last_submission_key = f"last_submission:{user_ip}"
@@ -484,11 +525,27 @@ def get_seed():
     base_dir = path.normpath("generated_seeds/")
     json_path = path.normpath(path.join(base_dir, f"{file_name}.json"))
     lanky_path = path.normpath(path.join(base_dir, f"{file_name}.lanky"))
+    artifact_path = path.normpath(path.join(base_dir, f"{file_name}{ARTIFACT_EXTENSION}"))
 
     # Validate that the paths stay within the intended directory
-    if not json_path.startswith(base_dir) or not lanky_path.startswith(base_dir):
+    if not json_path.startswith(base_dir) or not lanky_path.startswith(base_dir) or not artifact_path.startswith(base_dir):
         return set_response({"error": "Invalid hash parameter"}, 400)
 
+    # Serve the patch straight out of the seed artifact, only reading its section of the file
+    if path.isfile(artifact_path):
+        try:
+            with open(artifact_path, "rb") as f:
+                patch = ReadSeedArtifactSection(f, ReadSeedArtifactHeader(f), "patch")
+            return send_file(
+                BytesIO(codecs.encode(patch, "base64")),
+                mimetype="application/zip",
+                as_attachment=True,
+                download_name=f"{file_name}.lanky",
+            )
+        except Exception as e:
+            logging.error(f"Error in get_seed: {e}")
+            return set_response({"error": "An internal error has occurred"}, 500)
+
     # Check if the lanky file exists
     if not path.isfile(lanky_path):
         return set_response({"error": "Lanky file not found"}, 404)
@@ -518,11 +575,24 @@ def get_spoiler_log():
     file_name = secure_filename(seed_hash)
     base_dir = path.normpath("generated_seeds/")
     json_path = path.normpath(path.join(base_dir, f"{file_name}.json"))
+    artifact_path = path.normpath(path.join(base_dir, f"{file_name}{ARTIFACT_EXTENSION}"))
 
     # Ensure the path stays within the intended directory
-    if not json_path.startswith(base_dir):
+    if not json_path.startswith(base_dir) or not artifact_path.startswith(base_dir):
         return set_response({"error": "Access denied"}, 403)
 
+    # The unlock time is in the header of the seed artifact, so a locked log is turned away without reading any of it
+    if path.isfile(artifact_path):
+        try:
+            with open(artifact_path, "rb") as f:
+                header = ReadSeedArtifactHeader(f)
+                if header.unlock_time > time.time():
+                    return set_response({"error": "Spoiler log is locked"}, 425)
+                return set_response(ReadSpoilerLog(f, header), 200)
+        except Exception as e:
+            logging.error(f"Error in get_spoiler_log: {e}", exc_info=True)
+            return set_response({"error": "An internal error has occurred"}, 500)
+
     # Check if the JSON file exists
     if not path.isfile(json_path):
         return set_response({"error": "File not found"}, 404)
@@ -600,15 +670,31 @@ def get_total_info():
     return current_total, last_generated_time
 
 
+@api.route("/check_settings", methods=["POST"])
+@enforce_api_restrictions()
+def check_settings():
+    """Check if settings can generate a seed at all, without queuing one."""
+    data = request.get_json()
+    if not data or "settings_data" not in data:
+        return set_response(json.dumps({"error": "Invalid payload"}), 400)
+    settings_data = data.get("settings_data")
+    if isinstance(settings_data, str):
+        settings_data = json.loads(settings_data)
+    try:
+        response = requests.post(f"{get_worker_url(request.args.get('branch'))}/check_settings", json={"settings_data": settings_data}, timeout=CHECK_SETTINGS_TIMEOUT)
+    except requests.RequestException as e:
+        logger.info(f"Unable to check settings: {e}")
+        return set_response(json.dumps({"error": "Unable to reach the worker to check the settings"}), 503)
+    return set_response(response.text, response.status_code)
+
+
 @api.route("/get_selector_info", methods=["GET"])
 @enforce_api_restrictions()
 def get_selector_info():
     """Get the selector data for the randomizer."""
     # If the branch arg is master call os.environ.get("WORKER_URL_MASTER") with requests
     # Else call os.environ.get("WORKER_URL_DEV") with requests
-    url = environ.get("WORKER_URL_DEV") if request.args.get("branch") == "dev" else environ.get("WORKER_URL_MASTER")
-    if not url:
-        url = "http://127.0.0.1:8000"
+    url = get_worker_url(request.args.get("branch"))
     response = requests.get(f"{url}/get_selector_info")
     return set_response(response.text, response.status_code)
 
@@ -617,9 +703,7 @@ def get_selector_info():
 @enforce_api_restrictions()
 def convert_settings():
     """Convert settings for the randomizer."""
-    url = environ.get("WORKER_URL_DEV") if request.args.get("branch") == "dev" else environ.get("WORKER_URL_MASTER")
-    if not url:
-        url = "http://127.0.0.1:8000"
+    url = get_worker_url(request.args.get("branch"))
     data = request.get_json()
     response = requests.post(f"{url}/convert_settings", json=data)
     return set_response(response.json(), response.status_code)
@@ -5,6 +5,7 @@ import time
 from os import listdir, makedirs, path, remove
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from randomizer.SeedArtifact import ARTIFACT_EXTENSION, ReadSeedArtifactHeader
 
 
 def delete_old_files():
@@ -13,7 +14,18 @@ def delete_old_files():
     current_time = time.time()
     makedirs("generated_seeds", exist_ok=True)
     for filename in listdir(folder_path):
-        if filename.endswith(".json"):
+        if filename.endswith(ARTIFACT_EXTENSION):
+            file_path = path.join(folder_path, filename)
+            try:
+                # Only the header is needed to know when the seed was generated
+                with open(file_path, "rb") as file:
+                    generated_time = ReadSeedArtifactHeader(file).generated_time
+                if current_time - generated_time >= 2419200:  # 4 weeks in seconds
+                    remove(file_path)
+                    print(f"Deleted file: {filename}")
+            except Exception as e:
+                print(e)
+        elif filename.endswith(".json"):
             file_path = path.join(folder_path, filename)
             with open(file_path, "r") as file:
                 data = json.load(file)
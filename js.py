@@ -23,8 +23,17 @@ def getStringFile(filename):
         return file.read()
 
 
-with open("./static/patches/pointer_addresses.json", "rb") as file:
-    pointer_addresses = json.loads(file.read())
-
-with open("./static/patches/symbols.json", "rb") as file:
-    rom_symbols = json.loads(file.read())
+lazy_files = {
+    "pointer_addresses": "./static/patches/pointer_addresses.json",
+    "rom_symbols": "./static/patches/symbols.json",
+}
+
+
+def __getattr__(name):
+    """Load the JSON files the browser would provide only once something asks for them."""
+    if name not in lazy_files:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with open(lazy_files[name], "rb") as file:
+        value = json.loads(file.read())
+    globals()[name] = value
+    return value
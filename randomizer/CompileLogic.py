@@ -0,0 +1,787 @@
+"""Compile logic rules against the settings of a seed, so checks decided only by settings are resolved once rather than on every search."""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import inspect
+import linecache
+import textwrap
+import types
+from copy import deepcopy
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from randomizer.Patching.Library.Generic import IsItemSelected
+
+if TYPE_CHECKING:
+    from randomizer.Logic import LogicVarHolder
+    from randomizer.Settings import Settings
+    from randomizer.Spoiler import Spoiler
+
+# Settings which are changed by the fill itself and so can never be treated as constant for a seed
+VOLATILE_SETTINGS = {
+    "BLockerEntryCount",
+    "BLockerEntryItems",
+    "BossBananas",
+    "boss_kongs",
+    "boss_maps",
+    "chunky_freeing_kong",
+    "diddy_freeing_kong",
+    "kongs_for_progression",
+    "lanky_freeing_kong",
+    "medal_requirement",
+    "open_lobbies",
+    "owned_kongs_by_level",
+    "owned_moves_by_level",
+    "prices",
+    "rareware_gb_fairies",
+    "starting_kong",
+    "starting_region",
+    "tiny_freeing_kong",
+    "valid_locations",
+}
+# Glitch flags on LogicVarHolder, set once from the settings when the holder is created
+GLITCH_FLAGS = {
+    "advanced_platforming",
+    "boulder_clip",
+    "dk_blocker_skip",
+    "generalclips",
+    "lanky_blocker_skip",
+    "ledgeclip",
+    "moonkicks",
+    "moontail",
+    "phasefall",
+    "phaseswim",
+    "phasewalk",
+    "skew",
+    "spawn_snags",
+    "swim_through_shores",
+    "tbs",
+    "troff_skip",
+}
+# Functions with no side effects which can be called at compile time when all of their arguments are known
+PURE_FUNCTIONS = {IsItemSelected, abs, all, any, bool, int, len, max, min, sum}
+MAX_INLINE_DEPTH = 8
+PRIMITIVE_TYPES = (type(None), bool, int, float, str)
+# Set by SetKong, which searches do separately for each kong, so no rule depends on them changing
+KONG_ATTRIBUTES = {"kong", "isdonkey", "isdiddy", "islanky", "istiny", "ischunky"}
+
+
+class UnsupportedLogic(Exception):
+    """Raised when a rule uses a construct the compiler does not handle, leaving the rule untouched."""
+
+
+class Known:
+    """Value of an expression which has been decided at compile time."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        """Initialize with given parameters."""
+        self.value = value
+
+
+class Residual:
+    """Expression which can only be decided while searching, along with the object it refers to if that is known."""
+
+    __slots__ = ("node", "obj")
+
+    def __init__(self, node: ast.expr, obj: Any = None) -> None:
+        """Initialize with given parameters."""
+        self.node = node
+        self.obj = obj
+
+
+class CompiledLogic:
+    """Record of the rules compiled for a spoiler, used to restore or recompile them if a folded setting changes."""
+
+    def __init__(self) -> None:
+        """Initialize with given parameters."""
+        self.originals: List[Tuple[Any, Callable]] = []
+        # Body of each compiled rule, so what it reads can be found without its source
+        self.trees: Dict[Callable, ast.expr] = {}
+        self.settings_snapshot: Dict[str, Any] = {}
+        self.glitch_snapshot: Dict[str, Any] = {}
+        self.volatile: Set[str] = set(VOLATILE_SETTINGS)
+
+
+def IsStaticValue(value: Any, depth: int = 0) -> bool:
+    """Check if a value is immutable data (or a container of such) that can be folded into a rule."""
+    if isinstance(value, PRIMITIVE_TYPES) or isinstance(value, Enum):
+        return True
+    if depth > 2:
+        return False
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return len(value) <= 256 and all(IsStaticValue(x, depth + 1) for x in value)
+    if isinstance(value, dict):
+        return len(value) <= 256 and all(IsStaticValue(k, depth + 1) and IsStaticValue(v, depth + 1) for k, v in value.items())
+    return False
+
+
+@lru_cache(maxsize=None)
+def GetFileTree(filename: str) -> Dict[int, List[ast.Lambda]]:
+    """Parse a source file once and index its lambdas by line."""
+    lines = linecache.getlines(filename)
+    if not lines:
+        raise UnsupportedLogic(f"No source available for {filename}")
+    lambdas: Dict[int, List[ast.Lambda]] = {}
+    for node in ast.walk(ast.parse("".join(lines), filename)):
+        if isinstance(node, ast.Lambda):
+            lambdas.setdefault(node.lineno, []).append(node)
+    return lambdas
+
+
+def FindLambda(code: types.CodeType) -> ast.Lambda:
+    """Find the lambda in its source file that a code object was compiled from."""
+    positions = [pos for pos in code.co_positions() if None not in pos and (pos[0], pos[2]) != (pos[1], pos[3])]
+    best = None
+    for node in GetFileTree(code.co_filename).get(code.co_firstlineno, []):
+        body = node.body
+        start = (body.lineno, body.col_offset)
+        end = (body.end_lineno, body.end_col_offset)
+        if all(start <= (pos[0], pos[2]) and (pos[1], pos[3]) <= end for pos in positions):
+            # Nested lambdas on the same line also contain the positions, so take the tightest fit
+            if best is None or (start >= best[0] and end <= best[1]):
+                best = (start, end, node)
+    if best is None:
+        raise UnsupportedLogic(f"Could not locate lambda at {code.co_filename}:{code.co_firstlineno}")
+    return best[2]
+
+
+@lru_cache(maxsize=None)
+def GetFunctionTree(func: Callable) -> ast.FunctionDef:
+    """Parse the source of a helper method."""
+    tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    node = tree.body[0]
+    if not isinstance(node, ast.FunctionDef):
+        raise UnsupportedLogic(f"Could not parse {func.__qualname__}")
+    args = node.args
+    if args.vararg or args.kwarg or args.kwonlyargs or args.posonlyargs:
+        raise UnsupportedLogic(f"Unsupported signature for {func.__qualname__}")
+    return node
+
+
+@lru_cache(maxsize=None)
+def BuildFactory(source: str, filename: str) -> types.CodeType:
+    """Compile the source of a rule factory, sharing the code object between identical rules."""
+    module = compile(source, filename, "exec")
+    for const in module.co_consts:
+        if isinstance(const, types.CodeType):
+            return const
+    raise UnsupportedLogic("Factory was not compiled")
+
+
+class RuleCompiler:
+    """Partially evaluates logic rules for one spoiler."""
+
+    def __init__(self, logic_variables: LogicVarHolder, settings: Settings, record: CompiledLogic) -> None:
+        """Initialize with given parameters."""
+        self.logic_variables = logic_variables
+        self.settings = settings
+        self.record = record
+        self.consts: List[Any] = []
+        self.const_names: Dict[int, str] = {}
+        self.param = "l"
+
+    def Compile(self, func: Callable) -> Callable:
+        """Return a rule equivalent to func for the current settings, or func itself if nothing could be folded."""
+        code = func.__code__
+        if code.co_argcount != 1 or func.__defaults__ or func.__kwdefaults__ or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+            return func
+        node = FindLambda(code)
+        if isinstance(node.body, ast.Constant):
+            return func
+        for child in ast.walk(node.body):
+            if isinstance(child, (ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp, ast.NamedExpr, ast.Await, ast.Yield, ast.YieldFrom)):
+                return func
+        self.consts = []
+        self.const_names = {}
+        self.param = code.co_varnames[0]
+        scope = {self.param: Residual(ast.Name(self.param, ast.Load()), self.logic_variables)}
+        for name, cell in zip(code.co_freevars, func.__closure__ or ()):
+            value = cell.cell_contents
+            if isinstance(value, PRIMITIVE_TYPES) or isinstance(value, Enum):
+                scope[name] = Known(value)
+            elif isinstance(value, types.LambdaType) and value.__name__ == "<lambda>":
+                # Rules wrapping another rule, such as enemy drops, get the wrapped rule compiled as well
+                inner = RuleCompiler(self.logic_variables, self.settings, self.record).Compile(value)
+                scope[name] = Residual(self.Embed(inner), inner)
+            else:
+                scope[name] = Residual(self.Embed(value), value)
+        result = self.Evaluate(node.body, scope, func.__globals__, True, True, 0)
+        if isinstance(result, Known):
+            body = ast.Constant(bool(result.value))
+        else:
+            body = result.node
+        body_source = ast.unparse(body)
+        if not self.consts and body_source == ast.unparse(node.body):
+            return func
+        params = ", ".join(self.const_names[id(x)] for x in self.consts)
+        source = f"def _compiled_rule({params}):\n    return lambda {self.param}: {body_source}\n"
+        factory = types.FunctionType(BuildFactory(source, code.co_filename), func.__globals__)
+        rule = factory(*self.consts)
+        self.record.trees[rule] = body
+        return rule
+
+    def Embed(self, value: Any) -> ast.expr:
+        """Get an expression referring to a value fixed at compile time."""
+        if type(value) in PRIMITIVE_TYPES or (type(value) is tuple and all(type(x) in PRIMITIVE_TYPES for x in value)):
+            return ast.Constant(value)
+        key = id(value)
+        if key not in self.const_names:
+            self.const_names[key] = f"_k{len(self.consts)}"
+            self.consts.append(value)
+        return ast.Name(self.const_names[key], ast.Load())
+
+    def Node(self, value) -> ast.expr:
+        """Get the expression for an evaluated value."""
+        if isinstance(value, Known):
+            return self.Embed(value.value)
+        return value.node
+
+    def LookupName(self, name: str, scope: dict, global_vars: dict, in_lambda: bool):
+        """Resolve a name in the scope of a rule or helper method."""
+        if name in scope:
+            return scope[name]
+        if name in global_vars:
+            value = global_vars[name]
+        elif hasattr(builtins, name):
+            value = getattr(builtins, name)
+        else:
+            raise UnsupportedLogic(f"Unknown name {name}")
+        if in_lambda:
+            return Residual(ast.Name(name, ast.Load()), value)
+        return Residual(self.Embed(value), value)
+
+    def GetAttribute(self, base, attr: str, node: ast.Attribute):
+        """Fold an attribute lookup where possible."""
+        if isinstance(base, Residual):
+            obj = base.obj
+            if obj is self.logic_variables:
+                if attr in GLITCH_FLAGS:
+                    value = getattr(obj, attr)
+                    self.record.glitch_snapshot[attr] = value
+                    return Known(value)
+                if attr == "settings":
+                    return Residual(ast.Attribute(base.node, attr, ast.Load()), self.settings)
+            elif obj is self.settings and obj is not None:
+                if attr not in self.record.volatile and hasattr(obj, attr):
+                    value = getattr(obj, attr)
+                    if IsStaticValue(value):
+                        self.record.settings_snapshot[attr] = deepcopy(value)
+                        return Known(value)
+            elif isinstance(obj, type) and issubclass(obj, Enum) and attr in obj.__members__:
+                return Known(obj.__members__[attr])
+            elif isinstance(obj, types.ModuleType) and hasattr(obj, attr):
+                return Residual(ast.Attribute(base.node, attr, ast.Load()), getattr(obj, attr))
+            return Residual(ast.Attribute(base.node, attr, ast.Load()))
+        if isinstance(base.value, Enum) and attr in ("name", "value"):
+            return Known(getattr(base.value, attr))
+        return Residual(ast.Attribute(self.Embed(base.value), attr, ast.Load()))
+
+    def Evaluate(self, node: ast.expr, scope: dict, global_vars: dict, truth: bool, in_lambda: bool, depth: int):
+        """Evaluate an expression as far as the settings allow.
+
+        Keyword arguments:
+        truth -- True if only the truthiness of the result matters, allowing more aggressive simplification.
+        in_lambda -- True when evaluating the rule itself rather than an inlined helper method.
+        """
+        if isinstance(node, ast.Constant):
+            return Known(node.value)
+        if isinstance(node, ast.Name):
+            return self.LookupName(node.id, scope, global_vars, in_lambda)
+        if isinstance(node, ast.Attribute):
+            base = self.Evaluate(node.value, scope, global_vars, False, in_lambda, depth)
+            return self.GetAttribute(base, node.attr, node)
+        if isinstance(node, ast.BoolOp):
+            return self.EvaluateBoolOp(node, scope, global_vars, truth, in_lambda, depth)
+        if isinstance(node, ast.UnaryOp):
+            operand = self.Evaluate(node.operand, scope, global_vars, isinstance(node.op, ast.Not), in_lambda, depth)
+            if isinstance(operand, Known):
+                return self.Apply(lambda: self.UnaryOperation(node.op, operand.value), ast.UnaryOp(node.op, self.Node(operand)))
+            return Residual(ast.UnaryOp(node.op, operand.node))
+        if isinstance(node, ast.BinOp):
+            left = self.Evaluate(node.left, scope, global_vars, False, in_lambda, depth)
+            right = self.Evaluate(node.right, scope, global_vars, False, in_lambda, depth)
+            residual = ast.BinOp(self.Node(left), node.op, self.Node(right))
+            if isinstance(left, Known) and isinstance(right, Known):
+                return self.Apply(lambda: self.BinaryOperation(node.op, left.value, right.value), residual)
+            return Residual(residual)
+        if isinstance(node, ast.Compare):
+            operands = [self.Evaluate(x, scope, global_vars, False, in_lambda, depth) for x in [node.left] + node.comparators]
+            residual = ast.Compare(self.Node(operands[0]), node.ops, [self.Node(x) for x in operands[1:]])
+            if all(isinstance(x, Known) for x in operands):
+                return self.Apply(lambda: self.Comparison(node.ops, [x.value for x in operands]), residual)
+            return Residual(residual)
+        if isinstance(node, ast.IfExp):
+            test = self.Evaluate(node.test, scope, global_vars, True, in_lambda, depth)
+            if isinstance(test, Known):
+                return self.Evaluate(node.body if test.value else node.orelse, scope, global_vars, truth, in_lambda, depth)
+            body = self.Evaluate(node.body, scope, global_vars, truth, in_lambda, depth)
+            orelse = self.Evaluate(node.orelse, scope, global_vars, truth, in_lambda, depth)
+            return Residual(ast.IfExp(test.node, self.Node(body), self.Node(orelse)))
+        if isinstance(node, ast.Subscript):
+            base = self.Evaluate(node.value, scope, global_vars, False, in_lambda, depth)
+            index = self.Evaluate(node.slice, scope, global_vars, False, in_lambda, depth)
+            residual = ast.Subscript(self.Node(base), self.Node(index), ast.Load())
+            if isinstance(base, Known) and isinstance(index, Known):
+                return self.Apply(lambda: base.value[index.value], residual)
+            return Residual(residual)
+        if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+            items = [self.Evaluate(x, scope, global_vars, False, in_lambda, depth) for x in node.elts]
+            if all(isinstance(x, Known) for x in items) and not any(isinstance(x, ast.Starred) for x in node.elts):
+                container = {ast.Tuple: tuple, ast.List: list, ast.Set: set}[type(node)]
+                return Known(container(x.value for x in items))
+            if isinstance(node, ast.Set):
+                return Residual(ast.Set([self.Node(x) for x in items]))
+            return Residual(type(node)([self.Node(x) for x in items], ast.Load()))
+        if isinstance(node, ast.Call):
+            return self.EvaluateCall(node, scope, global_vars, truth, in_lambda, depth)
+        raise UnsupportedLogic(f"Unsupported expression {type(node).__name__}")
+
+    def Apply(self, operation: Callable, residual: ast.expr):
+        """Run an operation on known values, leaving it to run while searching if it fails or gives an unfoldable result."""
+        try:
+            value = operation()
+        except Exception:
+            return Residual(residual)
+        if IsStaticValue(value):
+            return Known(value)
+        return Residual(residual)
+
+    @staticmethod
+    def UnaryOperation(op: ast.unaryop, value: Any) -> Any:
+        """Apply a unary operator."""
+        if isinstance(op, ast.Not):
+            return not value
+        if isinstance(op, ast.USub):
+            return -value
+        if isinstance(op, ast.UAdd):
+            return +value
+        return ~value
+
+    @staticmethod
+    def BinaryOperation(op: ast.operator, left: Any, right: Any) -> Any:
+        """Apply a binary operator."""
+        operations = {
+            ast.Add: lambda a, b: a + b,
+            ast.Sub: lambda a, b: a - b,
+            ast.Mult: lambda a, b: a * b,
+            ast.Div: lambda a, b: a / b,
+            ast.FloorDiv: lambda a, b: a // b,
+            ast.Mod: lambda a, b: a % b,
+            ast.BitAnd: lambda a, b: a & b,
+            ast.BitOr: lambda a, b: a | b,
+        }
+        if type(op) not in operations:
+            raise UnsupportedLogic(f"Unsupported operator {type(op).__name__}")
+        return operations[type(op)](left, right)
+
+    @staticmethod
+    def Comparison(ops: List[ast.cmpop], values: List[Any]) -> bool:
+        """Apply a chain of comparisons."""
+        operations = {
+            ast.Eq: lambda a, b: a == b,
+            ast.NotEq: lambda a, b: a != b,
+            ast.Lt: lambda a, b: a < b,
+            ast.LtE: lambda a, b: a <= b,
+            ast.Gt: lambda a, b: a > b,
+            ast.GtE: lambda a, b: a >= b,
+            ast.Is: lambda a, b: a is b,
+            ast.IsNot: lambda a, b: a is not b,
+            ast.In: lambda a, b: a in b,
+            ast.NotIn: lambda a, b: a not in b,
+        }
+        for index, op in enumerate(ops):
+            if not operations[type(op)](values[index], values[index + 1]):
+                return False
+        return True
+
+    def EvaluateBoolOp(self, node: ast.BoolOp, scope: dict, global_vars: dict, truth: bool, in_lambda: bool, depth: int):
+        """Fold an and/or chain, dropping operands which can't change the result."""
+        is_and = isinstance(node.op, ast.And)
+        remaining = []
+        for index, child in enumerate(node.values):
+            last = index == len(node.values) - 1
+            item = self.Evaluate(child, scope, global_vars, truth, in_lambda, depth)
+            if isinstance(item, Residual):
+                remaining.append(item)
+                continue
+            if bool(item.value) != is_and:
+                # This operand decides the result: False for and, True for or
+                if not remaining:
+                    return item
+                if truth:
+                    return Known(not is_and)
+                remaining.append(item)
+                break
+            # This operand only passes evaluation on to the next one
+            if last and not truth:
+                if not remaining:
+                    return item
+                remaining.append(item)
+        if not remaining:
+            return Known(is_and)
+        if len(remaining) == 1:
+            return remaining[0]
+        return Residual(ast.BoolOp(node.op, [self.Node(x) for x in remaining]))
+
+    def EvaluateCall(self, node: ast.Call, scope: dict, global_vars: dict, truth: bool, in_lambda: bool, depth: int):
+        """Fold calls to pure functions and inline helper methods of LogicVarHolder."""
+        if any(isinstance(x, ast.Starred) for x in node.args) or any(x.arg is None for x in node.keywords):
+            raise UnsupportedLogic("Unsupported call")
+        args = [self.Evaluate(x, scope, global_vars, False, in_lambda, depth) for x in node.args]
+        kwargs = {x.arg: self.Evaluate(x.value, scope, global_vars, False, in_lambda, depth) for x in node.keywords}
+        all_known = all(isinstance(x, Known) for x in args) and all(isinstance(x, Known) for x in kwargs.values())
+        if isinstance(node.func, ast.Attribute):
+            base = self.Evaluate(node.func.value, scope, global_vars, False, in_lambda, depth)
+            if isinstance(base, Residual) and base.obj is self.logic_variables:
+                method = getattr(type(base.obj), node.func.attr, None)
+                if method is not None:
+                    method = inspect.unwrap(method)
+                if isinstance(method, types.FunctionType) and depth < MAX_INLINE_DEPTH:
+                    result = self.Inline(method, base, args, kwargs, truth, depth + 1)
+                    if result is not None and (isinstance(result, Known) or all_known):
+                        return result
+            func = self.GetAttribute(base, node.func.attr, node.func)
+        else:
+            func = self.Evaluate(node.func, scope, global_vars, False, in_lambda, depth)
+        residual = ast.Call(self.Node(func), [self.Node(x) for x in args], [ast.keyword(k, self.Node(v)) for k, v in kwargs.items()])
+        func_obj = func.obj if isinstance(func, Residual) else func.value
+        if all_known and any(func_obj is x for x in PURE_FUNCTIONS):
+            return self.Apply(lambda: func_obj(*[x.value for x in args], **{k: v.value for k, v in kwargs.items()}), residual)
+        return Residual(residual)
+
+    def Inline(self, method: types.FunctionType, owner: Residual, args: list, kwargs: dict, truth: bool, depth: int):
+        """Evaluate a helper method with known arguments, returning None if its body can't be handled."""
+        try:
+            tree = GetFunctionTree(method)
+        except (OSError, TypeError, SyntaxError, UnsupportedLogic):
+            return None
+        params = [x.arg for x in tree.args.args]
+        if len(args) + 1 > len(params) or any(k not in params[1:] for k in kwargs):
+            return None
+        scope = {params[0]: owner}
+        for name, value in zip(params[1:], args):
+            scope[name] = value
+        scope.update(kwargs)
+        defaults = method.__defaults__ or ()
+        for name, value in zip(params[len(params) - len(defaults) :], defaults):
+            if name not in scope:
+                scope[name] = Known(value) if IsStaticValue(value) else Residual(self.Embed(value), value)
+        if any(name not in scope for name in params):
+            return None
+        try:
+            done, result = self.Execute(tree.body, scope, method.__globals__, truth, depth)
+        except UnsupportedLogic:
+            return None
+        return result if done else Known(None)
+
+    def Execute(self, statements: List[ast.stmt], scope: dict, global_vars: dict, truth: bool, depth: int):
+        """Interpret the straight-line statements of a helper method."""
+        for index, statement in enumerate(statements):
+            if isinstance(statement, ast.Expr) and index == 0 and isinstance(statement.value, ast.Constant) and isinstance(statement.value.value, str):
+                continue
+            if isinstance(statement, ast.Pass):
+                continue
+            if isinstance(statement, ast.Assign) and len(statement.targets) == 1 and isinstance(statement.targets[0], ast.Name):
+                scope[statement.targets[0].id] = self.Evaluate(statement.value, scope, global_vars, False, False, depth)
+                continue
+            if isinstance(statement, ast.Return):
+                if statement.value is None:
+                    return True, Known(None)
+                return True, self.Evaluate(statement.value, scope, global_vars, truth, False, depth)
+            if isinstance(statement, ast.If):
+                test = self.Evaluate(statement.test, scope, global_vars, True, False, depth)
+                if not isinstance(test, Known):
+                    raise UnsupportedLogic("Branch depends on search state")
+                done, result = self.Execute(statement.body if test.value else statement.orelse, scope, global_vars, truth, depth)
+                if done:
+                    return True, result
+                continue
+            raise UnsupportedLogic(f"Unsupported statement {type(statement).__name__}")
+        return False, None
+
+
+def GetLogicHolders(spoiler: Spoiler) -> List[Any]:
+    """Get every object in the spoiler's regions that carries a logic rule."""
+    holders = []
+    for region in spoiler.RegionList.values():
+        holders.extend(region.locations)
+        holders.extend(region.events)
+        holders.extend(region.exits)
+        if region.deathwarp is not None:
+            holders.append(region.deathwarp)
+    for collectibles in spoiler.CollectibleRegions.values():
+        holders.extend(collectibles)
+    return holders
+
+
+def RestoreLogic(spoiler: Spoiler) -> None:
+    """Put back the original rules of a compiled spoiler."""
+    record = spoiler.compiled_logic
+    if record is None:
+        return
+    for holder, original in record.originals:
+        holder.logic = original
+    record.originals = []
+
+
+def CompileLogic(spoiler: Spoiler) -> None:
+    """Compile every logic rule of the spoiler against its current settings."""
+    previous = spoiler.compiled_logic
+    RestoreLogic(spoiler)
+    record = CompiledLogic()
+    if previous is not None:
+        record.volatile = previous.volatile
+    compiler = RuleCompiler(spoiler.LogicVariables, spoiler.settings, record)
+    compiled = {}
+    for holder in GetLogicHolders(spoiler):
+        original = holder.logic
+        if original not in compiled:
+            try:
+                compiled[original] = compiler.Compile(original)
+            except Exception:
+                compiled[original] = original
+        if compiled[original] is not original:
+            record.originals.append((holder, original))
+            holder.logic = compiled[original]
+    if spoiler.logic_profiler is not None:
+        spoiler.logic_profiler.Instrument(spoiler, record)
+    spoiler.compiled_logic = record
+
+
+def EnsureLogicCompiled(spoiler: Spoiler) -> None:
+    """Recompile the spoiler's rules if any setting folded into them has changed since they were compiled."""
+    record = spoiler.compiled_logic
+    if record is None:
+        return
+    settings = spoiler.settings
+    changed = {name for name, value in record.settings_snapshot.items() if getattr(settings, name, None) != value}
+    if changed or any(getattr(spoiler.LogicVariables, name) != value for name, value in record.glitch_snapshot.items()):
+        # Anything which changes mid-fill is no longer treated as constant for this spoiler
+        record.volatile |= changed
+        CompileLogic(spoiler)
+
+
+class DependencyScanner:
+    """Finds which logic variables and events a rule reads, so a search knows when the rule could give a different answer.
+
+    A rule or helper which reads anything else that can change during a search, such as region access or the spoiler itself,
+    is dynamic and has no dependency set.
+    """
+
+    def __init__(self, holder_type: type, record: CompiledLogic) -> None:
+        """Initialize with given parameters."""
+        self.holder_type = holder_type
+        self.record = record
+        self.rules: Dict[Callable, Optional[FrozenSet]] = {}
+        self.methods: Dict[str, Optional[FrozenSet]] = {}
+        self.method_reads: Dict[str, Optional[Tuple[Set, Set]]] = {}
+        self.functions: Dict[Tuple, Optional[FrozenSet]] = {}
+
+    def GetRuleDependencies(self, rule: Callable) -> Optional[FrozenSet]:
+        """Get the dependencies of a rule, or None if it is dynamic."""
+        if rule not in self.rules:
+            self.rules[rule] = self.ScanRule(inspect.unwrap(rule))
+        return self.rules[rule]
+
+    def ScanRule(self, rule: Callable) -> Optional[FrozenSet]:
+        """Find the dependencies of a rule from its body."""
+        if not isinstance(rule, types.FunctionType) or rule.__code__.co_argcount != 1:
+            return None
+        code = rule.__code__
+        body = self.record.trees.get(rule)
+        if body is None:
+            if code.co_name != "<lambda>":
+                return None
+            try:
+                body = FindLambda(code).body
+            except (UnsupportedLogic, OSError, SyntaxError):
+                return None
+        names = dict(rule.__globals__)
+        names.update((name, cell.cell_contents) for name, cell in zip(code.co_freevars, rule.__closure__ or ()))
+        reads = self.Scan(body, code.co_varnames[0], names)
+        if reads is None:
+            return None
+        deps, methods = reads
+        for method in methods:
+            method_deps = self.GetMethodDependencies(method)
+            if method_deps is None:
+                return None
+            deps |= method_deps
+        return frozenset(deps)
+
+    def GetMethodDependencies(self, name: str) -> Optional[FrozenSet]:
+        """Get the dependencies of a LogicVarHolder helper and every helper it calls, or None if any of them is dynamic."""
+        if name not in self.methods:
+            deps = set()
+            pending = [name]
+            seen = {name}
+            while pending:
+                reads = self.GetMethodReads(pending.pop())
+                if reads is None:
+                    deps = None
+                    break
+                deps |= reads[0]
+                for called in reads[1]:
+                    if called not in seen:
+                        seen.add(called)
+                        pending.append(called)
+            self.methods[name] = None if deps is None else frozenset(deps)
+        return self.methods[name]
+
+    def GetFunctionDependencies(self, func: Callable, index: int) -> Optional[FrozenSet]:
+        """Get the dependencies of a function which is handed the logic variables as the argument at index, or None if it is dynamic."""
+        instance = None
+        if isinstance(func, types.MethodType):
+            instance = func.__self__
+            func = func.__func__
+            index += 1
+        func = inspect.unwrap(func)
+        if not isinstance(func, types.FunctionType):
+            return None
+        if instance is None and index == 0 and (func in self.record.trees or func.__code__.co_name == "<lambda>"):
+            return self.GetRuleDependencies(func)
+        key = (func, id(instance), index)
+        if key not in self.functions:
+            # Anything recursive is treated as dynamic
+            self.functions[key] = None
+            self.functions[key] = self.ScanFunction(func, instance, index)
+        return self.functions[key]
+
+    def ScanFunction(self, func: types.FunctionType, instance: Any, index: int) -> Optional[FrozenSet]:
+        """Find the dependencies of a function from its source."""
+        try:
+            tree = GetFunctionTree(func)
+        except (UnsupportedLogic, OSError, TypeError, SyntaxError):
+            return None
+        params = [x.arg for x in tree.args.args]
+        if index >= len(params):
+            return None
+        names = dict(func.__globals__)
+        names.update((name, cell.cell_contents) for name, cell in zip(func.__code__.co_freevars, func.__closure__ or ()))
+        if instance is not None:
+            names[params[0]] = instance
+        reads = self.Scan(tree, params[index], names, True)
+        if reads is None:
+            return None
+        deps, methods = reads
+        for method in methods:
+            method_deps = self.GetMethodDependencies(method)
+            if method_deps is None:
+                return None
+            deps |= method_deps
+        return frozenset(deps)
+
+    def GetMethodReads(self, name: str) -> Optional[Tuple[Set, Set]]:
+        """Get what a single helper reads directly, along with the helpers it calls."""
+        if name not in self.method_reads:
+            method = self.GetMethod(name)
+            try:
+                tree = GetFunctionTree(method)
+            except (UnsupportedLogic, OSError, TypeError, SyntaxError):
+                self.method_reads[name] = None
+            else:
+                params = [x.arg for x in tree.args.args]
+                self.method_reads[name] = None if not params else self.Scan(tree, params[0], method.__globals__, True)
+        return self.method_reads[name]
+
+    def Scan(self, tree: ast.AST, param: str, names: dict, is_method: bool = False) -> Optional[Tuple[Set, Set]]:
+        """Find the attributes and events of param read in tree, and the helpers called on it."""
+        deps: Set = set()
+        methods: Set = set()
+        # Reads of the parameter already accounted for by an enclosing node
+        handled: Set[int] = set()
+        for node in ast.walk(tree):
+            if id(node) in handled:
+                continue
+            if is_method and isinstance(node, (ast.Assign, ast.AugAssign, ast.AnnAssign, ast.Delete)):
+                # Helpers which change the logic variables can't be skipped
+                targets = node.targets if isinstance(node, (ast.Assign, ast.Delete)) else [node.target]
+                if any(isinstance(x, ast.Name) and x.id == param for target in targets for x in ast.walk(target)):
+                    return None
+            if isinstance(node, ast.Compare) and len(node.ops) == 1 and isinstance(node.ops[0], (ast.In, ast.NotIn)) and self.IsParamAttribute(node.comparators[0], param, "Events"):
+                event = self.Resolve(node.left, names)
+                if isinstance(event, Enum):
+                    deps.add(event)
+                    handled.add(id(node.comparators[0]))
+                    handled.add(id(node.comparators[0].value))
+                continue
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+                owner = node.func.value
+                if isinstance(owner, ast.Name) and owner.id == param:
+                    if self.GetMethod(node.func.attr) is None:
+                        return None
+                    methods.add(node.func.attr)
+                    handled.add(id(node.func))
+                    handled.add(id(owner))
+                    continue
+                if isinstance(owner, ast.Attribute) and isinstance(owner.value, ast.Name) and owner.value.id == param and owner.attr != "settings":
+                    # Calling a method of a logic variable, which could change it
+                    return None
+            if isinstance(node, ast.Call):
+                passed = [i for i, arg in enumerate(node.args) if isinstance(arg, ast.Name) and arg.id == param]
+                if passed:
+                    # The logic variables are handed to another function, so follow it to see what it reads
+                    func = self.Resolve(node.func, names)
+                    if func is None or node.keywords or any(isinstance(arg, ast.Starred) for arg in node.args):
+                        return None
+                    for i in passed:
+                        func_deps = self.GetFunctionDependencies(func, i)
+                        if func_deps is None:
+                            return None
+                        deps |= func_deps
+                        handled.add(id(node.args[i]))
+            if isinstance(node, ast.Attribute) and node.attr == "LocationList" and self.IsParamAttribute(node.value, param, "spoiler"):
+                # Items are only placed between searches, so the location list never changes during one
+                handled.add(id(node.value))
+                handled.add(id(node.value.value))
+                continue
+            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == param:
+                handled.add(id(node.value))
+                attr = node.attr
+                if attr == "settings" or attr in KONG_ATTRIBUTES:
+                    continue
+                if attr == "spoiler" or self.GetMethod(attr) is not None:
+                    return None
+                deps.add(attr)
+                continue
+            if isinstance(node, ast.Name) and node.id == param:
+                # The logic variables are handed to something else which could read anything
+                return None
+        return deps, methods
+
+    def GetMethod(self, name: str) -> Optional[types.FunctionType]:
+        """Get a helper method of the logic variables, unwrapping any cache around it."""
+        method = getattr(self.holder_type, name, None)
+        if method is None:
+            return None
+        method = inspect.unwrap(method)
+        return method if isinstance(method, types.FunctionType) else None
+
+    @staticmethod
+    def IsParamAttribute(node: ast.expr, param: str, attr: str) -> bool:
+        """Check if a node reads the given attribute of param."""
+        return isinstance(node, ast.Attribute) and node.attr == attr and isinstance(node.value, ast.Name) and node.value.id == param
+
+    @staticmethod
+    def Resolve(node: ast.expr, names: dict) -> Any:
+        """Get the value of a constant name or attribute chain, or None if it isn't one."""
+        if isinstance(node, ast.Name):
+            return names.get(node.id)
+        if isinstance(node, ast.Attribute):
+            base = DependencyScanner.Resolve(node.value, names)
+            if base is not None:
+                return getattr(base, node.attr, None)
+        if isinstance(node, ast.Subscript):
+            base = DependencyScanner.Resolve(node.value, names)
+            index = node.slice.value if isinstance(node.slice, ast.Constant) else DependencyScanner.Resolve(node.slice, names)
+            if base is not None and index is not None:
+                try:
+                    return base[index]
+                except (KeyError, IndexError, TypeError):
+                    return None
+        return None
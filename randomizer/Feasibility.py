@@ -0,0 +1,38 @@
+"""Reject settings that can never generate a seed before any time is spent trying to."""
+
+import copy
+from typing import Optional
+
+from randomizer.Enums.Settings import WrinklyHints
+from randomizer.Fill import CheckForIncompatibleSettings, CheckPlandoConflicts, ValidateFixedHints
+from randomizer.Lists.Exceptions import PlandoIncompatibleException, SettingsIncompatibleException
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import cleanup_settings
+from randomizer.Spoiler import Spoiler
+
+
+def CheckSettingsFeasibility(settings_dict: dict) -> Settings:
+    """Resolve the settings and run every check generation would make before filling, raising the same exceptions it would.
+
+    This takes milliseconds, so settings that are doomed can be turned away before they are ever queued.
+    """
+    settings = Settings(cleanup_settings(copy.deepcopy(settings_dict)))
+    # The item pool check needs the valid locations a spoiler works out for the settings
+    Spoiler(settings)
+    CheckForIncompatibleSettings(settings)
+    if settings.wrinkly_hints == WrinklyHints.fixed_racing:
+        ValidateFixedHints(settings)
+    CheckPlandoConflicts(settings)
+    return settings
+
+
+def SettingsInfeasibility(settings_dict: dict) -> Optional[str]:
+    """Get why the settings can never generate a seed, or None if they can.
+
+    Only plain values come back, so this can run in another process and send its answer back.
+    """
+    try:
+        CheckSettingsFeasibility(settings_dict)
+    except (SettingsIncompatibleException, PlandoIncompatibleException) as e:
+        return f"{type(e).__name__}: {e}"
+    return None
@@ -3,21 +3,25 @@
 from __future__ import annotations
 
 from math import ceil
-from random import choice, randint, shuffle, uniform, sample
-from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple, Union
+from enum import Enum
+from random import choice, randint, seed, shuffle, uniform, sample
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Set, Tuple, Union
 from functools import lru_cache
+import pickle
 
 import js
 import randomizer.ItemPool as ItemPool
 import randomizer.Lists.Exceptions as Ex
 import randomizer.ShuffleExits as ShuffleExits
 from randomizer.CompileHints import compileHints, compileMicrohints, compileSpoilerHints, getDoorRestrictionsForItem
+from randomizer.CompileLogic import VOLATILE_SETTINGS, CompiledLogic, CompileLogic, DependencyScanner, EnsureLogicCompiled
 from randomizer.Enums.Events import Events
 from randomizer.Enums.Items import Items
 from randomizer.Enums.Kongs import GetKongs, Kongs
 from randomizer.Enums.Levels import Levels
 from randomizer.Enums.Locations import Locations
 from randomizer.Enums.MinigameType import MinigameType
+from randomizer.Enums.Plandomizer import PlandoItems
 from randomizer.Enums.Regions import Regions
 from randomizer.Enums.HintRegion import HintRegion
 from randomizer.Enums.SearchMode import SearchMode
@@ -55,11 +59,13 @@ from randomizer.Enums.Maps import Maps
 from randomizer.Lists.Item import ItemList
 from randomizer.Lists.Location import SharedMoveLocations, SharedShopLocations
 from randomizer.Lists.Minigame import BarrelMetaData, MinigameRequirements
+from randomizer.Lists.Plandomizer import PlannableItemLimits
 from randomizer.Lists.ShufflableExit import GetLevelShuffledToIndex
-from randomizer.LogicClasses import Sphere, TransitionFront
+from randomizer.LogicClasses import LogicSnapshot, PurchaseCheckpoints, RecordedSet, RegionGraph, SearchState, Sphere, TransitionFront
 from randomizer.Patching import ApplyRandomizer
 from randomizer.Patching.EnemyRando import randomize_enemies_0
 from randomizer.Patching.Library.Generic import IsItemSelected
+from randomizer.PlandoUtils import GetNameFromPlandoItem
 from randomizer.Prices import GetMaxForKong
 from randomizer.Settings import Settings
 from randomizer.ShuffleBarrels import BarrelShuffle
@@ -233,15 +239,150 @@ def should_skip_location(location, location_obj, spoiler, settings, region):
     return False
 
 
+def BuildRegionGraph(spoiler: Spoiler) -> RegionGraph:
+    """Build the region graph for the current state of the exit shuffle."""
+    settings = spoiler.settings
+    graph = RegionGraph(max(spoiler.RegionList) + 1)
+    for regionId, region in spoiler.RegionList.items():
+        region.id = regionId
+        graph.regions[regionId] = region
+        exits = graph.exits[regionId]
+        for exit in region.exits:
+            destination = exit.dest
+            shuffle_id = exit.exitShuffleId
+            if shuffle_id is not None and not exit.assumed:
+                shuffled_exit = ShuffleExits.ShufflableExits[shuffle_id]
+                if shuffled_exit.shuffled:
+                    destination = ShuffleExits.ShufflableExits[shuffled_exit.shuffledId].back.regionId
+                elif shuffled_exit.toBeShuffled:
+                    continue
+            exits.append((destination, exit))
+        if region.level == Levels.DKIsles or region.level == Levels.Shops:
+            continue
+        # If loading zones are shuffled, the "Exit Level" button in the pause menu could potentially take you somewhere new
+        if settings.shuffle_loading_zones == ShuffleLoadingZones.all:
+            levelExit = GetExitLevelExit(region.level, region.restart)
+            # When shuffling levels, unplaced level entrances will have no destination yet
+            if levelExit is not None:
+                dest = ShuffleExits.ShufflableExits[levelExit].back.regionId
+                exits.append((dest, TransitionFront(dest, lambda l: True)))
+                graph.levelExitTransitions[regionId] = GetLevelExitTransition(region.level)
+        # If loading zones are not shuffled but you have a random starting location, you may need to exit level to escape some regions
+        elif settings.random_starting_region and region.restart is None:
+            levelLobby = GetLobbyOfRegion(region.level)
+            if levelLobby is not None:
+                graph.lobbyExits[regionId] = (levelLobby, TransitionFront(levelLobby, lambda l: True))
+    return graph
+
+
+def IndexRuleDependencies(spoiler: Spoiler, graph: RegionGraph) -> None:
+    """Index what the rules of each region read, so a search only revisits regions where something they read has changed."""
+    scanner = DependencyScanner(type(spoiler.LogicVariables), spoiler.compiled_logic or CompiledLogic())
+    # Besides its own rule, a location also depends on everything should_skip_location checks
+    locationDependencies = [
+        scanner.GetMethodDependencies("HintAccess"),
+        scanner.GetMethodDependencies("BlueprintAccess"),
+        {"shockwave", Events.HelmFinished},
+    ]
+    # Balloons are only added once the kong has their gun
+    collectibleDependencies = scanner.GetMethodDependencies("HasGun")
+    dependents = {}
+    for regionId, region in enumerate(graph.regions):
+        if region is None:
+            continue
+        # Exits may check melons for lava water
+        deps = {"Melons"}
+        rules = [event.logic for event in region.events]
+        rules.extend(exit.logic for _, exit in graph.exits[regionId])
+        if graph.lobbyExits[regionId] is not None:
+            rules.append(graph.lobbyExits[regionId][1].logic)
+        if region.deathwarp is not None:
+            rules.append(region.deathwarp.logic)
+        extraDependencies = []
+        for location in region.locations:
+            rules.append(location.logic)
+            if location.bonusBarrel:
+                rules.append(MinigameRequirements[BarrelMetaData[location.id].minigame].logic)
+        if region.locations:
+            extraDependencies.extend(locationDependencies)
+        if spoiler.CollectibleRegions.get(regionId):
+            rules.extend(collectible.logic for collectible in spoiler.CollectibleRegions[regionId])
+            extraDependencies.append(collectibleDependencies)
+        extraDependencies.extend(scanner.GetRuleDependencies(rule) for rule in rules)
+        if any(x is None for x in extraDependencies):
+            graph.dependencies[regionId] = None
+            continue
+        for x in extraDependencies:
+            deps |= x
+        graph.dependencies[regionId] = frozenset(deps)
+        for key in deps:
+            dependents.setdefault(key, []).append(regionId)
+    graph.dependents = dependents
+    graph.watchedAttributes = [key for key in dependents if isinstance(key, str)]
+    graph.compiledLogic = spoiler.compiled_logic
+
+
+def PrepareRegionGraph(spoiler: Spoiler) -> bool:
+    """Make sure the region graph and its rule dependencies are built for the current world, returning True if either had to be rebuilt."""
+    rebuilt = False
+    if spoiler.region_graph is None:
+        spoiler.region_graph = BuildRegionGraph(spoiler)
+        rebuilt = True
+    if spoiler.region_graph.compiledLogic is not spoiler.compiled_logic or rebuilt:
+        IndexRuleDependencies(spoiler, spoiler.region_graph)
+    return rebuilt
+
+
+# Logic variables changed by adding a collectible or spending coins in the middle of a search
+COLLECTIBLE_ATTRIBUTES = ("Coins", "RegularCoins", "ColoredBananas")
+COIN_ATTRIBUTES = ("Coins", "SpentCoins")
+
+# Searches which only leave their result and the logic state behind, so a repeat of one can be answered from the cache
+CACHEABLE_SEARCH_MODES = {
+    SearchMode.GetReachable,
+    SearchMode.GetReachableForFilling,
+    SearchMode.GetReachableWithControlledPurchases,
+    SearchMode.GetUnreachable,
+    SearchMode.CheckBeatable,
+    SearchMode.CheckAllReachable,
+    SearchMode.CheckSpecificItemReachable,
+}
+
+
+def GetReachabilityKey(spoiler: Spoiler, startingOwnedItems: List[Union[Any, Items]], searchType: SearchMode, purchaseList: List[Locations], targetItemId) -> Tuple:
+    """Identify a search by everything its result depends on that may change between searches of the same world."""
+    settings = spoiler.settings
+    volatile = VOLATILE_SETTINGS if spoiler.compiled_logic is None else VOLATILE_SETTINGS | spoiler.compiled_logic.volatile
+    return (
+        searchType,
+        tuple(sorted(startingOwnedItems)),
+        tuple(purchaseList),
+        targetItemId,
+        tuple((name, value) for name, value in vars(spoiler.LogicVariables).items() if name.startswith("assume")),
+        tuple([(location.item, location.inaccessible) for location in spoiler.LocationList.values()]),
+        # Collectibles are keyed by identity, a reshuffled layout is a different world even with the same number of collectibles
+        tuple([(collectible, collectible.enabled) for region in spoiler.CollectibleRegions.values() for collectible in region]),
+        repr([getattr(settings, name, None) for name in sorted(volatile)]),
+    )
+
+
 def GetAccessibleLocations(
     spoiler: Spoiler,
     startingOwnedItems: List[Union[Any, Items]],
     searchType: SearchMode,
     purchaseList: Optional[List[Locations]] = None,
     targetItemId: None = None,
+    searchState: Optional[SearchState] = None,
+    checkpoints: Optional[PurchaseCheckpoints] = None,
 ) -> Union[List[Sphere], List[Locations], bool, Set[Union[Locations, int]]]:
-    """Search to find all reachable locations given owned items."""
+    """Search to find all reachable locations given owned items.
+
+    If a searchState is given, the search resumes from its checkpoint when possible and leaves a new checkpoint in it.
+    If checkpoints are given, the search resumes from the round they were branched at and records a snapshot of every round in them.
+    Otherwise a search starting from a freshly reset spoiler is answered from the spoiler's cache if it has already been done.
+    """
     settings = spoiler.settings
+    spoiler.metrics.CountSearch(searchType)
     # No logic? Calls to this method that are checking things just return True
     if settings.logic_type == LogicType.nologic and searchType in [
         SearchMode.CheckAllReachable,
@@ -249,10 +390,43 @@ def GetAccessibleLocations(
         SearchMode.CheckSpecificItemReachable,
     ]:
         return True
+    # Recompiled rules or a rebuilt region graph mean the world has changed under every cached search
+    compiledLogic = spoiler.compiled_logic
+    EnsureLogicCompiled(spoiler)
+    if PrepareRegionGraph(spoiler) or spoiler.compiled_logic is not compiledLogic:
+        spoiler.reachability_cache.Clear()
     if purchaseList is None:
         purchaseList = []
-    accessible = set()
-    newLocations = set()
+    cacheKey = None
+    if searchState is None and checkpoints is None and searchType in CACHEABLE_SEARCH_MODES and spoiler.fresh_search_state:
+        cacheKey = GetReachabilityKey(spoiler, startingOwnedItems, searchType, purchaseList, targetItemId)
+        found, result = spoiler.reachability_cache.Get(spoiler, cacheKey)
+        if found:
+            spoiler.fresh_search_state = False
+            spoiler.metrics.cached_searches += 1
+            return result
+    spoiler.fresh_search_state = False
+    result = SearchAccessibleLocations(spoiler, startingOwnedItems, searchType, purchaseList, targetItemId, searchState, checkpoints)
+    if cacheKey is not None:
+        spoiler.reachability_cache.Store(spoiler, cacheKey, result)
+    return result
+
+
+def SearchAccessibleLocations(
+    spoiler: Spoiler,
+    startingOwnedItems: List[Union[Any, Items]],
+    searchType: SearchMode,
+    purchaseList: List[Locations],
+    targetItemId: None,
+    searchState: Optional[SearchState],
+    checkpoints: Optional[PurchaseCheckpoints] = None,
+) -> Union[List[Sphere], List[Locations], bool, Set[Union[Locations, int]]]:
+    """Run a search for all reachable locations given owned items."""
+    settings = spoiler.settings
+    # A search which can be resumed from one of its rounds has to visit everything in the same order once resumed
+    newSet = set if checkpoints is None else RecordedSet
+    accessible = newSet()
+    newLocations = newSet()
     ownedItems = startingOwnedItems[:]
     newItems = []  # debug code utility
     if searchType == SearchMode.GeneratePlaythrough:
@@ -260,11 +434,11 @@ def GetAccessibleLocations(
     playthroughLocations = []
     unpurchasedEmptyShopLocationIds = []
     kongAccessibleRegions = [
-        {Regions.GameStart},
-        {Regions.GameStart},
-        {Regions.GameStart},
-        {Regions.GameStart},
-        {Regions.GameStart},
+        newSet([Regions.GameStart]),
+        newSet([Regions.GameStart]),
+        newSet([Regions.GameStart]),
+        newSet([Regions.GameStart]),
+        newSet([Regions.GameStart]),
     ]
     eventAdded = True
     UnderwaterRegions = {
@@ -282,8 +456,50 @@ def GetAccessibleLocations(
         Regions.TriangleShip,
     }
     SurfaceWaterRegions = {Regions.Shipyard}
+    # These only depend on settings, so they're decided once for the whole search
+    waterIsLava = spoiler.LogicVariables.IsLavaWater() and (settings.shuffle_loading_zones == ShuffleLoadingZones.all or settings.random_starting_region)
+    duskTime = settings.fungi_time == FungiTimeSetting.dusk
+    graph = spoiler.region_graph
+    regions = graph.regions
+    logicVariables = spoiler.LogicVariables
+    # Semi-naive evaluation: once a kong has visited a region, it's only visited again after something its rules read has changed.
+    # Each kong keeps the time of day access it last visited each region with, and changed logic variables and events
+    # drop the regions reading them from every kong's record.
+    dependencies = graph.dependencies
+    dependents = graph.dependents
+    visitedRegions = [{} for _ in range(5)]
+    changedDependencies = set()
+    watchedAttributes = graph.watchedAttributes
+    watchedValues = [LogicSnapshot.CopyValue(getattr(logicVariables, attr, None)) for attr in watchedAttributes]
+    resumed = False
+    if searchState is not None:
+        newlyFilled = searchState.GetNewlyFilledLocations(spoiler, startingOwnedItems, searchType, purchaseList)
+        if newlyFilled is not None:
+            # Pick up where the last search left off, collecting the items placed in already reached locations
+            resumed = True
+            ownedItems, accessible, kongAccessibleRegions, unpurchasedEmptyShopLocationIds = searchState.Restore(spoiler)
+            for locationId in newlyFilled:
+                accessible.remove(locationId)
+                newLocations.add(locationId)
+                location = spoiler.LocationList[locationId]
+                if location.logically_relevant:
+                    # Recorded again once the location is collected below
+                    spoiler.LogicVariables.SpecialLocationsReached.remove(locationId)
+                if location.type == Types.Shop and locationId in unpurchasedEmptyShopLocationIds and location.item != Items.NoItem:
+                    unpurchasedEmptyShopLocationIds.remove(locationId)
+                    if searchType != SearchMode.GetReachableWithControlledPurchases or locationId in purchaseList:
+                        spoiler.LogicVariables.PurchaseShopItem(locationId)
+            watchedValues = [LogicSnapshot.CopyValue(getattr(logicVariables, attr, None)) for attr in watchedAttributes]
+    if checkpoints is not None and checkpoints.resumeRound is not None:
+        # Pick up from the round where the search first differs from the one the checkpoints were branched from
+        ownedItems, accessible, newLocations, eventAdded, kongAccessibleRegions, unpurchasedEmptyShopLocationIds, visitedRegions, changedDependencies, watchedValues = checkpoints.Restore(spoiler)
     # Continue doing searches until nothing new is found
     while len(newLocations) > 0 or eventAdded:
+        if checkpoints is not None:
+            checkpoints.Save(
+                spoiler,
+                (ownedItems, accessible, newLocations, eventAdded, kongAccessibleRegions, unpurchasedEmptyShopLocationIds, visitedRegions, changedDependencies, watchedValues),
+            )
         # Add items and events from the last search iteration
         sphere = Sphere()
         if playthroughLocations:
@@ -293,6 +509,7 @@ def GetAccessibleLocations(
             location = spoiler.LocationList[locationId]
             if location.logically_relevant:
                 spoiler.LogicVariables.SpecialLocationsReached.append(locationId)
+                changedDependencies.add("SpecialLocationsReached")
             # If this location has an item placed, add it to owned items
             if location.item is not None:
                 # In search mode GetReachableWithControlledPurchases, only allowed to purchase items as prescribed by purchaseOrder
@@ -318,10 +535,13 @@ def GetAccessibleLocations(
                     return True
         eventAdded = False
         # Reset new lists
-        newLocations = set()
+        newLocations = newSet()
         # Update based on new items
         spoiler.LogicVariables.Update(ownedItems)
         newItems = []
+        values = [LogicSnapshot.CopyValue(getattr(logicVariables, attr, None)) for attr in watchedAttributes]
+        changedDependencies.update(attr for attr, old, new in zip(watchedAttributes, watchedValues, values) if old != new)
+        watchedValues = values
         if len(sphere.locations) > 0:
             if searchType == SearchMode.GeneratePlaythrough:
                 sphere.seedBeaten = spoiler.LogicVariables.bananaHoard
@@ -335,8 +555,7 @@ def GetAccessibleLocations(
         for kong in set(spoiler.LogicVariables.GetKongs()):
             spoiler.LogicVariables.SetKong(kong)
 
-            startRegion = spoiler.RegionList[Regions.GameStart]
-            startRegion.id = Regions.GameStart
+            startRegion = regions[Regions.GameStart]
             startRegion.dayAccess = [Events.Day in spoiler.LogicVariables.Events] * 5
             startRegion.nightAccess = [Events.Night in spoiler.LogicVariables.Events] * 5
             regionPool = list(kongAccessibleRegions[kong])
@@ -344,7 +563,19 @@ def GetAccessibleLocations(
             # Loop for each region until no more accessible regions found
             while len(regionPool) > 0:
                 regionId = regionPool.pop()
-                region = spoiler.RegionList[regionId]
+                region = regions[regionId]
+                if changedDependencies:
+                    for key in changedDependencies:
+                        for dependentId in dependents.get(key, ()):
+                            for visited in visitedRegions:
+                                visited.pop(dependentId, None)
+                    changedDependencies.clear()
+                access = (region.dayAccess[kong], region.nightAccess[kong])
+                if visitedRegions[kong].get(regionId) == access:
+                    # Nothing this region's rules read has changed, so visiting it again would find nothing new
+                    continue
+                if dependencies[regionId] is not None:
+                    visitedRegions[kong][regionId] = access
                 # If this region has a tag barrel, everyone can access this region now
                 if region.tagbarrel:
                     if region.dayAccess[kong]:
@@ -359,6 +590,8 @@ def GetAccessibleLocations(
                         # Add the event if it's not already in the list and its logic is satisfied
                         eventAdded = True
                         spoiler.LogicVariables.Events.append(event.name)
+                        changedDependencies.add(event.name)
+                        changedDependencies.add("Events")
 
                     # Update region access based on specific events
                     if event.name == Events.Night:
@@ -368,10 +601,11 @@ def GetAccessibleLocations(
                         if event.logic(spoiler.LogicVariables):
                             region.dayAccess[kong] = True
                 # Check accessibility for collectibles
-                if region.id in spoiler.CollectibleRegions.keys():
-                    for collectible in spoiler.CollectibleRegions[region.id]:
+                if regionId in spoiler.CollectibleRegions:
+                    for collectible in spoiler.CollectibleRegions[regionId]:
                         if not collectible.added and collectible.kong in (kong, Kongs.any) and collectible.enabled and collectible.logic(spoiler.LogicVariables):
                             spoiler.LogicVariables.AddCollectible(collectible, region.level)
+                            changedDependencies.update(COLLECTIBLE_ATTRIBUTES)
                 # Check accessibility for each location in this region
 
                 for location in region.locations:
@@ -391,55 +625,39 @@ def GetAccessibleLocations(
 
                         if not shop_is_empty and location_can_be_bought:
                             spoiler.LogicVariables.PurchaseShopItem(location.id)
+                            changedDependencies.update(COIN_ATTRIBUTES)
                         elif shop_is_empty:
                             unpurchasedEmptyShopLocationIds.append(location.id)
                     elif location.id == Locations.NintendoCoin:
                         # Spend Two Coins for arcade lever
                         spoiler.LogicVariables.Coins[Kongs.donkey] -= 2
                         spoiler.LogicVariables.SpentCoins[Kongs.donkey] += 2
+                        changedDependencies.update(COIN_ATTRIBUTES)
 
                     newLocations.add(location.id)
-
-                # Check accessibility for each exit in this region
-                exits = region.exits[:]
-                # If loading zones are shuffled, the "Exit Level" button in the pause menu could potentially take you somewhere new
-                if settings.shuffle_loading_zones == ShuffleLoadingZones.all and region.level != Levels.DKIsles and region.level != Levels.Shops:
-                    levelExit = GetExitLevelExit(region.level, region.restart)
-                    # When shuffling levels, unplaced level entrances will have no destination yet
-                    if levelExit is not None:
-                        dest = ShuffleExits.ShufflableExits[levelExit].back.regionId
-                        exits.append(TransitionFront(dest, lambda l: True))
-                        # If we're generating the final playthrough, note down the order in which we access entrances for LZR purposes
-                        # No need to check access on this transition, it's always accessible
-                        if searchType == SearchMode.GeneratePlaythrough:
-                            levelExitTransitionId = GetLevelExitTransition(region.level)
-                            if levelExitTransitionId not in spoiler.playthroughTransitionOrder:
-                                spoiler.playthroughTransitionOrder.append(levelExitTransitionId)
+                    if checkpoints is not None and location.id not in checkpoints.firstReached:
+                        checkpoints.firstReached[location.id] = len(checkpoints.rounds) - 1
+
+                # Check accessibility for each exit in this region, with shuffled destinations already resolved by the region graph
+                exits = graph.exits[regionId]
+                # If we're generating the final playthrough, note down the order in which we access entrances for LZR purposes
+                levelExitTransitionId = graph.levelExitTransitions[regionId]
+                if levelExitTransitionId is not None and searchType == SearchMode.GeneratePlaythrough:
+                    if levelExitTransitionId not in spoiler.playthroughTransitionOrder:
+                        spoiler.playthroughTransitionOrder.append(levelExitTransitionId)
                 # If loading zones are not shuffled but you have a random starting location, you may need to exit level to escape some regions
-                elif settings.random_starting_region and region.level != Levels.DKIsles and region.level != Levels.Shops and region.restart is None:
-                    levelLobby = GetLobbyOfRegion(region.level)
-                    if levelLobby is not None and levelLobby not in kongAccessibleRegions[kong]:
-                        exits.append(TransitionFront(levelLobby, lambda l: True))
-                for exit in exits:
-                    destination = exit.dest
+                lobbyExit = graph.lobbyExits[regionId]
+                if lobbyExit is not None and lobbyExit[0] not in kongAccessibleRegions[kong]:
+                    exits = exits + [lobbyExit]
+                for destination, exit in exits:
                     shuffle_id = exit.exitShuffleId
-                    is_shuffled = shuffle_id is not None and not exit.assumed
-
-                    # Handle shuffled exits
-                    if is_shuffled:
-                        shuffled_exit = ShuffleExits.ShufflableExits[shuffle_id]
-                        if shuffled_exit.shuffled:
-                            destination = ShuffleExits.ShufflableExits[shuffled_exit.shuffledId].back.regionId
-                        elif shuffled_exit.toBeShuffled:
-                            continue
 
                     # Check if the transition is accessible
                     if not exit.logic(spoiler.LogicVariables):
                         continue
 
                     # Handle water/lava restrictions
-                    is_lava_water = spoiler.LogicVariables.IsLavaWater()
-                    if is_lava_water and (settings.shuffle_loading_zones == ShuffleLoadingZones.all or settings.random_starting_region):
+                    if waterIsLava:
                         if destination in UnderwaterRegions and spoiler.LogicVariables.Melons < 3:
                             continue
                         if destination in SurfaceWaterRegions and spoiler.LogicVariables.Melons < 2:
@@ -463,12 +681,10 @@ def GetAccessibleLocations(
                     # Add new regions to the queue
                     if destination not in kongAccessibleRegions[kong]:
                         kongAccessibleRegions[kong].add(destination)
-                        new_region = spoiler.RegionList[destination]
-                        new_region.id = destination
                         regionPool.append(destination)
 
                     # Update day/night access
-                    region_list_dest = spoiler.RegionList[destination]
+                    region_list_dest = regions[destination]
                     if region.dayAccess[kong] and exit.time != Time.Night and not region_list_dest.dayAccess[kong]:
                         region_list_dest.dayAccess[kong] = True
                         eventAdded = True
@@ -477,7 +693,7 @@ def GetAccessibleLocations(
                         eventAdded = True
 
                     # Handle dusk time setting
-                    if settings.fungi_time == FungiTimeSetting.dusk:
+                    if duskTime:
                         region_list_dest.dayAccess[kong] = True
                         region_list_dest.nightAccess[kong] = True
 
@@ -487,20 +703,20 @@ def GetAccessibleLocations(
                     # If a region is accessible through this exit and has not yet been added, add it to the queue to be visited eventually
                     if destination not in kongAccessibleRegions[kong] and region.deathwarp.logic(spoiler.LogicVariables):
                         kongAccessibleRegions[kong].add(destination)
-                        newRegion = spoiler.RegionList[destination]
-                        newRegion.id = destination
                         regionPool.append(destination)
                         # If this region has day access, the deathwarp will occur on the same time of day
                         # Note that no deathwarps are dependent on time of day
                         if region.dayAccess[kong]:
-                            spoiler.RegionList[destination].dayAccess[kong] = True
+                            regions[destination].dayAccess[kong] = True
                             # Count as event added so search doesn't get stuck if region is searched,
                             # then later a new time of day access is found so it should be re-visited
                             eventAdded = True
                         # And vice versa
                         if region.nightAccess[kong]:
-                            spoiler.RegionList[destination].nightAccess[kong] = True
+                            regions[destination].nightAccess[kong] = True
                             eventAdded = True
+    if searchState is not None and (searchState.advance or not resumed):
+        searchState.Save(spoiler, startingOwnedItems, searchType, purchaseList, ownedItems, accessible, kongAccessibleRegions, unpurchasedEmptyShopLocationIds)
     # If we're here to get accessible locations for fill purposes, we need to take a harder look at all the empty shops we didn't buy
     if searchType == SearchMode.GetReachableForFilling:
         shuffle(unpurchasedEmptyShopLocationIds)  # This shuffle is to not bias fills towards earlier shops
@@ -605,9 +821,14 @@ def VerifyWorldWithWorstCoinUsage(spoiler: Spoiler) -> bool:
     medalThreshold = settings.medal_requirement
     fairyThreshold = settings.rareware_gb_fairies
     pearlThreshold = settings.mermaid_gb_pearls
+    # Every search below only buys more shops than the one before it, so each one picks up from the round of an earlier search
+    # where the first of the newly bought shops was reached instead of searching the whole world again
+    checkpoints = PurchaseCheckpoints()
+    candidateCheckpoints = {}
     while 1:
         spoiler.Reset()
-        reachable = GetAccessibleLocations(spoiler, [], SearchMode.GetReachableWithControlledPurchases, locationsToPurchase)
+        checkpoints = checkpoints.Branch(locationsToPurchase)
+        reachable = GetAccessibleLocations(spoiler, [], SearchMode.GetReachableWithControlledPurchases, locationsToPurchase, checkpoints=checkpoints)
         # Subtract the price of the chosen location from maxCoinsNeeded
         coinsSpent = GetMaxCoinsSpent(spoiler, locationsToPurchase)
         coinsNeeded = [maxCoins[kong] - coinsSpent[kong] for kong in range(0, 5)]
@@ -738,13 +959,15 @@ def VerifyWorldWithWorstCoinUsage(spoiler: Spoiler) -> bool:
         if mostExpensiveGB is not None:
             worstLocationCandidates.append(mostExpensiveGB)
         locationToBuy = worstLocationCandidates[0]
+        candidateCheckpoints.clear()
         if len(worstLocationCandidates) > 1:  # Things can be sped up if there's only one option (this tends to happen)
             for shopLocation in worstLocationCandidates:
                 # Recheck accessible to see how many coins will be available afterward
                 tempLocationsToPurchase = locationsToPurchase.copy()
                 tempLocationsToPurchase.append(shopLocation)
                 spoiler.Reset()
-                reachableAfter: list = GetAccessibleLocations(spoiler, [], SearchMode.GetReachableWithControlledPurchases, tempLocationsToPurchase)
+                candidateCheckpoints[shopLocation] = checkpoints.Branch(tempLocationsToPurchase)
+                reachableAfter: list = GetAccessibleLocations(spoiler, [], SearchMode.GetReachableWithControlledPurchases, tempLocationsToPurchase, checkpoints=candidateCheckpoints[shopLocation])
                 spoiler.LogicVariables.UpdateCoins()
                 coinsAfter = spoiler.LogicVariables.Coins.copy()
                 # Calculate the coin differential
@@ -779,6 +1002,96 @@ def VerifyWorldWithWorstCoinUsage(spoiler: Spoiler) -> bool:
         # Purchase the "least helpful" move & add to owned Items
         # print("Choosing to buy " + LocationList[locationToBuy].item.name + " from " + LocationList[locationToBuy].name)
         locationsToPurchase.append(locationToBuy)
+        # The search for the chosen purchase was already done while comparing candidates
+        checkpoints = candidateCheckpoints.get(locationToBuy, checkpoints)
+
+
+def ProbeBeatableWithout(spoiler: Spoiler, locationId: Union[Locations, int]) -> Tuple[bool, List[Items]]:
+    """Check if the game is beatable without the item at this location, along with the hints accessible along the way.
+
+    The item is left out of the location for the caller to put back.
+    """
+    spoiler.LocationList[locationId].item = None
+    spoiler.Reset()
+    gameIsBeatable = GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable)
+    return gameIsBeatable, spoiler.LogicVariables.Hints.copy()
+
+
+def ProbeBeatablePuttingBack(spoiler: Spoiler, locationId: Union[Locations, int]) -> Tuple[bool, List[Items]]:
+    """Check if the game is beatable without the item at this location, putting the item back afterwards."""
+    location = spoiler.LocationList[locationId]
+    item = location.item
+    result = ProbeBeatableWithout(spoiler, locationId)
+    location.PlaceItem(spoiler, item)
+    return result
+
+
+def RebuiltWorldState(spoiler: Spoiler) -> tuple:
+    """Get the parts of the world a probe process rebuilds from the settings instead of being sent, leaving out any search state."""
+    regions = [(id, region.locations, region.events, region.exits, region.deathwarp) for id, region in spoiler.RegionList.items()]
+    collectibles = [(id, [{key: value for key, value in vars(collectible).items() if key != "added"} for collectible in region]) for id, region in spoiler.CollectibleRegions.items()]
+    return CanonicalValue((regions, collectibles, ShuffleExits.ShufflableExits))
+
+
+def ProbeChunk(form_data: dict, expected_seed: str, world: bytes, locationIds: bytes) -> Optional[List[Tuple[Locations, Any]]]:
+    """Rebuild the world in a fresh process and probe a share of the locations on it.
+
+    Returns nothing if the rebuilt world differs from the one the probes were asked about.
+    """
+    # Imported here as the spoiler module imports this one
+    from randomizer.Spoiler import Spoiler
+
+    spoiler = Spoiler(Settings(form_data))
+    if spoiler.settings.seed != expected_seed:
+        return None
+    (settings, locations, logicVariables), rebuilt, probe, args = pickle.loads(world)
+    locationIds = pickle.loads(locationIds)
+    PrepareWorld(spoiler)
+    if RebuiltWorldState(spoiler) != rebuilt:
+        return None
+    spoiler.settings.__dict__.update(settings)
+    for locationId, location in locations.items():
+        spoiler.LocationList[locationId].__dict__.update(location)
+    spoiler.LogicVariables.__dict__.update(logicVariables)
+    EnsureLogicCompiled(spoiler)
+    spoiler.InvalidateLogicCaches()
+    PrepareRegionGraph(spoiler)
+    return [(locationId, probe(spoiler, locationId, *args)) for locationId in locationIds]
+
+
+def ProbeInParallel(spoiler: Spoiler, probe: Callable, locationIds: List[Locations], processes: int, *args: Any) -> dict:
+    """Run probe(spoiler, locationId, *args) for each location across a pool of processes, or return nothing if they can't give the answers a probe here would.
+
+    Each probe must leave the world as it found it. A world can't be sent to a process as its rules can't be pickled,
+    so each process rebuilds it from the settings and takes the settings, locations and logic variables from here.
+    The rebuilt world is checked against this one before probing. Any difference, or a process failing, leaves every probe to run here.
+    Processes are spawned rather than forked, forking would copy any telemetry exporter threads and the locks they hold into each of them.
+    Rebuilding the world takes a process a second or two, so this only pays off when the probes take longer than that.
+    """
+    try:
+        import multiprocessing
+
+        context = multiprocessing.get_context("spawn")
+    except (ImportError, ValueError):
+        return {}
+    world = (
+        vars(spoiler.settings),
+        {locationId: vars(location) for locationId, location in spoiler.LocationList.items()},
+        {key: value for key, value in vars(spoiler.LogicVariables).items() if key not in ("spoiler", "settings")},
+    )
+    rebuilt = RebuiltWorldState(spoiler)
+    processes = min(processes, len(locationIds))
+    chunks = [locationIds[i::processes] for i in range(processes)]
+    # Sent pickled and only unpickled once the process has imported the randomizer, a process which can't unpickle a task dies and leaves the pool waiting on it forever
+    world = pickle.dumps((world, rebuilt, probe, args))
+    try:
+        with context.Pool(processes) as pool:
+            chunk_results = pool.starmap(ProbeChunk, [(spoiler.settings.form_data, spoiler.settings.seed, world, pickle.dumps(chunk)) for chunk in chunks])
+    except Exception:
+        return {}
+    if any(results is None for results in chunk_results):
+        return {}
+    return {locationId: result for results in chunk_results for locationId, result in results}
 
 
 def ParePlaythrough(spoiler: Spoiler, PlaythroughLocations: List[Sphere]) -> None:
@@ -799,6 +1112,7 @@ def ParePlaythrough(spoiler: Spoiler, PlaythroughLocations: List[Sphere]) -> Non
         ]
     )
     # Check every location in the list of spheres.
+    candidates = []
     for i in range(len(PlaythroughLocations) - 1, -1, -1):
         # We can immediately ignore spheres past the first sphere that is beaten
         if i > 0 and PlaythroughLocations[i - 1].seedBeaten:
@@ -819,34 +1133,45 @@ def ParePlaythrough(spoiler: Spoiler, PlaythroughLocations: List[Sphere]) -> Non
                 continue
             if location.item is not None and ItemList[location.item].type == Types.Blueprint:
                 continue
-            # Copy out item from location
-            item = location.item
+            candidates.append((sphere, locationId))
+    # In item rando every item is put back after its probe, so each probe is independent of the others and they can be spread across processes
+    # Without item rando, removed items stay out of logic until the end, so each probe depends on the ones before it
+    probes = {}
+    if spoiler.settings.shuffle_items and spoiler.settings.pare_playthrough_processes > 1 and len(candidates) > 1:
+        # The last probe always runs here so this process is left in the same state as when every probe runs here
+        probes = ProbeInParallel(spoiler, ProbeBeatablePuttingBack, [locationId for _, locationId in candidates[:-1]], spoiler.settings.pare_playthrough_processes)
+    for sphere, locationId in candidates:
+        location = spoiler.LocationList[locationId]
+        # Copy out item from location
+        item = location.item
+        # Check if the game is still beatable
+        if locationId in probes:
+            gameIsBeatable, hints = probes[locationId]
             location.item = None
-            # Check if the game is still beatable
-            spoiler.Reset()
-            gameIsBeatable = GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable)
-            # Make note of what hints are accessible without this WotH candidate in case it gets hinted later.
-            # This may miss hints available after the win condition is met, but those hints are never practically getting seen anyway.
-            AccessibleHintsForLocation[locationId] = spoiler.LogicVariables.Hints.copy()
-            if gameIsBeatable:
-                # If the game is still beatable, this is an unnecessary location. We remove it from the playthrough, as it is not strictly required.
-                sphere.locations.remove(locationId)
-                # In non-item rando, put back the items on a delay
-                if not spoiler.settings.shuffle_items:
-                    # We delay the item to ensure future locations which may rely on this one do not give a false positive for beatability.
-                    # This is legacy behavior I'm not convinced needs to exist. It stays in non-item rando because the performance cost is negligible there.
-                    location.SetDelayedItem(item)
-                    locationsToAddBack.append(locationId)
-                # In item rando, we do additional WotH paring via paths later, so we don't need to worry about getting it perfect here
-                else:
-                    location.PlaceItem(spoiler, item)
+        else:
+            gameIsBeatable, hints = ProbeBeatableWithout(spoiler, locationId)
+        # Make note of what hints are accessible without this WotH candidate in case it gets hinted later.
+        # This may miss hints available after the win condition is met, but those hints are never practically getting seen anyway.
+        AccessibleHintsForLocation[locationId] = hints
+        if gameIsBeatable:
+            # If the game is still beatable, this is an unnecessary location. We remove it from the playthrough, as it is not strictly required.
+            sphere.locations.remove(locationId)
+            # In non-item rando, put back the items on a delay
+            if not spoiler.settings.shuffle_items:
+                # We delay the item to ensure future locations which may rely on this one do not give a false positive for beatability.
+                # This is legacy behavior I'm not convinced needs to exist. It stays in non-item rando because the performance cost is negligible there.
+                location.SetDelayedItem(item)
+                locationsToAddBack.append(locationId)
+            # In item rando, we do additional WotH paring via paths later, so we don't need to worry about getting it perfect here
             else:
-                # If the game is not beatable without this item, don't remove it from the playthrough and add the item back. This is now a WotH candidate.
                 location.PlaceItem(spoiler, item)
-                # Some important items have inherent door restrictions depending on the settings
-                restrictions = getDoorRestrictionsForItem(spoiler, item)
-                if len(restrictions) > 0:
-                    AccessibleHintsForLocation[locationId] = [hint for hint in AccessibleHintsForLocation[locationId] if hint in restrictions]
+        else:
+            # If the game is not beatable without this item, don't remove it from the playthrough and add the item back. This is now a WotH candidate.
+            location.PlaceItem(spoiler, item)
+            # Some important items have inherent door restrictions depending on the settings
+            restrictions = getDoorRestrictionsForItem(spoiler, item)
+            if len(restrictions) > 0:
+                AccessibleHintsForLocation[locationId] = [hint for hint in AccessibleHintsForLocation[locationId] if hint in restrictions]
     # Record that dictionary of hint access for when we compile hints
     spoiler.accessible_hints_for_location = AccessibleHintsForLocation
     # Check if there are any empty spheres, if so remove them
@@ -892,8 +1217,10 @@ def PareWoth(spoiler: Spoiler, PlaythroughLocations: List[Sphere]) -> List[Union
     if spoiler.settings.shuffle_items:
         majorItems = IdentifyMajorItems(spoiler)
         spoiler.majorItems = majorItems
-        CalculateWothPaths(spoiler, WothLocations, majorItems)
-        CalculateFoolish(spoiler, WothLocations, majorItems)
+        with spoiler.metrics.Phase("CalculateWothPaths"):
+            CalculateWothPaths(spoiler, WothLocations, majorItems)
+        with spoiler.metrics.Phase("CalculateFoolish"):
+            CalculateFoolish(spoiler, WothLocations, majorItems)
     # Non-item rando needs additional WotH paring due to the delayed item re-placing done when paring the playthrough
     else:
         # Check every item location to see if removing it by itself makes the game unbeatable
@@ -988,6 +1315,31 @@ def IdentifyMajorItems(spoiler: Spoiler) -> List[Locations]:
     return majorItems
 
 
+def ProbeWothPath(spoiler: Spoiler, locationId: Union[Locations, int]) -> Tuple[Set[Locations], Set[Events]]:
+    """Find the locations and events that are still reachable without the item at this location."""
+    # Remove the item from the location
+    location = spoiler.LocationList[locationId]
+    item_id = location.item
+    location.item = None
+    # We also need to assume Kongs in order to get a "pure" path instead of Kong paths being a subset of most later paths.
+    # Anything locked behind a a Kong will then require everything that Kong requires.
+    # This sort of defeats the purpose of paths, as it would put everything in a Kong's path into the path of many, many items.
+    assumedItems = ItemPool.Kongs(spoiler.settings)
+    # Find all accessible locations without this item placed
+    spoiler.Reset()
+    accessible = set(GetAccessibleLocations(spoiler, assumedItems, SearchMode.GetReachable))
+    events = set(spoiler.LogicVariables.Events)
+    # Put the item back for future calculations
+    location.PlaceItem(spoiler, item_id)
+    return accessible, events
+
+
+def ProbeWothPathGoals(spoiler: Spoiler, locationId: Union[Locations, int], goals: Set[Locations]) -> Tuple[Set[Locations], Set[Events]]:
+    """Find which of the path goals and which events are still reachable without the item at this location."""
+    accessible, events = ProbeWothPath(spoiler, locationId)
+    return accessible & goals, events
+
+
 def CalculateWothPaths(spoiler: Spoiler, WothLocations: List[Union[Locations, int]], MajorItems: List[Items]) -> None:
     """Calculate the Paths (dependencies) for each Way of the Hoard item."""
     # Helps get more accurate paths by removing important obstacles to level entry
@@ -1062,18 +1414,18 @@ def CalculateWothPaths(spoiler: Spoiler, WothLocations: List[Union[Locations, in
     if spoiler.settings.win_condition_item == WinConditionComplex.beat_krool:
         for phase in spoiler.settings.krool_order:
             spoiler.krool_paths[phase] = []
+    # Each probe is independent of the others, so they can be spread across processes and merged back in order
+    probes = {}
+    if spoiler.settings.woth_path_processes > 1 and len(ordered_interesting_locations) > 1:
+        goals = set(WothLocations) | set(spoiler.other_paths.keys())
+        # The last probe always runs here so this process is left in the same state as when every probe runs here
+        probes = ProbeInParallel(spoiler, ProbeWothPathGoals, ordered_interesting_locations[:-1], spoiler.settings.woth_path_processes, goals)
+    assumedItems = ItemPool.Kongs(spoiler.settings)
     for locationId in ordered_interesting_locations:
-        # Remove the item from the location
-        location = spoiler.LocationList[locationId]
-        item_id = location.item
-        location.item = None
-        # We also need to assume Kongs in order to get a "pure" path instead of Kong paths being a subset of most later paths.
-        # Anything locked behind a a Kong will then require everything that Kong requires.
-        # This sort of defeats the purpose of paths, as it would put everything in a Kong's path into the path of many, many items.
-        assumedItems = ItemPool.Kongs(spoiler.settings)
-        # Find all accessible locations without this item placed
-        spoiler.Reset()
-        accessible = GetAccessibleLocations(spoiler, assumedItems, SearchMode.GetReachable)
+        if locationId in probes:
+            accessible, events = probes[locationId]
+        else:
+            accessible, events = ProbeWothPath(spoiler, locationId)
         # Then check every other WotH location for accessibility
         for other_location in WothLocations:
             # If it is no longer accessible, then this location is on the path of that other location
@@ -1099,7 +1451,7 @@ def CalculateWothPaths(spoiler: Spoiler, WothLocations: List[Union[Locations, in
                 Maps.KroolChunkyPhase: Events.KRoolChunky,
             }
             for map_id in final_boss_associated_event:
-                if map_id in spoiler.settings.krool_order and final_boss_associated_event[map_id] not in spoiler.LogicVariables.Events:
+                if map_id in spoiler.settings.krool_order and final_boss_associated_event[map_id] not in events:
                     spoiler.krool_paths[map_id].append(locationId)
         elif spoiler.settings.win_condition_item == WinConditionComplex.dk_rap_items:
             rap_assoc_name = {
@@ -1113,10 +1465,8 @@ def CalculateWothPaths(spoiler: Spoiler, WothLocations: List[Union[Locations, in
             for verse_name in rap_assoc_name:
                 if verse_name not in spoiler.rap_win_con_paths:
                     spoiler.rap_win_con_paths[verse_name] = []
-                if rap_assoc_name[verse_name] not in spoiler.LogicVariables.Events:
+                if rap_assoc_name[verse_name] not in events:
                     spoiler.rap_win_con_paths[verse_name].append(locationId)
-        # Put the item back for future calculations
-        location.PlaceItem(spoiler, item_id)
     # After everything is calculated, get rid of paths for false WotH locations
     # If an item doesn't show up on any other paths, it's not actually WotH
     # This is rare, but could happen if the item at the location is needed for coins or B. Lockers - it's often required, but not helpful to hint at all
@@ -1441,6 +1791,8 @@ def ForwardFill(
     if not inOrder:
         shuffle(itemsToPlace)
     needToRefreshReachable = True
+    # Owned items never change here, so each search only needs to continue from the last one with the newly placed items
+    searchState = SearchState()
     # While there are items to place
     while len(itemsToPlace) > 0:
         # Get a random item
@@ -1449,7 +1801,7 @@ def ForwardFill(
         if not doubleTime or needToRefreshReachable:
             # Find a random empty location which is reachable with current items
             spoiler.Reset()
-            reachable = GetAccessibleLocations(spoiler, ownedItems.copy(), SearchMode.GetReachableForFilling)
+            reachable = GetAccessibleLocations(spoiler, ownedItems.copy(), SearchMode.GetReachableForFilling, searchState=searchState)
         validLocations = settings.GetValidLocationsForItem(item)
         validReachable = [x for x in reachable if spoiler.LocationList[x].item is None and x in validLocations]
         if len(validReachable) == 0:  # If there are no empty reachable locations, reached a dead end
@@ -1533,8 +1885,10 @@ def AssumedFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
 
         itemValidLocations = settings.GetValidLocationsForItem(item)
         # Find all valid reachable locations for this item
+        # Every candidate location is checked by resuming this search with the item placed, rather than searching from scratch
+        searchState = SearchState(advance=False)
         spoiler.Reset()
-        reachable = GetAccessibleLocations(spoiler, owned, SearchMode.GetReachableForFilling)
+        reachable = GetAccessibleLocations(spoiler, owned, SearchMode.GetReachableForFilling, searchState=searchState)
         validReachable = [x for x in reachable if spoiler.LocationList[x].item is None and x in itemValidLocations]
         # If there are no empty reachable locations, reached a dead end
         if len(validReachable) == 0:
@@ -1560,7 +1914,7 @@ def AssumedFill(spoiler: Spoiler, itemsToPlace: List[Items], ownedItems: Optiona
                 owned = itemsToPlace.copy()
                 owned.extend(ownedItems)
                 spoiler.Reset()
-                reachable = GetAccessibleLocations(spoiler, owned, SearchMode.GetReachableForFilling)
+                reachable = GetAccessibleLocations(spoiler, owned, SearchMode.GetReachableForFilling, searchState=searchState)
                 valid = True
                 # For each remaining item, ensure that it has a valid location reachable after placing this item
                 for checkItem in itemsToPlace:
@@ -2475,9 +2829,11 @@ def GeneratePlaythrough(spoiler: Spoiler) -> None:
     PlaythroughLocations = GetAccessibleLocations(spoiler, [], SearchMode.GeneratePlaythrough)  # identify in the spheres where the win condition is met
     if not spoiler.LogicVariables.bananaHoard and spoiler.settings.logic_type != LogicType.nologic:
         raise Ex.FillException("Woah, you hit an EXTREMELY rare error! Please post your settings string to the discord. It's probably a freak accident so you're safe to try again.")
-    ParePlaythrough(spoiler, PlaythroughLocations)
+    with spoiler.metrics.Phase("ParePlaythrough"):
+        ParePlaythrough(spoiler, PlaythroughLocations)
     # Generate and display woth
-    WothLocations = PareWoth(spoiler, PlaythroughLocations)
+    with spoiler.metrics.Phase("PareWoth"):
+        WothLocations = PareWoth(spoiler, PlaythroughLocations)
     # Write data to spoiler and return
     spoiler.UpdateLocations(spoiler.LocationList)
     if any(spoiler.settings.shuffled_location_types):
@@ -2829,66 +3185,190 @@ def FillKongsAndMoves(spoiler: Spoiler, placedTypes: List[Types], placedItems: L
         raise Ex.ItemPlacementException(str(unplaced) + " unplaced items.")
 
 
+def AttemptFill(spoiler: Spoiler, wipe_progression: bool) -> None:
+    """Make a single attempt at filling the world, raising a FillException if it fails."""
+    if wipe_progression:
+        # Assume we can progress through the levels so long as we have enough kongs
+        spoiler.settings.kongs_for_progression = True
+        WipeBLockerRequirements(spoiler.settings)
+        # If we're in CLO and keys are not in the pool, don't wipe boss requirements
+        if not (spoiler.settings.hard_level_progression and spoiler.settings.shuffle_items and Types.Key in spoiler.settings.shuffled_location_types):
+            WipeBossRequirements(spoiler.settings)
+    # To aid in finding these locations, treat Rareware Coin and Rareware GB as being ~15-20% more expensive for fill purposes (unless it's already very expensive)
+    spoiler.settings.medal_requirement = spoiler.settings.logical_medal_requirement
+    spoiler.settings.rareware_gb_fairies = spoiler.settings.logical_fairy_requirement
+    # Fill locations
+    with spoiler.metrics.Phase("Fill"):
+        Fill(spoiler)
+    if wipe_progression:
+        with spoiler.metrics.Phase("ProgressionRequirements"):
+            # Update progression requirements based on what is now accessible after all shuffles are done
+            if spoiler.settings.hard_level_progression:
+                SetNewProgressionRequirementsUnordered(spoiler)
+            else:
+                SetNewProgressionRequirements(spoiler)
+            # After setting B. Lockers and bosses, make sure the game is still 101%-able
+            spoiler.Reset()
+            if not GetAccessibleLocations(spoiler, [], SearchMode.CheckAllReachable):
+                print("Failed post-progression 101% check?")
+                raise Ex.GameNotBeatableException("Game not able to complete 101% after setting progression.")
+        # Once progression requirements updated, no longer assume we need kongs freed for level progression
+        spoiler.settings.kongs_for_progression = False
+    # Reset the adjustments made for fill purposes
+    spoiler.settings.medal_requirement = spoiler.settings.original_medal_requirement
+    spoiler.settings.rareware_gb_fairies = spoiler.settings.original_fairy_requirement
+    # Check if game is beatable
+    with spoiler.metrics.Phase("VerifyWorldWithWorstCoinUsage"):
+        if not VerifyWorldWithWorstCoinUsage(spoiler):
+            raise Ex.GameNotBeatableException("Game potentially unbeatable after placing all items.")
+
+
+def PrepareFillRetry(spoiler: Spoiler, retries: int) -> None:
+    """Reshuffle what a failed fill may have been stuck on before the next attempt."""
+    spoiler.settings.shuffle_prices(spoiler)
+    # We don't really reach this block anymore now that we moved this to the server
+    # Every 3rd fill, retry more aggressively by reshuffling level order, move prices, and starting location as applicable
+    if retries % 3 == 0:
+        js.postMessage("Retrying fill really hard. Tries: " + str(retries))
+        if spoiler.settings.random_starting_region:
+            spoiler.settings.RandomizeStartingLocation(spoiler)
+        if spoiler.settings.shuffle_loading_zones == ShuffleLoadingZones.levels:  # TODO: Reshuffling LZR doesn't work yet, but it might be nice? Not sure how necessary it is
+            ShuffleExits.ShuffleExits(spoiler)
+            spoiler.UpdateExits()
+    else:
+        js.postMessage("Retrying fill. Tries: " + str(retries))
+
+
+# How many attempts the fill makes before giving up on the seed
+FILL_ATTEMPTS = 2
+
+
+def RunFillAttempt(spoiler: Spoiler, attempt: int, wipe_progression: bool) -> None:
+    """Run one fill attempt, which draws from its own sub-seed so its outcome only depends on the seed and its index."""
+    seed(f"{spoiler.settings.seed}-fill-{attempt}")
+    if attempt > 0:
+        PrepareFillRetry(spoiler, attempt)
+    AttemptFill(spoiler, wipe_progression)
+
+
+def CanonicalValue(value: Any) -> Any:
+    """Turn a value into nested tuples, with dicts and sets sorted, so values built in different processes compare equal when they hold the same things.
+
+    Sets and dicts iterate in an order which depends on the process's hash seed, so they're sorted by the repr of their items.
+    """
+    if isinstance(value, Enum):
+        return value
+    if isinstance(value, dict):
+        return tuple(sorted(((repr(key), CanonicalValue(item)) for key, item in value.items()), key=lambda x: x[0]))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((CanonicalValue(item) for item in value), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(CanonicalValue(item) for item in value)
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return (type(value).__name__, CanonicalValue(vars(value)))
+    return value
+
+
+def FillStartState(spoiler: Spoiler) -> tuple:
+    """Get everything a fill attempt starts from which an earlier attempt can leave changed, the settings and what's placed in each location."""
+    return CanonicalValue((vars(spoiler.settings), [(location.item, location.inaccessible) for location in spoiler.LocationList.values()]))
+
+
+def PredictFillAttempt(form_data: dict, expected_seed: str, attempt: int, wipe_progression: bool) -> Optional[Tuple[tuple, Optional[Ex.FillException], tuple]]:
+    """Rebuild the world from its settings in a fresh process and run a fill attempt on it.
+
+    Returns the state the attempt started from, the reason it failed if it did and the state it left behind,
+    or nothing if the settings no longer give the same seed.
+    """
+    # Imported here as the spoiler module imports this one
+    from randomizer.Spoiler import Spoiler
+
+    spoiler = Spoiler(Settings(form_data))
+    if spoiler.settings.seed != expected_seed:
+        return None
+    PrepareWorld(spoiler)
+    start = FillStartState(spoiler)
+    try:
+        RunFillAttempt(spoiler, attempt, wipe_progression)
+    except Ex.FillException as ex:
+        spoiler.Reset()
+        spoiler.ClearAllLocations()
+        return start, ex, FillStartState(spoiler)
+    return start, None, FillStartState(spoiler)
+
+
+def FillWorldInParallel(spoiler: Spoiler, wipe_progression: bool, attempts: int) -> bool:
+    """Run the first fill attempt here while other processes try the next ones, or return False if this platform can't start processes.
+
+    Each process tries its attempt on a freshly built world, while here an attempt starts from whatever the failed ones before it left behind.
+    A process's attempt is only skipped here when it failed and started from exactly the state the attempt would start from here,
+    and, unless it's the last attempt, left behind the state it started from, so the attempts after it start the same as without processes.
+    Every other attempt runs here in order from the same sub-seed, which keeps the seed from depending on the process count.
+    A process can't send back a world which filled, the fill changes module level tables and builds rules which can't be pickled.
+    Processes are spawned rather than forked, forking would copy any telemetry exporter threads and the locks they hold into each of them.
+    """
+    try:
+        import multiprocessing
+
+        context = multiprocessing.get_context("spawn")
+    except (ImportError, ValueError):
+        return False
+    with context.Pool(attempts - 1) as pool:
+        pending = [pool.apply_async(PredictFillAttempt, (spoiler.settings.form_data, spoiler.settings.seed, attempt, wipe_progression)) for attempt in range(1, attempts)]
+        failure = None
+        for attempt in range(attempts):
+            if attempt > 0:
+                try:
+                    prediction = pending[attempt - 1].get()
+                except Exception:
+                    # Whatever went wrong there, running the attempt here still gives the right seed
+                    prediction = None
+                if prediction is not None and prediction[1] is not None:
+                    start, predicted_failure, left = prediction
+                    if start == FillStartState(spoiler) and (attempt == attempts - 1 or left == start):
+                        failure = predicted_failure
+                        spoiler.metrics.fill_retries += 1
+                        continue
+            try:
+                RunFillAttempt(spoiler, attempt, wipe_progression)
+                return True
+            except Ex.FillException as ex:
+                failure = ex
+                spoiler.Reset()
+                spoiler.ClearAllLocations()
+                spoiler.metrics.fill_retries += 1
+    js.postMessage("Fill failed, out of retries.")
+    raise failure
+
+
+def WipesProgression(settings: Settings) -> bool:
+    """Check if the fill sets its own B. Locker and boss requirements instead of keeping the ones from the settings."""
+    # Level order rando may have to affect the progression to be fillable - no logic doesn't care about your silly progression, however
+    return settings.shuffle_loading_zones != ShuffleLoadingZones.all and settings.logic_type != LogicType.nologic
+
+
 def FillWorld(spoiler: Spoiler) -> None:
     """Fill all locations with Kongs, moves, items, and etc."""
-    # Level order rando may have to affect the progression to be fillable - no logic doesn't care about your silly progression, however
-    wipe_progression = spoiler.settings.shuffle_loading_zones != ShuffleLoadingZones.all and spoiler.settings.logic_type != LogicType.nologic
+    wipe_progression = WipesProgression(spoiler.settings)
+    # Processes can only try the attempts the fill would make without them
+    attempts = min(spoiler.settings.fill_attempt_processes, FILL_ATTEMPTS)
+    if attempts > 1 and FillWorldInParallel(spoiler, wipe_progression, attempts):
+        return
     retries = 0
     error_log = []
     while 1:
         try:
-            if wipe_progression:
-                # Assume we can progress through the levels so long as we have enough kongs
-                spoiler.settings.kongs_for_progression = True
-                WipeBLockerRequirements(spoiler.settings)
-                # If we're in CLO and keys are not in the pool, don't wipe boss requirements
-                if not (spoiler.settings.hard_level_progression and spoiler.settings.shuffle_items and Types.Key in spoiler.settings.shuffled_location_types):
-                    WipeBossRequirements(spoiler.settings)
-            # To aid in finding these locations, treat Rareware Coin and Rareware GB as being ~15-20% more expensive for fill purposes (unless it's already very expensive)
-            spoiler.settings.medal_requirement = spoiler.settings.logical_medal_requirement
-            spoiler.settings.rareware_gb_fairies = spoiler.settings.logical_fairy_requirement
-            # Fill locations
-            Fill(spoiler)
-            if wipe_progression:
-                # Update progression requirements based on what is now accessible after all shuffles are done
-                if spoiler.settings.hard_level_progression:
-                    SetNewProgressionRequirementsUnordered(spoiler)
-                else:
-                    SetNewProgressionRequirements(spoiler)
-                # After setting B. Lockers and bosses, make sure the game is still 101%-able
-                spoiler.Reset()
-                if not GetAccessibleLocations(spoiler, [], SearchMode.CheckAllReachable):
-                    print("Failed post-progression 101% check?")
-                    raise Ex.GameNotBeatableException("Game not able to complete 101% after setting progression.")
-                # Once progression requirements updated, no longer assume we need kongs freed for level progression
-                spoiler.settings.kongs_for_progression = False
-            # Reset the adjustments made for fill purposes
-            spoiler.settings.medal_requirement = spoiler.settings.original_medal_requirement
-            spoiler.settings.rareware_gb_fairies = spoiler.settings.original_fairy_requirement
-            # Check if game is beatable
-            if not VerifyWorldWithWorstCoinUsage(spoiler):
-                raise Ex.GameNotBeatableException("Game potentially unbeatable after placing all items.")
+            RunFillAttempt(spoiler, retries, wipe_progression)
             return
         except Ex.FillException as ex:
             error_log.append(ex)
             spoiler.Reset()
             spoiler.ClearAllLocations()
             retries += 1
-            if retries == 2:
+            spoiler.metrics.fill_retries += 1
+            if retries == FILL_ATTEMPTS:
                 js.postMessage("Fill failed, out of retries.")
                 raise ex
-            spoiler.settings.shuffle_prices(spoiler)
-            # We don't really reach this block anymore now that we moved this to the server
-            # Every 3rd fill, retry more aggressively by reshuffling level order, move prices, and starting location as applicable
-            if retries % 3 == 0:
-                js.postMessage("Retrying fill really hard. Tries: " + str(retries))
-                if spoiler.settings.random_starting_region:
-                    spoiler.settings.RandomizeStartingLocation(spoiler)
-                if spoiler.settings.shuffle_loading_zones == ShuffleLoadingZones.levels:  # TODO: Reshuffling LZR doesn't work yet, but it might be nice? Not sure how necessary it is
-                    ShuffleExits.ShuffleExits(spoiler)
-                    spoiler.UpdateExits()
-            else:
-                js.postMessage("Retrying fill. Tries: " + str(retries))
 
 
 def GetAccessibleKongLocations(levels: list, ownedKongs: list):
@@ -2956,10 +3436,12 @@ def SetNewProgressionRequirements(spoiler: Spoiler) -> None:
     }
     blocker_value_projection = [0, 0, 0, 0, 0, 0, 0, 0]
     blocker_item_projection = [item for item in settings.BLockerEntryItems]
+    # Each level only opens up more of the world than the last, so every sweep continues from where the previous one stopped
+    searchState = SearchState()
     # Get sphere 0 GB count
     BlockAccessToLevel(settings, 0)
     spoiler.Reset()
-    accessible = GetAccessibleLocations(spoiler, [], SearchMode.GetReachable)
+    accessible = GetAccessibleLocations(spoiler, [], SearchMode.GetReachable, searchState=searchState)
     # Find all items that could be our first B. Locker's requirement
     accessibleItems = spoiler.LogicVariables.ItemCounts()
     # In Chaos B. Lockers, we should try our best to avoid a 0
@@ -2989,7 +3471,7 @@ def SetNewProgressionRequirements(spoiler: Spoiler) -> None:
         settings.BossBananas[thisLevel] = 1000  # also block this level's boss
         # Set up the logic variables with the available locations and items
         spoiler.Reset()
-        accessible = GetAccessibleLocations(spoiler, [], SearchMode.GetReachable)
+        accessible = GetAccessibleLocations(spoiler, [], SearchMode.GetReachable, searchState=searchState)
         # Save the available counts for this level
         coloredBananaCounts.append(spoiler.LogicVariables.ColoredBananas[thisLevel])
         # Calculate the available quantity of items for the B. Locker
@@ -3133,11 +3615,13 @@ def SetNewProgressionRequirementsUnordered(spoiler: Spoiler) -> None:
         Events.HelmKeyTurnedIn,
     ]
 
+    # Searches continue from the last one whenever the world has only opened up since then
+    searchState = SearchState()
     # Before doing anything else, determine how many GBs we can access without entering any levels
     # This is likely to be 1, but depending on the settings there are pretty good odds more are available
     BlockAccessToLevel(settings, 0)
     spoiler.Reset()
-    accessible = GetAccessibleLocations(spoiler, [], SearchMode.GetReachable)
+    accessible = GetAccessibleLocations(spoiler, [], SearchMode.GetReachable, searchState=searchState)
     runningGBTotal = spoiler.LogicVariables.GoldenBananas
 
     # Reset B. Lockers and T&S to initial values
@@ -3286,7 +3770,7 @@ def SetNewProgressionRequirementsUnordered(spoiler: Spoiler) -> None:
             # This allows logic to get items from any other accessible level to beat this one
             BlockCompletionOfLevelSet(settings, accessibleIncompleteLevels)
         spoiler.Reset()
-        accessible = GetAccessibleLocations(spoiler, [], SearchMode.GetReachable)
+        accessible = GetAccessibleLocations(spoiler, [], SearchMode.GetReachable, searchState=searchState)
         runningGBTotal = spoiler.LogicVariables.GoldenBananas
 
         # -------------------------------------------------------------------------------------------------------------------------------------------
@@ -3437,7 +3921,7 @@ def SetNewProgressionRequirementsUnordered(spoiler: Spoiler) -> None:
                 # After unblocking at least one T&S, the next loop needs the logic variables to know new lobbies are accessible
                 # We've now made the key on this boss accessible, so this iteration should be identical plus keys from the unblocked bosses
                 spoiler.Reset()
-                GetAccessibleLocations(spoiler, [], SearchMode.GetReachable)
+                GetAccessibleLocations(spoiler, [], SearchMode.GetReachable, searchState=searchState)
 
     # For any boss location behind a T&S we didn't lower...
     bossLocations = [
@@ -3569,44 +4053,66 @@ def BlockCompletionOfLevelSet(settings: Settings, lockedLevels):
             settings.BossBananas[i] = 1000
 
 
-def Generate_Spoiler(spoiler: Spoiler) -> Tuple[bytes, Spoiler]:
-    """Generate a complete spoiler based on input settings."""
+def PrepareWorld(spoiler: Spoiler) -> None:
+    """Check the settings and shuffle everything placed before the item fill, leaving the world ready to be filled."""
     # Check for settings incompatibilities
     CheckForIncompatibleSettings(spoiler.settings)
     if spoiler.settings.wrinkly_hints == WrinklyHints.fixed_racing:
         ValidateFixedHints(spoiler.settings)
+    CheckPlandoConflicts(spoiler.settings)
+    metrics = spoiler.metrics
     # Reset LocationList for a new fill
     spoiler.ResetLocationList()
     # Initiate kasplat map with default
     spoiler.InitKasplatMap()
     # Handle misc randomizations
-    ShuffleMisc(spoiler)
+    with metrics.Phase("ShuffleMisc"):
+        ShuffleMisc(spoiler)
     # Handle Loading Zones - this will handle LO and LZR appropriately
     if spoiler.settings.shuffle_loading_zones != ShuffleLoadingZones.none:
-        ShuffleExits.ExitShuffle(spoiler)
-        spoiler.UpdateExits()
+        with metrics.Phase("ExitShuffle"), spoiler.random_streams.Stream("exits"):
+            ShuffleExits.ExitShuffle(spoiler)
+            spoiler.UpdateExits()
+    # With all region logic in place, fold the settings into each rule and resolve the shuffled exits before searching
+    with metrics.Phase("CompileLogic"):
+        CompileLogic(spoiler)
+        spoiler.InvalidateLogicCaches()
+        PrepareRegionGraph(spoiler)
+
+
+def Generate_Spoiler(spoiler: Spoiler) -> Tuple[bytes, Spoiler]:
+    """Generate a complete spoiler based on input settings."""
+    metrics = spoiler.metrics
+    PrepareWorld(spoiler)
     # Handle Item Fill
-    if spoiler.settings.move_rando != MoveRando.off or spoiler.settings.kong_rando or any(spoiler.settings.shuffled_location_types):
-        FillWorld(spoiler)
-    else:
-        # Just check if normal item locations are beatable with given settings
-        ItemPool.PlaceConstants(spoiler)
-        if not GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable):
-            raise Ex.VanillaItemsGameNotBeatableException("Game unbeatable.")
-    CorrectBossKongLocations(spoiler)
-    GeneratePlaythrough(spoiler)
-    compileMicrohints(spoiler)
-    if spoiler.settings.wrinkly_hints != WrinklyHints.off:
-        compileHints(spoiler)
-    if spoiler.settings.spoiler_hints != SpoilerHints.off:
-        compileSpoilerHints(spoiler)
+    with metrics.Phase("FillWorld"), spoiler.random_streams.Stream("fill"):
+        if spoiler.settings.move_rando != MoveRando.off or spoiler.settings.kong_rando or any(spoiler.settings.shuffled_location_types):
+            FillWorld(spoiler)
+        else:
+            # Just check if normal item locations are beatable with given settings
+            ItemPool.PlaceConstants(spoiler)
+            if not GetAccessibleLocations(spoiler, [], SearchMode.CheckBeatable):
+                raise Ex.VanillaItemsGameNotBeatableException("Game unbeatable.")
+        CorrectBossKongLocations(spoiler)
+    with metrics.Phase("GeneratePlaythrough"):
+        GeneratePlaythrough(spoiler)
+    with metrics.Phase("Hints"), spoiler.random_streams.Stream("hints"):
+        compileMicrohints(spoiler)
+        if spoiler.settings.wrinkly_hints != WrinklyHints.off:
+            compileHints(spoiler)
+        if spoiler.settings.spoiler_hints != SpoilerHints.off:
+            compileSpoilerHints(spoiler)
     spoiler.Reset()
     ShuffleExits.Reset(spoiler)
-    spoiler.createJson()
+    with metrics.Phase("createJson"):
+        spoiler.createJson()
     js.postMessage("Patching ROM...")
     # print(spoiler)
     # print(spoiler.json)
-    patch_data, password = ApplyRandomizer.patching_response(spoiler)
+    with metrics.Phase("patching_response"):
+        patch_data, password = ApplyRandomizer.patching_response(spoiler)
+    if spoiler.logic_profiler is not None:
+        print(spoiler.logic_profiler.Report())
     return patch_data, spoiler, password
 
 
@@ -3631,76 +4137,90 @@ def ShuffleMisc(spoiler: Spoiler) -> None:
     if spoiler.settings.bananaport_placement_rando != ShufflePortLocations.off:
         port_replacements = {}
         port_human_replacements = {}
-        ShufflePorts(spoiler, port_replacements, port_human_replacements)
+        with spoiler.random_streams.Stream("ports"):
+            ShufflePorts(spoiler, port_replacements, port_human_replacements)
         spoiler.warp_locations = port_replacements
         spoiler.human_warps = port_human_replacements
     if spoiler.settings.progressive_hint_item != ProgressiveHintItem.off:
         SetProgressiveHintDoorLogic(spoiler)
     # T&S and Wrinkly Door Shuffle
     if spoiler.settings.vanilla_door_rando:  # Includes Dos' Doors
-        ShuffleVanillaDoors(spoiler)
-        if spoiler.settings.dk_portal_location_rando_v2 != DKPortalRando.off:
-            ShuffleDoors(spoiler, True)
+        with spoiler.random_streams.Stream("doors"):
+            ShuffleVanillaDoors(spoiler)
+            if spoiler.settings.dk_portal_location_rando_v2 != DKPortalRando.off:
+                ShuffleDoors(spoiler, True)
     elif spoiler.settings.wrinkly_location_rando or spoiler.settings.tns_location_rando or spoiler.settings.remove_wrinkly_puzzles or spoiler.settings.dk_portal_location_rando_v2 != DKPortalRando.off:
-        ShuffleDoors(spoiler, False)
+        with spoiler.random_streams.Stream("doors"):
+            ShuffleDoors(spoiler, False)
     if Types.Hint in spoiler.settings.shuffled_location_types:
         UpdateDoorLevels(spoiler)
     # Handle Crown Placement
     if spoiler.settings.crown_placement_rando:
         crown_replacements = {}
         crown_human_replacements = {}
-        ShuffleCrowns(spoiler, crown_replacements, crown_human_replacements)
+        with spoiler.random_streams.Stream("crowns"):
+            ShuffleCrowns(spoiler, crown_replacements, crown_human_replacements)
         spoiler.crown_locations = crown_replacements
         spoiler.human_crowns = dict(sorted(crown_human_replacements.items()))
     # Handle Bananaports
     if spoiler.settings.bananaport_rando in (BananaportRando.crossmap_coupled, BananaportRando.crossmap_decoupled):
         replacements = []
         human_replacements = {}
-        ShuffleWarpsCrossMap(
-            spoiler,
-            replacements,
-            human_replacements,
-            spoiler.settings.bananaport_rando == BananaportRando.crossmap_coupled,
-            spoiler.settings.warp_level_list_selected,
-        )
+        with spoiler.random_streams.Stream("warps"):
+            ShuffleWarpsCrossMap(
+                spoiler,
+                replacements,
+                human_replacements,
+                spoiler.settings.bananaport_rando == BananaportRando.crossmap_coupled,
+                spoiler.settings.warp_level_list_selected,
+            )
         spoiler.bananaport_replacements = replacements.copy()
         spoiler.human_warp_locations = human_replacements
     LinkWarps(spoiler)
     # Handle kasplats - this is the first VerifyWorld check, all shuffles affecting Locations must be before this one
-    KasplatShuffle(spoiler, spoiler.LogicVariables)
+    with spoiler.random_streams.Stream("kasplats"):
+        KasplatShuffle(spoiler, spoiler.LogicVariables)
     spoiler.human_kasplats = {}
     spoiler.UpdateKasplats(spoiler.LogicVariables.kasplat_map)
     # Enemy Rando
     spoiler.enemy_rando_data = {}
     spoiler.pkmn_snap_data = []
     if spoiler.settings.enemy_rando:
-        randomize_enemies_0(spoiler)
+        with spoiler.random_streams.Stream("enemies"):
+            randomize_enemies_0(spoiler)
     # Handle bonus barrels
     if (
         spoiler.settings.bonus_barrels in (MinigameBarrels.random, MinigameBarrels.selected)
         or spoiler.settings.helm_barrels == MinigameBarrels.random
         or spoiler.settings.training_barrels_minigames == MinigameBarrels.random
     ):
-        BarrelShuffle(spoiler.settings)
+        with spoiler.random_streams.Stream("barrels"):
+            BarrelShuffle(spoiler.settings)
         spoiler.UpdateBarrels()
     # CB Shuffle
     if spoiler.settings.cb_rando_enabled:
-        ShuffleCBs(spoiler)
+        with spoiler.random_streams.Stream("cbs"):
+            ShuffleCBs(spoiler)
     # Coin Shuffle
     if spoiler.settings.coin_rando:
-        ShuffleCoins(spoiler)
+        with spoiler.random_streams.Stream("coins"):
+            ShuffleCoins(spoiler)
     # Random Patches
     if spoiler.settings.random_patches:
         human_patches = {}
-        spoiler.human_patches = ShufflePatches(spoiler, human_patches).copy()
+        with spoiler.random_streams.Stream("patches"):
+            spoiler.human_patches = ShufflePatches(spoiler, human_patches).copy()
     if spoiler.settings.random_fairies:
-        ShuffleFairyLocations(spoiler)
+        with spoiler.random_streams.Stream("fairies"):
+            ShuffleFairyLocations(spoiler)
     if spoiler.settings.shuffle_shops:
-        ShuffleShopLocations(spoiler)
+        with spoiler.random_streams.Stream("shops"):
+            ShuffleShopLocations(spoiler)
     # Crate Shuffle
     if spoiler.settings.random_crates:
         human_crates = {}
-        spoiler.human_crates = ShuffleMelonCrates(spoiler, human_crates).copy()
+        with spoiler.random_streams.Stream("crates"):
+            spoiler.human_crates = ShuffleMelonCrates(spoiler, human_crates).copy()
     # Populate location references
     spoiler.location_references = [
         # DK Moves
@@ -3797,6 +4317,28 @@ def ValidateFixedHints(settings: Settings) -> None:
         raise Ex.SettingsIncompatibleException("Fixed hints are incompatible with more than 5 plandomized hints.")
 
 
+def CheckPlandoConflicts(settings: Settings) -> None:
+    """Check that the plandomizer doesn't place more of an item than exists or place Kongs the settings keep in their cages."""
+    if not settings.enable_plandomizer:
+        return
+    planned_counts = {}
+    for plando_item in settings.plandomizer_dict["locations"].values():
+        plando_item = PlandoItems(plando_item)
+        planned_counts[plando_item] = planned_counts.get(plando_item, 0) + 1
+    for plando_item, count in planned_counts.items():
+        if plando_item == PlandoItems.GoldenBanana:
+            # 40 Golden Bananas are always allocated to blueprint rewards
+            count += 40
+        if plando_item in PlannableItemLimits and count > PlannableItemLimits[plando_item]:
+            raise Ex.PlandoIncompatibleException(f'Item "{GetNameFromPlandoItem(plando_item)}" can be placed at most {PlannableItemLimits[plando_item]} times, but has been placed {count} times.')
+    # Mirrors what FillKongs refuses when Kongs aren't part of the item pool
+    if settings.kong_rando and not (settings.shuffle_items and Types.Kong in settings.shuffled_location_types):
+        if any(plando_item in (PlandoItems.Donkey, PlandoItems.Diddy, PlandoItems.Lanky, PlandoItems.Tiny, PlandoItems.Chunky) for plando_item in planned_counts):
+            raise Ex.PlandoIncompatibleException("Cannot plando Kong placement if Kongs are not in the pool.")
+        if any(settings.plandomizer_dict[f"plando_kong_rescue_{kong}"] != -1 for kong in ("diddy", "lanky", "tiny", "chunky")):
+            raise Ex.PlandoIncompatibleException("Cannot plando Kong cage openers if Kongs are not in the pool.")
+
+
 def CheckForIncompatibleSettings(settings: Settings) -> None:
     """Check for known settings conflicts and throw an exception immediately."""
     found_incompatibilities = ""
@@ -3827,6 +4369,16 @@ def CheckForIncompatibleSettings(settings: Settings) -> None:
         found_incompatibilities += "Item pool is not a valid combination of items and cannot successfully fill the world. "
     if settings.krool_access and Items.HideoutHelmKey in settings.starting_keys_list_selected:
         found_incompatibilities += "Cannot start with Key 8 and guarantee Key 8 to be required at the same time. "
+    if not settings.chaos_blockers and settings.logic_type != LogicType.nologic:
+        # When the fill sets progression it lowers B. Lockers to what can be reached, but the Helm B. Locker is only reset if Helm is shuffled in with complex level order
+        if not WipesProgression(settings):
+            fixed_blockers = range(8)
+        elif settings.hard_level_progression and settings.shuffle_helm_location:
+            fixed_blockers = []
+        else:
+            fixed_blockers = [7]
+        if any(settings.BLockerEntryCount[blocker] > 201 for blocker in fixed_blockers):
+            found_incompatibilities += "Cannot require more than the 201 Golden Bananas in the game to open a B. Locker. "
     if found_incompatibilities != "":
         raise Ex.SettingsIncompatibleException(found_incompatibilities)
 
@@ -134,6 +134,7 @@ class DoorData:
         portal_region = spoiler.RegionList[self.logicregion]
         boss_region_id = GetBossLobbyRegionIdForRegion(self.logicregion, portal_region)
         portal_region.exits.append(TransitionFront(boss_region_id, self.logic))
+        spoiler.InvalidateLogicCaches()
 
     def updateDoorTypeLogic(self, spoiler):
         """Update door type list depending on enabled settings."""
@@ -154,6 +155,7 @@ class DoorData:
         self.placed = DoorType.dk_portal
         placement_region = LEVEL_ENTRY_HANDLER_REGIONS[level]
         spoiler.RegionList[placement_region].exits[1] = TransitionFront(self.logicregion, lambda l: True)
+        spoiler.InvalidateLogicCaches()
         tied_map = RegionMapList[self.logicregion]
         if spoiler.settings.shuffle_loading_zones != ShuffleLoadingZones.all:
             spoiler.settings.level_portal_destinations[level] = {
@@ -85,9 +85,24 @@ class Location:
         if self.default_mapid_data is not None and len(self.default_mapid_data) > 0 and type(self.default_mapid_data[0]) is MapIDCombo and self.default_mapid_data[0].id == -1 and self.type != Types.Kong:
             self.is_reward = True
 
+    def Copy(self):
+        """Return a copy for a single seed that shares the map data of this location."""
+        location = object.__new__(Location)
+        location.__dict__.update(self.__dict__)
+        return location
+
+    def SetDefaultMap(self, map_id):
+        """Move the default item of this location to another map without altering the shared map data."""
+        first = self.default_mapid_data[0]
+        map_data = [MapIDCombo(map_id, first.id, first.flag, first.kong)] + self.default_mapid_data[1:]
+        if self.map_id_list is self.default_mapid_data:
+            self.map_id_list = map_data
+        self.default_mapid_data = map_data
+
     def PlaceItem(self, spoiler, item):
         """Place item at this location."""
         self.item = item
+        spoiler.reachability_cache.Clear()
         # If we're placing a real move here, lock out mutually exclusive shop locations
         if item != Items.NoItem and self.type == Types.Shop:
             for location in ShopLocationReference[self.level][self.vendor]:
@@ -123,6 +138,7 @@ class Location:
     def UnplaceItem(self, spoiler):
         """Unplace an item here, which may affect the placement of other items."""
         self.item = None
+        spoiler.reachability_cache.Clear()
         # If this is a shop location, we may have locked out a location we now need to undo
         if self.type == Types.Shop:
             # Check other locations in this shop
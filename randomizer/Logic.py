@@ -2,7 +2,6 @@
 
 from math import ceil
 from functools import lru_cache
-from collections import Counter
 
 import randomizer.CollectibleLogicFiles.AngryAztec
 import randomizer.CollectibleLogicFiles.CreepyCastle
@@ -59,10 +58,12 @@ from randomizer.Lists.Item import ItemList
 from randomizer.Enums.Maps import Maps
 from randomizer.Lists.ShufflableExit import GetShuffledLevelIndex
 from randomizer.Lists.Warps import BananaportVanilla
+from randomizer.LogicClasses import EventStore
 from randomizer.Patching.Library.Generic import IsItemSelected, getProgHintBarrierItem
 from randomizer.Prices import AnyKongCanBuy, CanBuy, GetPriceAtLocation
 
 STARTING_SLAM = 0  # Currently we're assuming you always start with 1 slam
+ITEM_COUNT = max(Items) + 1
 
 
 def IsGlitchEnabled(settings, glitch_enum):
@@ -117,6 +118,7 @@ class LogicVarHolder:
         Done between reachability searches and upon initialization.
         """
         self.latest_owned_items = []
+        self.item_counts = [0] * ITEM_COUNT
         self.found_test_item = False
 
         self.donkey = Kongs.donkey in self.settings.starting_kong_list
@@ -221,7 +223,7 @@ class LogicVarHolder:
 
         self.Blueprints = []
 
-        self.Events = []
+        self.Events = EventStore()
 
         self.Hints = []
 
@@ -323,94 +325,113 @@ class LogicVarHolder:
             self.Coins[x] = (self.RegularCoins[x] + (5 * self.RainbowCoins)) - self.SpentCoins[x]
 
     def Update(self, ownedItems):
-        """Update logic variables based on owned items."""
-        ownedItems = [item for item in ownedItems]
-        item_counts = Counter(ownedItems)
-        self.latest_owned_items = ownedItems
-        self.found_test_item = self.found_test_item or Items.TestItem in ownedItems
-
-        self.donkey = self.donkey or Items.Donkey in ownedItems or self.startkong == Kongs.donkey
-        self.diddy = self.diddy or Items.Diddy in ownedItems or self.startkong == Kongs.diddy
-        self.lanky = self.lanky or Items.Lanky in ownedItems or self.startkong == Kongs.lanky
-        self.tiny = self.tiny or Items.Tiny in ownedItems or self.startkong == Kongs.tiny
-        self.chunky = self.chunky or Items.Chunky in ownedItems or self.startkong == Kongs.chunky
-
-        self.climbing = self.climbing or Items.Climbing in ownedItems
-        self.vines = self.vines or Items.Vines in ownedItems
-        self.swim = self.swim or Items.Swim in ownedItems
-        self.oranges = self.oranges or Items.Oranges in ownedItems
-        self.barrels = self.barrels or Items.Barrels in ownedItems
+        """Update logic variables based on owned items.
+
+        Searches only ever add to their owned items, so item counts are kept between calls and only the newly owned items are counted.
+        """
+        counted = len(self.latest_owned_items)
+        if len(ownedItems) < counted or ownedItems[:counted] != self.latest_owned_items:
+            # Not a continuation of the last update, so count everything again
+            self.item_counts = [0] * ITEM_COUNT
+            self.Blueprints = []
+            self.Hints = []
+            self.latest_owned_items = []
+            counted = 0
+        owned = self.item_counts
+        for item in ownedItems[counted:]:
+            if item is None or item == Items.NoItem:
+                # Empty locations and ones left empty on purpose don't give anything
+                continue
+            owned[item] += 1
+            if item >= Items.JungleJapesDonkeyBlueprint and item <= Items.DKIslesChunkyBlueprint:
+                self.Blueprints.append(item)
+            elif item >= Items.JapesDonkeyHint and item <= Items.CastleChunkyHint:
+                self.Hints.append(item)
+        self.latest_owned_items.extend(ownedItems[counted:])
+        self.found_test_item = self.found_test_item or owned[Items.TestItem] > 0
+
+        self.donkey = self.donkey or owned[Items.Donkey] > 0 or self.startkong == Kongs.donkey
+        self.diddy = self.diddy or owned[Items.Diddy] > 0 or self.startkong == Kongs.diddy
+        self.lanky = self.lanky or owned[Items.Lanky] > 0 or self.startkong == Kongs.lanky
+        self.tiny = self.tiny or owned[Items.Tiny] > 0 or self.startkong == Kongs.tiny
+        self.chunky = self.chunky or owned[Items.Chunky] > 0 or self.startkong == Kongs.chunky
+
+        self.climbing = self.climbing or owned[Items.Climbing] > 0
+        self.vines = self.vines or owned[Items.Vines] > 0
+        self.swim = self.swim or owned[Items.Swim] > 0
+        self.oranges = self.oranges or owned[Items.Oranges] > 0
+        self.barrels = self.barrels or owned[Items.Barrels] > 0
         self.can_use_vines = self.vines  # and self.climbing to restore old behavior
 
-        progDonkey = item_counts[Items.ProgressiveDonkeyPotion]
-        self.blast = self.blast or (Items.BaboonBlast in ownedItems or progDonkey >= 1) and self.donkey
-        self.strongKong = self.strongKong or (Items.StrongKong in ownedItems or progDonkey >= 2) and self.donkey
-        self.grab = self.grab or (Items.GorillaGrab in ownedItems or progDonkey >= 3) and self.donkey
-
-        progDiddy = item_counts[Items.ProgressiveDiddyPotion]
-        self.charge = self.charge or (Items.ChimpyCharge in ownedItems or progDiddy >= 1) and self.diddy
-        self.jetpack = self.jetpack or (Items.RocketbarrelBoost in ownedItems or progDiddy >= 2) and self.diddy
-        self.spring = self.spring or (Items.SimianSpring in ownedItems or progDiddy >= 3) and self.diddy
-
-        progLanky = item_counts[Items.ProgressiveLankyPotion]
-        self.handstand = self.handstand or (Items.Orangstand in ownedItems or progLanky >= 1) and self.lanky
-        self.balloon = self.balloon or (Items.BaboonBalloon in ownedItems or progLanky >= 2) and self.lanky
-        self.sprint = self.sprint or (Items.OrangstandSprint in ownedItems or progLanky >= 3) and self.lanky
-
-        progTiny = item_counts[Items.ProgressiveTinyPotion]
-        self.mini = self.mini or (Items.MiniMonkey in ownedItems or progTiny >= 1) and self.tiny
-        self.twirl = self.twirl or (Items.PonyTailTwirl in ownedItems or progTiny >= 2) and self.tiny
-        self.monkeyport = self.monkeyport or (Items.Monkeyport in ownedItems or progTiny >= 3) and self.tiny
-
-        progChunky = item_counts[Items.ProgressiveChunkyPotion]
-        self.hunkyChunky = self.hunkyChunky or (Items.HunkyChunky in ownedItems or progChunky >= 1) and self.chunky
-        self.punch = self.punch or (Items.PrimatePunch in ownedItems or progChunky >= 2) and self.chunky
-        self.gorillaGone = self.gorillaGone or (Items.GorillaGone in ownedItems or progChunky >= 3) and self.chunky
-
-        self.coconut = self.coconut or Items.Coconut in ownedItems and self.donkey
-        self.peanut = self.peanut or Items.Peanut in ownedItems and self.diddy
-        self.grape = self.grape or Items.Grape in ownedItems and self.lanky
-        self.feather = self.feather or Items.Feather in ownedItems and self.tiny
-        self.pineapple = self.pineapple or Items.Pineapple in ownedItems and self.chunky
-
-        self.bongos = self.bongos or Items.Bongos in ownedItems and self.donkey
-        self.guitar = self.guitar or Items.Guitar in ownedItems and self.diddy
-        self.trombone = self.trombone or Items.Trombone in ownedItems and self.lanky
-        self.saxophone = self.saxophone or Items.Saxophone in ownedItems and self.tiny
-        self.triangle = self.triangle or Items.Triangle in ownedItems and self.chunky
-
-        self.crankyAccess = self.crankyAccess or Items.Cranky in ownedItems
-        self.funkyAccess = self.funkyAccess or Items.Funky in ownedItems
-        self.candyAccess = self.candyAccess or Items.Candy in ownedItems
-        self.snideAccess = self.snideAccess or Items.Snide in ownedItems
-
-        self.nintendoCoin = self.nintendoCoin or Items.NintendoCoin in ownedItems
-        self.rarewareCoin = self.rarewareCoin or Items.RarewareCoin in ownedItems
-
-        self.JapesKey = self.JapesKey or Items.JungleJapesKey in ownedItems
-        self.AztecKey = self.AztecKey or Items.AngryAztecKey in ownedItems
-        self.FactoryKey = self.FactoryKey or Items.FranticFactoryKey in ownedItems
-        self.GalleonKey = self.GalleonKey or Items.GloomyGalleonKey in ownedItems
-        self.ForestKey = self.ForestKey or Items.FungiForestKey in ownedItems
-        self.CavesKey = self.CavesKey or Items.CrystalCavesKey in ownedItems
-        self.CastleKey = self.CastleKey or Items.CreepyCastleKey in ownedItems
-        self.HelmKey = self.HelmKey or Items.HideoutHelmKey in ownedItems
-
-        self.HelmDonkey1 = self.HelmDonkey1 or Items.HelmDonkey1 in ownedItems
-        self.HelmDonkey2 = self.HelmDonkey2 or Items.HelmDonkey2 in ownedItems
-        self.HelmDiddy1 = self.HelmDiddy1 or Items.HelmDiddy1 in ownedItems
-        self.HelmDiddy2 = self.HelmDiddy2 or Items.HelmDiddy2 in ownedItems
-        self.HelmLanky1 = self.HelmLanky1 or Items.HelmLanky1 in ownedItems
-        self.HelmLanky2 = self.HelmLanky2 or Items.HelmLanky2 in ownedItems
-        self.HelmTiny1 = self.HelmTiny1 or Items.HelmTiny1 in ownedItems
-        self.HelmTiny2 = self.HelmTiny2 or Items.HelmTiny2 in ownedItems
-        self.HelmChunky1 = self.HelmChunky1 or Items.HelmChunky1 in ownedItems
-        self.HelmChunky2 = self.HelmChunky2 or Items.HelmChunky2 in ownedItems
+        progDonkey = owned[Items.ProgressiveDonkeyPotion]
+        self.blast = self.blast or (owned[Items.BaboonBlast] > 0 or progDonkey >= 1) and self.donkey
+        self.strongKong = self.strongKong or (owned[Items.StrongKong] > 0 or progDonkey >= 2) and self.donkey
+        self.grab = self.grab or (owned[Items.GorillaGrab] > 0 or progDonkey >= 3) and self.donkey
+
+        progDiddy = owned[Items.ProgressiveDiddyPotion]
+        self.charge = self.charge or (owned[Items.ChimpyCharge] > 0 or progDiddy >= 1) and self.diddy
+        self.jetpack = self.jetpack or (owned[Items.RocketbarrelBoost] > 0 or progDiddy >= 2) and self.diddy
+        self.spring = self.spring or (owned[Items.SimianSpring] > 0 or progDiddy >= 3) and self.diddy
+
+        progLanky = owned[Items.ProgressiveLankyPotion]
+        self.handstand = self.handstand or (owned[Items.Orangstand] > 0 or progLanky >= 1) and self.lanky
+        self.balloon = self.balloon or (owned[Items.BaboonBalloon] > 0 or progLanky >= 2) and self.lanky
+        self.sprint = self.sprint or (owned[Items.OrangstandSprint] > 0 or progLanky >= 3) and self.lanky
+
+        progTiny = owned[Items.ProgressiveTinyPotion]
+        self.mini = self.mini or (owned[Items.MiniMonkey] > 0 or progTiny >= 1) and self.tiny
+        self.twirl = self.twirl or (owned[Items.PonyTailTwirl] > 0 or progTiny >= 2) and self.tiny
+        self.monkeyport = self.monkeyport or (owned[Items.Monkeyport] > 0 or progTiny >= 3) and self.tiny
+
+        progChunky = owned[Items.ProgressiveChunkyPotion]
+        self.hunkyChunky = self.hunkyChunky or (owned[Items.HunkyChunky] > 0 or progChunky >= 1) and self.chunky
+        self.punch = self.punch or (owned[Items.PrimatePunch] > 0 or progChunky >= 2) and self.chunky
+        self.gorillaGone = self.gorillaGone or (owned[Items.GorillaGone] > 0 or progChunky >= 3) and self.chunky
+
+        self.coconut = self.coconut or owned[Items.Coconut] > 0 and self.donkey
+        self.peanut = self.peanut or owned[Items.Peanut] > 0 and self.diddy
+        self.grape = self.grape or owned[Items.Grape] > 0 and self.lanky
+        self.feather = self.feather or owned[Items.Feather] > 0 and self.tiny
+        self.pineapple = self.pineapple or owned[Items.Pineapple] > 0 and self.chunky
+
+        self.bongos = self.bongos or owned[Items.Bongos] > 0 and self.donkey
+        self.guitar = self.guitar or owned[Items.Guitar] > 0 and self.diddy
+        self.trombone = self.trombone or owned[Items.Trombone] > 0 and self.lanky
+        self.saxophone = self.saxophone or owned[Items.Saxophone] > 0 and self.tiny
+        self.triangle = self.triangle or owned[Items.Triangle] > 0 and self.chunky
+
+        self.crankyAccess = self.crankyAccess or owned[Items.Cranky] > 0
+        self.funkyAccess = self.funkyAccess or owned[Items.Funky] > 0
+        self.candyAccess = self.candyAccess or owned[Items.Candy] > 0
+        self.snideAccess = self.snideAccess or owned[Items.Snide] > 0
+
+        self.nintendoCoin = self.nintendoCoin or owned[Items.NintendoCoin] > 0
+        self.rarewareCoin = self.rarewareCoin or owned[Items.RarewareCoin] > 0
+
+        self.JapesKey = self.JapesKey or owned[Items.JungleJapesKey] > 0
+        self.AztecKey = self.AztecKey or owned[Items.AngryAztecKey] > 0
+        self.FactoryKey = self.FactoryKey or owned[Items.FranticFactoryKey] > 0
+        self.GalleonKey = self.GalleonKey or owned[Items.GloomyGalleonKey] > 0
+        self.ForestKey = self.ForestKey or owned[Items.FungiForestKey] > 0
+        self.CavesKey = self.CavesKey or owned[Items.CrystalCavesKey] > 0
+        self.CastleKey = self.CastleKey or owned[Items.CreepyCastleKey] > 0
+        self.HelmKey = self.HelmKey or owned[Items.HideoutHelmKey] > 0
+
+        self.HelmDonkey1 = self.HelmDonkey1 or owned[Items.HelmDonkey1] > 0
+        self.HelmDonkey2 = self.HelmDonkey2 or owned[Items.HelmDonkey2] > 0
+        self.HelmDiddy1 = self.HelmDiddy1 or owned[Items.HelmDiddy1] > 0
+        self.HelmDiddy2 = self.HelmDiddy2 or owned[Items.HelmDiddy2] > 0
+        self.HelmLanky1 = self.HelmLanky1 or owned[Items.HelmLanky1] > 0
+        self.HelmLanky2 = self.HelmLanky2 or owned[Items.HelmLanky2] > 0
+        self.HelmTiny1 = self.HelmTiny1 or owned[Items.HelmTiny1] > 0
+        self.HelmTiny2 = self.HelmTiny2 or owned[Items.HelmTiny2] > 0
+        self.HelmChunky1 = self.HelmChunky1 or owned[Items.HelmChunky1] > 0
+        self.HelmChunky2 = self.HelmChunky2 or owned[Items.HelmChunky2] > 0
 
         has_all = True
         if not self.settings.fast_start_beginning_of_game:
             has_all = all(
-                self.spoiler.LocationList[loc].inaccessible or self.spoiler.LocationList[loc].item in ownedItems
+                self.spoiler.LocationList[loc].inaccessible or (self.spoiler.LocationList[loc].item is not None and owned[self.spoiler.LocationList[loc].item] > 0)
                 for loc in (
                     Locations.IslesSwimTrainingBarrel,
                     Locations.IslesVinesTrainingBarrel,
@@ -420,39 +441,37 @@ class LogicVarHolder:
             )
         self.allTrainingChecks = self.allTrainingChecks or has_all
 
-        self.Slam = item_counts[Items.ProgressiveSlam] + STARTING_SLAM
-        self.AmmoBelts = item_counts[Items.ProgressiveAmmoBelt]
-        self.InstUpgrades = item_counts[Items.ProgressiveInstrumentUpgrade]
+        self.Slam = owned[Items.ProgressiveSlam] + STARTING_SLAM
+        self.AmmoBelts = owned[Items.ProgressiveAmmoBelt]
+        self.InstUpgrades = owned[Items.ProgressiveInstrumentUpgrade]
         self.Melons = 1
         if self.bongos or self.guitar or self.trombone or self.saxophone or self.triangle or self.InstUpgrades > 0:
             self.Melons = 2
         if self.InstUpgrades >= 2:
             self.Melons = 3
 
-        self.GoldenBananas = item_counts[Items.GoldenBanana]
-        self.BananaFairies = item_counts[Items.BananaFairy]
-        self.BananaMedals = item_counts[Items.BananaMedal]
-        self.BattleCrowns = item_counts[Items.BattleCrown]
-        self.RainbowCoins = item_counts[Items.RainbowCoin]
+        self.GoldenBananas = owned[Items.GoldenBanana]
+        self.BananaFairies = owned[Items.BananaFairy]
+        self.BananaMedals = owned[Items.BananaMedal]
+        self.BattleCrowns = owned[Items.BattleCrown]
+        self.RainbowCoins = owned[Items.RainbowCoin]
 
-        self.camera = self.camera or Items.CameraAndShockwave in ownedItems or Items.Camera in ownedItems
-        self.shockwave = self.shockwave or Items.CameraAndShockwave in ownedItems or Items.Shockwave in ownedItems
+        self.camera = self.camera or owned[Items.CameraAndShockwave] > 0 or owned[Items.Camera] > 0
+        self.shockwave = self.shockwave or owned[Items.CameraAndShockwave] > 0 or owned[Items.Shockwave] > 0
 
-        self.scope = self.scope or Items.SniperSight in ownedItems
+        self.scope = self.scope or owned[Items.SniperSight] > 0
         # Having the homing ammo ability also requires having reliable access to homing ammo. This is not a perfect fix, but should cover 99.9% of cases and won't show up in hint paths.
-        self.homing = self.homing or (Items.HomingAmmo in ownedItems and (Events.ForestEntered in self.Events or Events.CastleEntered in self.Events or self.assumeFillSuccess))
+        self.homing = self.homing or (owned[Items.HomingAmmo] > 0 and (Events.ForestEntered in self.Events or Events.CastleEntered in self.Events or self.assumeFillSuccess))
 
         self.superSlam = self.Slam >= 2
         self.superDuperSlam = self.Slam >= 3
 
-        self.Blueprints = [x for x in ownedItems if x >= Items.JungleJapesDonkeyBlueprint and x <= Items.DKIslesChunkyBlueprint]
-        self.Hints = [x for x in ownedItems if x >= Items.JapesDonkeyHint and x <= Items.CastleChunkyHint]
-        self.Beans = sum(1 for x in ownedItems if x == Items.Bean)
-        self.Pearls = sum(1 for x in ownedItems if x == Items.Pearl)
+        self.Beans = owned[Items.Bean]
+        self.Pearls = owned[Items.Pearl]
 
         self.UpdateCoins()
 
-        self.bananaHoard = self.bananaHoard or Items.BananaHoard in ownedItems
+        self.bananaHoard = self.bananaHoard or owned[Items.BananaHoard] > 0
 
     def GetCoins(self, kong):
         """Get Coin Total for a kong."""
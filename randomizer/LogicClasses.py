@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
 
 from randomizer.Enums.Kongs import Kongs
@@ -21,6 +22,13 @@ if TYPE_CHECKING:
     from randomizer.Logic import LogicVarHolder
 
 
+def CopyDefinition(definition: Any) -> Any:
+    """Create a new object sharing every attribute of a world definition, so the copy can be changed without touching the original."""
+    copy = object.__new__(definition.__class__)
+    copy.__dict__.update(definition.__dict__)
+    return copy
+
+
 class LocationLogic:
     """Logic for a location."""
 
@@ -84,6 +92,10 @@ class Collectible:
         self.name = name
         self.locked = locked
 
+    def Copy(self) -> Collectible:
+        """Return a copy for a single seed, sharing this collectible's logic and coordinates."""
+        return CopyDefinition(self)
+
 
 class Region:
     """Region contains shufflable locations, events, and transitions to other regions."""
@@ -133,6 +145,17 @@ class Region:
 
         self.ResetAccess()
 
+    def Copy(self) -> Region:
+        """Return a copy for a single seed that owns its locations, events, exits and access state but shares their logic."""
+        region = CopyDefinition(self)
+        region.locations = [CopyDefinition(location) for location in self.locations]
+        region.events = [CopyDefinition(event) for event in self.events]
+        region.exits = [CopyDefinition(exit) for exit in self.exits]
+        if self.deathwarp is not None:
+            region.deathwarp = CopyDefinition(self.deathwarp)
+        region.ResetAccess()
+        return region
+
     def ResetAccess(self) -> None:
         """Clear access variables set during search."""
         # Time access
@@ -212,6 +235,25 @@ class TransitionFront:
         self.isBananaportTransition = isBananaportTransition  # Indicates if this transition is due to a Bananaport
 
 
+class RegionGraph:
+    """The region graph of a seed with every shuffled exit already resolved to its destination.
+
+    Each list is indexed by region id, so a search never has to look up ShufflableExits or rebuild exit lists while traversing.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize empty adjacency lists for the given number of region ids."""
+        self.regions = [None] * size
+        self.exits = [[] for _ in range(size)]  # (destination, transition) pairs in the same order as the region's exits
+        self.levelExitTransitions = [None] * size  # Transition taken by the "Exit Level" button when loading zones are shuffled
+        self.lobbyExits = [None] * size  # (lobby, transition) pair used to escape a level with a random starting location
+        # Logic variables and events read by each region's rules, or None if a region has to be searched every time
+        self.dependencies: List[Optional[frozenset]] = [None] * size
+        self.dependents: dict = {}  # Logic variable or event -> regions with a rule reading it
+        self.watchedAttributes: List[str] = []  # Logic variables read by any rule, checked for changes after each update
+        self.compiledLogic = None  # The compiled rules the dependencies were found for
+
+
 class Sphere:
     """A randomizer concept often used in spoiler logs.
 
@@ -229,6 +271,271 @@ class Sphere:
         self.locations: List[Union[LocationLogic, Any]] = []
 
 
+class EventStore(set):
+    """Events reached during a search.
+
+    Membership checks go straight to the set, while the order the events were reached in is kept for anything iterating over them.
+    """
+
+    def __init__(self, events: Any = ()) -> None:
+        """Initialize with given parameters."""
+        super().__init__()
+        self.order: List[Events] = []
+        for event in events:
+            self.append(event)
+
+    def append(self, event: Events) -> None:
+        """Add an event, ignoring it if it has already been reached."""
+        if event not in self:
+            set.add(self, event)
+            self.order.append(event)
+
+    def add(self, event: Events) -> None:
+        """Add an event, ignoring it if it has already been reached."""
+        self.append(event)
+
+    def remove(self, event: Events) -> None:
+        """Remove an event."""
+        set.remove(self, event)
+        self.order.remove(event)
+
+    def discard(self, event: Events) -> None:
+        """Remove an event if it has been reached."""
+        if event in self:
+            self.remove(event)
+
+    def __iter__(self):
+        """Iterate over the events in the order they were reached."""
+        return iter(self.order)
+
+    def copy(self) -> EventStore:
+        """Return a copy of this store."""
+        return EventStore(self.order)
+
+
+class LogicSnapshot:
+    """The state a search leaves in the spoiler: the logic variables, the time of day each region was reached at and which collectibles were counted."""
+
+    def __init__(self, spoiler) -> None:
+        """Take a snapshot of the spoiler's current search state."""
+        self.logicVariables = {key: LogicSnapshot.CopyValue(value) for key, value in vars(spoiler.LogicVariables).items()}
+        self.regionAccess = [(region.dayAccess[:], region.nightAccess[:]) for region in spoiler.RegionList.values()]
+        self.collectiblesAdded = [collectible.added for region in spoiler.CollectibleRegions.values() for collectible in region]
+
+    @staticmethod
+    def CopyValue(value: Any) -> Any:
+        """Copy a logic variable deep enough that the search can't change the copy."""
+        if isinstance(value, list):
+            if len(value) > 0 and isinstance(value[0], (list, set, dict)):
+                # Lists of watched values can mix containers with plain values
+                return [x.copy() if isinstance(x, (list, set, dict)) else x for x in value]
+            return value.copy()
+        if isinstance(value, (dict, set)):
+            return value.copy()
+        return value
+
+    def Restore(self, spoiler) -> None:
+        """Put the spoiler back in the state the snapshot was taken in, leaving the snapshot free to be restored again."""
+        spoiler.LogicVariables.__dict__.update({key: LogicSnapshot.CopyValue(value) for key, value in self.logicVariables.items()})
+        for region, (dayAccess, nightAccess) in zip(spoiler.RegionList.values(), self.regionAccess):
+            region.dayAccess = dayAccess[:]
+            region.nightAccess = nightAccess[:]
+        collectibles = (collectible for region in spoiler.CollectibleRegions.values() for collectible in region)
+        for collectible, added in zip(collectibles, self.collectiblesAdded):
+            collectible.added = added
+
+
+class SearchState:
+    """A checkpoint of a reachability search, taken once the search has found everything it can.
+
+    A later search with the same owned items and search mode can resume from the checkpoint instead of starting over
+    from the game start, as long as the only changes to the world since then are that more reached locations were filled
+    or that B. Lockers and boss requirements were lowered.
+    """
+
+    def __init__(self, advance: bool = True) -> None:
+        """Initialize with given parameters.
+
+        Keyword arguments:
+        advance -- If True, a resumed search replaces the checkpoint with its own result. If False, the checkpoint
+                   is only ever taken from a full search, allowing several placements to be tried against the same base.
+        """
+        self.advance = advance
+        self.searchType = None
+        self.startingOwnedItems: List[Any] = []
+        self.ownedItems: List[Any] = []
+        self.purchaseList: List[Locations] = []
+        self.assumptions: dict = {}
+        self.accessible: set = set()
+        self.kongAccessibleRegions: List[set] = []
+        self.unpurchasedEmptyShopLocationIds: List[Locations] = []
+        self.reachedItems: dict = {}
+        self.snapshot: Optional[LogicSnapshot] = None
+        self.blockers: Tuple[List[Any], List[int], List[int]] = ([], [], [])
+        self.saved = False
+
+    def Save(
+        self,
+        spoiler,
+        startingOwnedItems: List[Any],
+        searchType,
+        purchaseList: List[Locations],
+        ownedItems: List[Any],
+        accessible: set,
+        kongAccessibleRegions: List[set],
+        unpurchasedEmptyShopLocationIds: List[Locations],
+    ) -> None:
+        """Store the state of a search which has just finished exploring."""
+        logicVariables = spoiler.LogicVariables
+        self.searchType = searchType
+        self.startingOwnedItems = startingOwnedItems[:]
+        self.purchaseList = purchaseList[:]
+        self.assumptions = {key: value for key, value in vars(logicVariables).items() if key.startswith("assume")}
+        self.ownedItems = ownedItems[:]
+        self.accessible = accessible.copy()
+        self.kongAccessibleRegions = [x.copy() for x in kongAccessibleRegions]
+        self.unpurchasedEmptyShopLocationIds = unpurchasedEmptyShopLocationIds[:]
+        self.reachedItems = {x: (spoiler.LocationList[x].item, spoiler.LocationList[x].inaccessible) for x in accessible}
+        self.snapshot = LogicSnapshot(spoiler)
+        settings = spoiler.settings
+        self.blockers = (settings.BLockerEntryItems[:], settings.BLockerEntryCount[:], settings.BossBananas[:])
+        self.saved = True
+
+    def GetNewlyFilledLocations(self, spoiler, startingOwnedItems: List[Any], searchType, purchaseList: List[Locations]) -> Optional[List[Locations]]:
+        """Get the reached locations which have been filled since the checkpoint, or None if the search can't be resumed."""
+        if not self.saved or searchType != self.searchType or purchaseList != self.purchaseList:
+            return None
+        if any(getattr(spoiler.LogicVariables, key) != value for key, value in self.assumptions.items()):
+            return None
+        if len(startingOwnedItems) != len(self.startingOwnedItems) or sorted(startingOwnedItems) != sorted(self.startingOwnedItems):
+            return None
+        # Lowering a requirement only opens the world up further, which a resumed search finds by visiting every region again
+        settings = spoiler.settings
+        items, counts, bosses = self.blockers
+        if settings.BLockerEntryItems != items or any(new > old for new, old in zip(settings.BLockerEntryCount, counts)) or any(new > old for new, old in zip(settings.BossBananas, bosses)):
+            return None
+        newlyFilled = []
+        for locationId, (item, inaccessible) in self.reachedItems.items():
+            location = spoiler.LocationList[locationId]
+            if location.inaccessible != inaccessible:
+                return None
+            if location.item != item:
+                # Only locations which were empty may change, anything else would take items away from the search
+                if item is not None:
+                    return None
+                newlyFilled.append(locationId)
+        return newlyFilled
+
+    def Restore(self, spoiler) -> Tuple[List[Any], set, List[set], List[Locations]]:
+        """Put the spoiler back in the state it was in at the checkpoint, returning copies of the search's own progress."""
+        self.snapshot.Restore(spoiler)
+        return self.ownedItems[:], self.accessible.copy(), [x.copy() for x in self.kongAccessibleRegions], self.unpurchasedEmptyShopLocationIds[:]
+
+
+class ReachabilityCache:
+    """A bounded cache of finished searches, so a search repeated on an unchanged world doesn't have to run again.
+
+    Each entry keeps the search's result along with a snapshot of the logic state it left behind,
+    so a cache hit leaves the spoiler exactly as running the search would have.
+    """
+
+    def __init__(self, size: int = 32) -> None:
+        """Initialize with given parameters."""
+        self.size = size
+        self.entries: OrderedDict = OrderedDict()
+
+    def Clear(self) -> None:
+        """Forget every search, needed whenever the world the searches ran on changes."""
+        self.entries.clear()
+
+    def Get(self, spoiler, key: Tuple) -> Tuple[bool, Any]:
+        """Restore the spoiler to the end of a cached search, returning whether the search was found and its result."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+        self.entries.move_to_end(key)
+        result, snapshot = entry
+        snapshot.Restore(spoiler)
+        return True, LogicSnapshot.CopyValue(result)
+
+    def Store(self, spoiler, key: Tuple, result: Any) -> None:
+        """Store a finished search along with the state it left the spoiler in, evicting the least recently used search if full."""
+        self.entries[key] = (LogicSnapshot.CopyValue(result), LogicSnapshot(spoiler))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+
+class RecordedSet(set):
+    """A set which remembers the order its items were added in.
+
+    Iterating a set follows its hash table, which depends on the order items were added and not just the items themselves.
+    Copies are rebuilt by adding the items in the same order, so a copy iterates in exactly the same order as the original.
+    """
+
+    def __init__(self, items: Any = ()) -> None:
+        """Initialize with given parameters."""
+        super().__init__()
+        self.order: List[Any] = []
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Any) -> None:
+        """Add an item, remembering when it was first added."""
+        if item not in self:
+            set.add(self, item)
+            self.order.append(item)
+
+    def copy(self) -> RecordedSet:
+        """Return a copy which iterates in the same order."""
+        copy = RecordedSet()
+        set.update(copy, self.order)
+        copy.order = self.order[:]
+        return copy
+
+
+class PurchaseCheckpoints:
+    """Snapshots of a search with controlled purchases, taken at the start of each of its rounds.
+
+    Buying an extra shop only changes a search from the round where that shop is first reached, so the same search with
+    more shops bought can pick up from the snapshot of that round instead of starting over from the game start.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with given parameters."""
+        self.purchaseList: List[Locations] = []
+        self.rounds: List[Tuple] = []
+        self.firstReached: dict = {}
+        self.resumeRound: Optional[int] = None
+
+    def Branch(self, purchaseList: List[Locations]) -> PurchaseCheckpoints:
+        """Get checkpoints for a search buying more shops than this one, sharing the snapshots taken before any of them were reached."""
+        branch = PurchaseCheckpoints()
+        branch.purchaseList = purchaseList[:]
+        if not self.rounds:
+            return branch
+        extra = set(purchaseList) - set(self.purchaseList)
+        if len(extra) + len(self.purchaseList) != len(set(purchaseList)) or any(x not in self.firstReached for x in extra):
+            # Dropping shops from the purchase list, or buying shops this search never reached, needs a new search
+            return branch
+        resumeRound = min([self.firstReached[x] for x in extra], default=len(self.rounds) - 1)
+        branch.rounds = self.rounds[: resumeRound + 1]
+        branch.firstReached = {x: reached for x, reached in self.firstReached.items() if reached < resumeRound}
+        branch.resumeRound = resumeRound
+        return branch
+
+    def Save(self, spoiler, searchState: Tuple) -> None:
+        """Store the state of the search at the start of a round, along with the search's own progress."""
+        self.rounds.append((tuple(LogicSnapshot.CopyValue(x) for x in searchState), LogicSnapshot(spoiler)))
+
+    def Restore(self, spoiler) -> Tuple:
+        """Put the spoiler back in the state it was in at the start of the round to resume from, returning copies of the search's own progress."""
+        searchState, snapshot = self.rounds.pop()
+        self.resumeRound = None
+        snapshot.Restore(spoiler)
+        return tuple(LogicSnapshot.CopyValue(x) for x in searchState)
+
+
 class ColoredBananaGroup:
     """Stores data for each group of colored bananas."""
 
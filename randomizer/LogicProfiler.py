@@ -0,0 +1,91 @@
+"""Opt-in profiler attributing search time to individual logic rules and LogicVarHolder helpers."""
+
+from __future__ import annotations
+
+import inspect
+from functools import wraps
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from randomizer.CompileLogic import CompiledLogic
+    from randomizer.Logic import LogicVarHolder
+    from randomizer.Spoiler import Spoiler
+
+
+class LogicProfiler:
+    """Counts how often each logic rule is evaluated and how long it takes, keyed by region and target."""
+
+    def __init__(self) -> None:
+        """Initialize with given parameters."""
+        # (region, kind, target) -> [evaluations, seconds]
+        self.rules: Dict[Tuple[str, str, str], List[Any]] = {}
+        # helper name -> [calls, seconds]
+        self.helpers: Dict[str, List[Any]] = {}
+        self.helpers_instrumented = False
+
+    @staticmethod
+    def Time(stats: List[Any], func: Callable) -> Callable:
+        """Wrap a function so every call adds to the given count and time."""
+
+        @wraps(func)
+        def profiled(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats[0] += 1
+                stats[1] += perf_counter() - start
+
+        return profiled
+
+    def Instrument(self, spoiler: Spoiler, record: CompiledLogic) -> None:
+        """Wrap every rule of the spoiler, recording the unwrapped rules so RestoreLogic can put them back."""
+        restored = {id(holder) for holder, _ in record.originals}
+        for region_id, region in spoiler.RegionList.items():
+            targets = [("location", location.id.name, location) for location in region.locations]
+            targets.extend(("event", event.name.name, event) for event in region.events)
+            targets.extend(("transition", exit.dest.name, exit) for exit in region.exits)
+            if region.deathwarp is not None:
+                targets.append(("deathwarp", region.deathwarp.dest.name, region.deathwarp))
+            for index, collectible in enumerate(spoiler.CollectibleRegions.get(region_id, [])):
+                targets.append(("collectible", f"{collectible.kong.name} {collectible.type.name} #{index}", collectible))
+            for kind, target, holder in targets:
+                if id(holder) not in restored:
+                    record.originals.append((holder, holder.logic))
+                    restored.add(id(holder))
+                stats = self.rules.setdefault((region.name, kind, target), [0, 0.0])
+                holder.logic = self.Time(stats, holder.logic)
+        self.InstrumentHelpers(spoiler.LogicVariables)
+
+    def InstrumentHelpers(self, logic_variables: LogicVarHolder) -> None:
+        """Shadow each helper method of the logic variables with a timed version, so rules calling them are broken down further."""
+        if self.helpers_instrumented:
+            return
+        for name, method in inspect.getmembers(type(logic_variables), inspect.isfunction):
+            if name.startswith("__"):
+                continue
+            stats = self.helpers.setdefault(name, [0, 0.0])
+            setattr(logic_variables, name, self.Time(stats, getattr(logic_variables, name)))
+        self.helpers_instrumented = True
+
+    def Report(self, limit: int = 50) -> str:
+        """Get the rules and helpers that took the most time, ranked from slowest."""
+        lines = []
+        rules = sorted(self.rules.items(), key=lambda x: x[1][1], reverse=True)
+        total = sum(stats[1] for stats in self.rules.values())
+        lines.append(f"Logic rules: {sum(stats[0] for stats in self.rules.values())} evaluations, {total:.3f}s")
+        lines.append(f"{'seconds':>10} {'share':>7} {'evaluations':>12} {'us/eval':>9}  rule")
+        for (region, kind, target), (count, seconds) in rules[:limit]:
+            if count == 0:
+                break
+            share = seconds / total if total else 0
+            lines.append(f"{seconds:>10.4f} {share:>7.2%} {count:>12} {seconds * 1000000 / count:>9.2f}  {region} -> {kind} {target}")
+        helpers = sorted(self.helpers.items(), key=lambda x: x[1][1], reverse=True)
+        lines.append("LogicVarHolder helpers (time is also counted in the rules calling them):")
+        lines.append(f"{'seconds':>10} {'calls':>12} {'us/call':>9}  helper")
+        for name, (count, seconds) in helpers[:limit]:
+            if count == 0:
+                break
+            lines.append(f"{seconds:>10.4f} {count:>12} {seconds * 1000000 / count:>9.2f}  {name}")
+        return "\n".join(lines)
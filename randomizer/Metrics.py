@@ -0,0 +1,68 @@
+"""Timings and counters collected while generating a seed."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List
+
+if TYPE_CHECKING:
+    from randomizer.Enums.SearchMode import SearchMode
+
+try:
+    import resource
+except ImportError:
+    # Not available in the browser or on Windows
+    resource = None
+
+
+class GenerationMetrics:
+    """Wall and CPU time for each phase of generation, along with how much searching and retrying it took."""
+
+    def __init__(self) -> None:
+        """Initialize with given parameters."""
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.phase_stack: List[str] = []
+        self.searches: Dict[str, int] = {}
+        self.cached_searches = 0
+        self.fill_retries = 0
+        self.entrance_retries = 0
+
+    @contextmanager
+    def Phase(self, name: str) -> Iterator[None]:
+        """Time everything done inside this block as a phase, nested inside whichever phase is already running."""
+        self.phase_stack.append(name)
+        path = "/".join(self.phase_stack)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            phase = self.phases.setdefault(path, {"wall": 0.0, "cpu": 0.0, "count": 0})
+            phase["wall"] += time.perf_counter() - wall_start
+            phase["cpu"] += time.process_time() - cpu_start
+            phase["count"] += 1
+            self.phase_stack.pop()
+
+    def CountSearch(self, searchType: SearchMode) -> None:
+        """Count a call to GetAccessibleLocations."""
+        self.searches[searchType.name] = self.searches.get(searchType.name, 0) + 1
+
+    @staticmethod
+    def GetPeakMemory() -> int:
+        """Get the peak resident set size of this process in bytes, or 0 if it can't be measured."""
+        if resource is None:
+            return 0
+        # Linux reports this in kilobytes
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def ToDict(self) -> dict:
+        """Return the metrics in a form that can be stored as JSON."""
+        return {
+            "phases": {name: {"wall": round(phase["wall"], 4), "cpu": round(phase["cpu"], 4), "count": phase["count"]} for name, phase in self.phases.items()},
+            "searches": dict(self.searches),
+            "cached_searches": self.cached_searches,
+            "fill_retries": self.fill_retries,
+            "entrance_retries": self.entrance_retries,
+            "peak_rss": self.GetPeakMemory(),
+        }
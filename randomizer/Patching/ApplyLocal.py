@@ -26,6 +26,7 @@ from randomizer.Patching.CosmeticColors import (
 from randomizer.Patching.Hash import get_hash_images
 from randomizer.Patching.MusicRando import randomize_music
 from randomizer.Patching.Patcher import ROM
+from randomizer.RandomStreams import RandomStreams
 from randomizer.Patching.Library.Generic import recalculatePointerJSON, camelCaseToWords, getHoliday, Holidays
 from randomizer.Patching.Library.Assets import getPointerLocation, TableNames, writeText
 from randomizer.Patching.ASMPatcher import patchAssemblyCosmetic, disableDynamicReverb, fixLankyIncompatibility
@@ -111,6 +112,7 @@ async def patching_response(data, from_patch_gen=False, lanky_from_history=False
     curr_time = Datetime.now(timezone.utc)
     unix = time.mktime(curr_time.timetuple())
     random.seed(int(unix))
+    random_streams = RandomStreams(int(unix))
     split_version = version.split(".")
     patch_major = split_version[0]
     patch_minor = split_version[1]
@@ -157,7 +159,8 @@ async def patching_response(data, from_patch_gen=False, lanky_from_history=False
                 ROM_COPY.writeMultipleBytes(unc_size, 4)
         # Fetch hash images before they're altered by cosmetic changes
         loaded_hash = get_hash_images("browser", "hash")
-        apply_cosmetic_colors(settings, ROM_COPY)
+        with random_streams.Stream("cosmetics"):
+            apply_cosmetic_colors(settings, ROM_COPY)
 
         if settings.override_cosmetics:
             overwrite_object_colors(settings, ROM_COPY)
@@ -301,7 +304,8 @@ async def patching_response(data, from_patch_gen=False, lanky_from_history=False
                 ROM_COPY.writeMultipleBytes(write_data[0], 1)
 
             patchAssemblyCosmetic(ROM_COPY, settings)
-            music_data, music_names = randomize_music(settings, ROM_COPY)
+            with random_streams.Stream("music"):
+                music_data, music_names = randomize_music(settings, ROM_COPY)
             # Disable dynamic FXMix (reverb)
             # If this impacts non-BGM music in a way that produces unwanted behavior, we'll want to only apply this to BGM
             if settings.music_disable_reverb:
@@ -1,6 +1,5 @@
 """Apply Patch data to the ROM."""
 
-import json
 import os
 from datetime import datetime as Datetime
 from datetime import timezone
@@ -65,6 +64,7 @@ from randomizer.Patching.ItemRando import place_randomized_items, alterTextboxRe
 from randomizer.Patching.KasplatLocationRando import randomize_kasplat_locations
 from randomizer.Patching.KongRando import apply_kongrando_cosmetic
 from randomizer.Patching.Library.Generic import setItemReferenceName, addNewScript, IsItemSelected, getIceTrapCount, getProgHintBarrierItem, getHintRequirementBatch
+from randomizer.Patching.Library.MapData import MapData
 from randomizer.Patching.MiscSetupChanges import (
     randomize_setup,
     updateKrushaMoveNames,
@@ -147,9 +147,7 @@ def patching_response(spoiler):
     # Write date to ROM for debugging purposes
 
     dt = Datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-    temp_json = json.loads(spoiler.json)
-    temp_json["Settings"]["Generation Timestamp"] = dt
-    spoiler.json = json.dumps(temp_json, indent=4)
+    spoiler.human_spoiler["Settings"]["Generation Timestamp"] = dt
     ROM_COPY = LocalROM()
     ROM_COPY.seek(0x1FFF200)
     ROM_COPY.writeBytes(dt.encode("ascii"))
@@ -696,12 +694,16 @@ def patching_response(spoiler):
     move_bananaports(spoiler, ROM_COPY)  # Has to be before randomize_bananaport
     randomize_bananaport(spoiler, ROM_COPY)
     randomize_kasplat_locations(spoiler, ROM_COPY)
-    randomize_enemies(spoiler, ROM_COPY)
+    with spoiler.random_streams.Stream("enemies"):
+        randomize_enemies(spoiler, ROM_COPY)
     apply_kongrando_cosmetic(spoiler, ROM_COPY)
     randomize_setup(spoiler, ROM_COPY)
     randomize_puzzles(spoiler, ROM_COPY)
-    randomize_cbs(spoiler, ROM_COPY)
-    randomize_coins(spoiler, ROM_COPY)
+    # CB and coin rando both rebuild every setup, so they share one parse and write each file once
+    map_data = MapData(ROM_COPY)
+    randomize_cbs(spoiler, ROM_COPY, map_data)
+    randomize_coins(spoiler, ROM_COPY, map_data)
+    map_data.write()
     ApplyShopRandomizer(spoiler, ROM_COPY)
     showWinCondition(spoiler.settings, ROM_COPY)
     remove5DSCameraPoint(spoiler, ROM_COPY)
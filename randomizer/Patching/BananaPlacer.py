@@ -10,7 +10,7 @@ import randomizer.Lists.CBLocations.JungleJapesCBLocations
 import randomizer.Lists.CBLocations.DKIslesCBLocations
 from randomizer.Enums.Levels import Levels
 from randomizer.Patching.Library.Generic import IsItemSelected
-from randomizer.Patching.Library.Assets import getPointerLocation, TableNames
+from randomizer.Patching.Library.MapData import MapData, wordsToBytes
 from randomizer.Patching.Library.DataTypes import float_to_hex, short_to_ushort
 from randomizer.Patching.Patcher import LocalROM
 from randomizer.Lists.MapsAndExits import LevelMapTable
@@ -57,10 +57,13 @@ level_data = {
 PATH_CAP = 64
 
 
-def randomize_cbs(spoiler, ROM_COPY: LocalROM):
+def randomize_cbs(spoiler, ROM_COPY: LocalROM, map_data: MapData = None):
     """Place Colored Bananas into ROM."""
     if not spoiler.settings.cb_rando_enabled:
         return
+    write_map_data = map_data is None
+    if write_map_data:
+        map_data = MapData(ROM_COPY)
     levels_to_place = []
     for level in level_data:
         is_level_placed = IsItemSelected(spoiler.settings.cb_rando_enabled, spoiler.settings.cb_rando_list_selected, level)
@@ -77,78 +80,37 @@ def randomize_cbs(spoiler, ROM_COPY: LocalROM):
         # SETUP
         modeltwo_cbs = [0xA, 0xD, 0x16, 0x1E, 0x1F, 0x2B, 0x205, 0x206, 0x207, 0x208]
         actor_cbs = [91, 111, 112, 113, 114]
-        setup_table = getPointerLocation(TableNames.Setups, cont_map_id)
-        ROM_COPY.seek(setup_table)
-        model2_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
+        setup = map_data.getSetup(cont_map_id)
         # Model Two CBs
         persisted_m2_data = []
         used_m2_ids = []
-        for item in range(model2_count):
-            item_start = setup_table + 4 + (item * 0x30)
-            ROM_COPY.seek(item_start + 0x28)
-            item_type = int.from_bytes(ROM_COPY.readBytes(2), "big")
+        for item_data in setup.model_two:
+            item_type = int.from_bytes(item_data[0x28:0x2A], "big")
             if item_type not in modeltwo_cbs:  # Not CB
-                ROM_COPY.seek(item_start + 0x2A)
-                used_m2_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                ROM_COPY.seek(item_start)
-                item_data = []
-                for x in range(int(0x30 / 4)):
-                    item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
+                used_m2_ids.append(int.from_bytes(item_data[0x2A:0x2C], "big"))
                 persisted_m2_data.append(item_data)
-        ROM_COPY.seek(setup_table + 4 + (0x30 * model2_count))
-        mystery_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-        # Mystery
-        persisted_mys_data = []
-        for item in range(mystery_count):
-            ROM_COPY.seek(setup_table + 4 + (model2_count * 0x30) + 4 + (item * 0x24))
-            item_data = []
-            for x in range(int(0x24 / 4)):
-                item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-            persisted_mys_data.append(item_data)
-        actor_block = setup_table + 4 + (0x30 * model2_count) + 4 + (0x24 * mystery_count)
-        ROM_COPY.seek(actor_block)
-        actor_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
         # Actors
         persisted_act_data = []
         used_actor_ids = []
         remove_paths = []
-        for item in range(actor_count):
-            actor_start = actor_block + 4 + (item * 0x38)
-            ROM_COPY.seek(actor_start + 0x32)
-            actor_type = int.from_bytes(ROM_COPY.readBytes(2), "big") + 0x10
+        for item_data in setup.actors:
+            actor_type = int.from_bytes(item_data[0x32:0x34], "big") + 0x10
             if actor_type not in actor_cbs:
-                ROM_COPY.seek(actor_start + 0x34)
-                used_actor_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                ROM_COPY.seek(actor_start)
-                item_data = []
-                for x in range(int(0x38 / 4)):
-                    item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
+                used_actor_ids.append(int.from_bytes(item_data[0x34:0x36], "big"))
                 persisted_act_data.append(item_data)
             else:
-                ROM_COPY.seek(actor_start + 0x12)
-                path_id = int.from_bytes(ROM_COPY.readBytes(2), "big")
+                path_id = int.from_bytes(item_data[0x12:0x14], "big")
                 if path_id not in remove_paths:
                     remove_paths.append(path_id)
         # PATHS
-        path_table = getPointerLocation(TableNames.Paths, cont_map_id)
-        ROM_COPY.seek(path_table)
-        path_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
+        paths = map_data.getPaths(cont_map_id)
         persisted_paths = []
         used_path_ids = []
-        path_offset = 2
-        for path_index in range(path_count):
-            ROM_COPY.seek(path_table + path_offset)
-            path_id = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            point_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
+        for item_data in paths.paths:
+            path_id = int.from_bytes(item_data[0:2], "big")
             if path_id not in remove_paths:
-                path_size = 6 + (point_count * 10)
-                item_data = []
-                ROM_COPY.seek(path_table + path_offset)
-                for x in range(int(path_size / 2)):
-                    item_data.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
                 persisted_paths.append(item_data)
                 used_path_ids.append(path_id)
-            path_offset += 6 + (10 * point_count)
         # Place all new colored bananas
         new_id = 0
         act_id = 0
@@ -191,7 +153,7 @@ def randomize_cbs(spoiler, ROM_COPY: LocalROM):
                             new_id += 1
                         item_data.append((cb_item_type << 16) + found_id)
                         item_data.append((2 << 16) + 1)
-                        persisted_m2_data.append(item_data)
+                        persisted_m2_data.append(bytearray(wordsToBytes(item_data, 4)))
                 for list_item in associated_list:
                     if cb_type == "balloons" and list_item.id == new_cb["id"]:
                         # Found balloon
@@ -226,7 +188,7 @@ def randomize_cbs(spoiler, ROM_COPY: LocalROM):
                             item_data.append(0)
                         item_data.append(balloons[new_cb["kong"]] - 16)
                         item_data.append((found_actor_id << 16) + 0x6E08)
-                        persisted_act_data.append(item_data)
+                        persisted_act_data.append(bytearray(wordsToBytes(item_data, 4)))
                         # Path
                         if found_path_id < PATH_CAP:  # Crashing issues with more than PATH_CAP paths
                             item_data = []
@@ -241,31 +203,15 @@ def randomize_cbs(spoiler, ROM_COPY: LocalROM):
                                 item_data.append((1 << 8) + 0)
                             new_paths = []
                             for path in persisted_paths:
-                                if path[0] < found_path_id:
+                                if int.from_bytes(path[0:2], "big") < found_path_id:
                                     new_paths.append(path)
-                            new_paths.append(item_data)
+                            new_paths.append(bytearray(wordsToBytes(item_data, 2)))
                             for path in persisted_paths:
-                                if path[0] > found_path_id:
+                                if int.from_bytes(path[0:2], "big") > found_path_id:
                                     new_paths.append(path)
                             persisted_paths = new_paths.copy()
-        # Recompile Tables
-        # SETUP
-        ROM_COPY.seek(setup_table)
-        ROM_COPY.writeMultipleBytes(len(persisted_m2_data), 4)
-        for x in persisted_m2_data:
-            for y in x:
-                ROM_COPY.writeMultipleBytes(y, 4)
-        ROM_COPY.writeMultipleBytes(len(persisted_mys_data), 4)
-        for x in persisted_mys_data:
-            for y in x:
-                ROM_COPY.writeMultipleBytes(y, 4)
-        ROM_COPY.writeMultipleBytes(len(persisted_act_data), 4)
-        for x in persisted_act_data:
-            for y in x:
-                ROM_COPY.writeMultipleBytes(y, 4)
-        # print(f"{hex(cont_map_id)}: {hex(path_table)}")
-        ROM_COPY.seek(path_table)
-        ROM_COPY.writeMultipleBytes(len(persisted_paths), 2)
-        for x in persisted_paths:
-            for y in x:
-                ROM_COPY.writeMultipleBytes(y, 2)
+        setup.model_two = persisted_m2_data
+        setup.actors = persisted_act_data
+        paths.paths = persisted_paths
+    if write_map_data:
+        map_data.write()
@@ -1,60 +1,29 @@
 """Apply Coin Rando changes."""
 
 from randomizer.Patching.Library.DataTypes import float_to_hex
-from randomizer.Patching.Library.Assets import getPointerLocation, TableNames
+from randomizer.Patching.Library.MapData import MapData, wordsToBytes
 from randomizer.Patching.Patcher import LocalROM
 
 
-def randomize_coins(spoiler, ROM_COPY: LocalROM):
+def randomize_coins(spoiler, ROM_COPY: LocalROM, map_data: MapData = None):
     """Place Coins into ROM."""
     if spoiler.settings.coin_rando:
+        write_map_data = map_data is None
+        if write_map_data:
+            map_data = MapData(ROM_COPY)
         for cont_map_id in range(216):
             # Wipe setup and paths of Coin information
             # SETUP
             coin_items = [0x1D, 0x24, 0x23, 0x1C, 0x27]  # Has to remain in this order
-            setup_table = getPointerLocation(TableNames.Setups, cont_map_id)
-            ROM_COPY.seek(setup_table)
-            model2_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
+            setup = map_data.getSetup(cont_map_id)
             # Model Two Coins
             persisted_m2_data = []
             used_m2_ids = []
-            for item in range(model2_count):
-                item_start = setup_table + 4 + (item * 0x30)
-                ROM_COPY.seek(item_start + 0x28)
-                item_type = int.from_bytes(ROM_COPY.readBytes(2), "big")
+            for item_data in setup.model_two:
+                item_type = int.from_bytes(item_data[0x28:0x2A], "big")
                 if item_type not in coin_items:  # Not Coin
-                    ROM_COPY.seek(item_start + 0x2A)
-                    used_m2_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    ROM_COPY.seek(item_start)
-                    item_data = []
-                    for x in range(int(0x30 / 4)):
-                        item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
+                    used_m2_ids.append(int.from_bytes(item_data[0x2A:0x2C], "big"))
                     persisted_m2_data.append(item_data)
-            ROM_COPY.seek(setup_table + 4 + (0x30 * model2_count))
-            mystery_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-            # Mystery
-            persisted_mys_data = []
-            for item in range(mystery_count):
-                ROM_COPY.seek(setup_table + 4 + (model2_count * 0x30) + 4 + (item * 0x24))
-                item_data = []
-                for x in range(int(0x24 / 4)):
-                    item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                persisted_mys_data.append(item_data)
-            actor_block = setup_table + 4 + (0x30 * model2_count) + 4 + (0x24 * mystery_count)
-            ROM_COPY.seek(actor_block)
-            actor_count = int.from_bytes(ROM_COPY.readBytes(4), "big")
-            # Actors
-            persisted_act_data = []
-            used_actor_ids = []
-            for item in range(actor_count):
-                actor_start = actor_block + 4 + (item * 0x38)
-                ROM_COPY.seek(actor_start + 0x34)
-                used_actor_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                ROM_COPY.seek(actor_start)
-                item_data = []
-                for x in range(int(0x38 / 4)):
-                    item_data.append(int.from_bytes(ROM_COPY.readBytes(4), "big"))
-                persisted_act_data.append(item_data)
             # Place all new coins
             new_id = 0
             for new_coin in spoiler.coin_placements:
@@ -86,19 +55,7 @@ def randomize_coins(spoiler, ROM_COPY: LocalROM):
                             new_id += 1
                         item_data.append((coin_item_type << 16) + found_id)
                         item_data.append((2 << 16) + 1)
-                        persisted_m2_data.append(item_data)
-            # Recompile Tables
-            # SETUP
-            ROM_COPY.seek(setup_table)
-            ROM_COPY.writeMultipleBytes(len(persisted_m2_data), 4)
-            for x in persisted_m2_data:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 4)
-            ROM_COPY.writeMultipleBytes(len(persisted_mys_data), 4)
-            for x in persisted_mys_data:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 4)
-            ROM_COPY.writeMultipleBytes(len(persisted_act_data), 4)
-            for x in persisted_act_data:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 4)
+                        persisted_m2_data.append(bytearray(wordsToBytes(item_data, 4)))
+            setup.model_two = persisted_m2_data
+        if write_map_data:
+            map_data.write()
@@ -5,6 +5,7 @@ from randomizer.Settings import ColorblindMode
 from randomizer.Patching.Library.Image import (
     getRGBFromHash,
     TextureFormat,
+    encodeTexture,
     maskImage,
     getImageFile,
     getImageFromAddress,
@@ -760,17 +761,8 @@ def recolorPotions(settings, colorblind_mode: ColorblindMode, ROM_COPY: ROM):
     addr = getROMAddress(0x8003AE58, Overlay.Arcade, offset_dict)
     potion_image = getImageFromAddress(ROM_COPY, addr, 20, 20, False, 800, TextureFormat.RGBA5551)
     potion_image = maskPotionImage(potion_image, color, getPotionColor(colorblind_mode, kong))
-    px = potion_image.load()
     ROM_COPY.seek(addr)
-    for y in range(20):
-        for x in range(20):
-            px_data = px[x, y]
-            val = 1 if px_data[3] > 128 else 0
-            for c in range(3):
-                local_channel = (px_data[c] >> 3) & 0x1F
-                shift = 1 + (5 * (2 - c))
-                val |= local_channel << shift
-            ROM_COPY.writeMultipleBytes(val, 2)
+    ROM_COPY.writeBytes(encodeTexture(potion_image, TextureFormat.RGBA5551, 128))
 
 
 def maskMushroomImage(im_f, reference_image, color, side_2=False):
@@ -12,6 +12,7 @@ from randomizer.Patching.Library.Image import (
     getRandomHueShift,
     getImageFile,
     TextureFormat,
+    encodeTexture,
     hueShift,
     hueShiftImageContainer,
     maskImageWithColor,
@@ -327,18 +328,7 @@ def writeMiscCosmeticChanges(settings, ROM_COPY: ROM):
                         dims = (48, 42)
                     melon_im = getImageFile(ROM_COPY, table, img, table != 7, dims[0], dims[1], TextureFormat.RGBA5551)
                     melon_im = hueShift(melon_im, shift)
-                    melon_px = melon_im.load()
-                    bytes_array = []
-                    for y in range(dims[1]):
-                        for x in range(dims[0]):
-                            pix_data = list(melon_px[x, y])
-                            red = int((pix_data[0] >> 3) << 11)
-                            green = int((pix_data[1] >> 3) << 6)
-                            blue = int((pix_data[2] >> 3) << 1)
-                            alpha = int(pix_data[3] != 0)
-                            value = red | green | blue | alpha
-                            bytes_array.extend([(value >> 8) & 0xFF, value & 0xFF])
-                    px_data = bytearray(bytes_array)
+                    px_data = encodeTexture(melon_im, TextureFormat.RGBA5551)
                     if table != TableNames.TexturesUncompressed:
                         px_data = gzip.compress(px_data, compresslevel=9)
                     ROM_COPY.seek(getPointerLocation(table, img))
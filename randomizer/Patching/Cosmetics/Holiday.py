@@ -9,6 +9,7 @@ from randomizer.Patching.Library.Image import (
     getBonusSkinOffset,
     ExtraTextures,
     TextureFormat,
+    encodeTexture,
     maskImageWithColor,
     writeColorImageToROM,
     hueShift,
@@ -114,17 +115,7 @@ def applyCelebrationRims(ROM_COPY: ROM, hue_shift: int, enabled_bananas: list[bo
                     b_x = banana_placement[bi][1]
                     b_y = banana_placement[bi][2]
                     side_im.paste(banana, (b_x, b_y), banana)
-        side_by = []
-        side_px = side_im.load()
-        for y in range(16):
-            for x in range(32):
-                red_short = (side_px[x, y][0] >> 3) & 31
-                green_short = (side_px[x, y][1] >> 3) & 31
-                blue_short = (side_px[x, y][2] >> 3) & 31
-                alpha_short = 1 if side_px[x, y][3] > 128 else 0
-                value = (red_short << 11) | (green_short << 6) | (blue_short << 1) | alpha_short
-                side_by.extend([(value >> 8) & 0xFF, value & 0xFF])
-        px_data = bytearray(side_by)
+        px_data = encodeTexture(side_im, TextureFormat.RGBA5551, 128)
         px_data = gzip.compress(px_data, compresslevel=9)
         ROM_COPY.seek(getPointerLocation(TableNames.TexturesGeometry, img))
         ROM_COPY.writeBytes(px_data)
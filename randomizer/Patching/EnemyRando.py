@@ -436,40 +436,40 @@ def getBalancedCrownEnemyRando(spoiler, crown_setting: CrownEnemyDifficulty, dam
 def writeEnemy(spoiler, ROM_COPY: LocalROM, cont_map_spawner_address: int, new_enemy_id: int, spawner: Spawner, cont_map_id: Maps, crown_timer: int = 0):
     """Write enemy to ROM."""
     ROM_COPY.seek(cont_map_spawner_address + spawner.offset)
-    ROM_COPY.writeMultipleBytes(new_enemy_id, 1)
+    ROM_COPY.writeU8(new_enemy_id)
     # Enemy fixes
     if new_enemy_id in EnemyMetaData.keys():
         ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x10)
-        ROM_COPY.writeMultipleBytes(EnemyMetaData[new_enemy_id].aggro, 1)
+        ROM_COPY.writeU8(EnemyMetaData[new_enemy_id].aggro)
         if new_enemy_id == Enemies.RoboKremling:
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xB)
-            ROM_COPY.writeMultipleBytes(0xC8, 1)
+            ROM_COPY.writeU8(0xC8)
         elif new_enemy_id == Enemies.SpiderSmall:
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x1)
-            ROM_COPY.writeMultipleBytes(0, 1)
+            ROM_COPY.writeU8(0)
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xB)
-            ROM_COPY.writeMultipleBytes(0, 1)
+            ROM_COPY.writeU8(0)
             # Spawning fixes
             # Prevent respawn anim if that's how they initially appear
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x12)
-            init_respawn_state = int.from_bytes(ROM_COPY.readBytes(1), "big")
+            init_respawn_state = ROM_COPY.readU8()
             if init_respawn_state == 3:
                 ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x12)
-                ROM_COPY.writeMultipleBytes(0, 1)
+                ROM_COPY.writeU8(0)
             # Prevent them respawning
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x14)
-            ROM_COPY.writeMultipleBytes(0, 1)
+            ROM_COPY.writeU8(0)
         elif new_enemy_id == Enemies.Kaboom:
             # Fix their time to uh-oh timer
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xA)
-            ROM_COPY.writeMultipleBytes(140, 2)
+            ROM_COPY.writeU16(140)
 
         if (cont_map_id in crown_maps or cont_map_id in minigame_maps_total) and EnemyMetaData[new_enemy_id].air:
             height = 300
             if cont_map_id in crown_maps:
                 height = int(random.uniform(250, 300))
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x6)
-            ROM_COPY.writeMultipleBytes(height, 2)
+            ROM_COPY.writeU16(height)
         if cont_map_id in crown_maps and new_enemy_id == Enemies.GetOut:
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xA)
             get_out_timer = 20
@@ -481,8 +481,8 @@ def writeEnemy(spoiler, ROM_COPY: LocalROM, cont_map_spawner_address: int, new_e
                 get_out_timer = random.randint(int(crown_timer / (12 / damage_mult)) + 1, crown_timer - 1)
             if get_out_timer == 0:
                 get_out_timer = 1
-            ROM_COPY.writeMultipleBytes(get_out_timer, 1)
-            ROM_COPY.writeMultipleBytes(get_out_timer, 1)
+            ROM_COPY.writeU8(get_out_timer)
+            ROM_COPY.writeU8(get_out_timer)
         # Scale Adjustment
         if (EnemyMetaData[new_enemy_id].default_size is not None) and (cont_map_id not in banned_size_maps):
             scale = EnemyMetaData[new_enemy_id].default_size
@@ -496,20 +496,20 @@ def writeEnemy(spoiler, ROM_COPY: LocalROM, cont_map_spawner_address: int, new_e
                         lower_b = int(scale * 0.3)
                         upper_b = min(255, int(1.5 * scale))
                         chosen_scale = random.randint(lower_b, upper_b)
-                        ROM_COPY.writeMultipleBytes(chosen_scale, 1)
+                        ROM_COPY.writeU8(chosen_scale)
                     elif spoiler.settings.normalize_enemy_sizes:
-                        ROM_COPY.writeMultipleBytes(scale, 1)
+                        ROM_COPY.writeU8(scale)
         ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
-        default_scale = int.from_bytes(ROM_COPY.readBytes(1), "big")
+        default_scale = ROM_COPY.readU8()
         if EnemyMetaData[new_enemy_id].size_cap > 0:
             if default_scale > EnemyMetaData[new_enemy_id].size_cap:
                 ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
-                ROM_COPY.writeMultipleBytes(EnemyMetaData[new_enemy_id].size_cap, 1)
+                ROM_COPY.writeU8(EnemyMetaData[new_enemy_id].size_cap)
         ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
-        pre_size = int.from_bytes(ROM_COPY.readBytes(1), "big")
+        pre_size = ROM_COPY.readU8()
         if pre_size < EnemyMetaData[new_enemy_id].bbbarrage_min_scale and cont_map_id in bbbarrage_maps and ENABLE_BBBARRAGE_ENEMY_RANDO:
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
-            ROM_COPY.writeMultipleBytes(EnemyMetaData[new_enemy_id].bbbarrage_min_scale, 1)
+            ROM_COPY.writeU8(EnemyMetaData[new_enemy_id].bbbarrage_min_scale)
         if new_enemy_id in (Enemies.KlaptrapPurple, Enemies.KlaptrapRed) and cont_map_id == Maps.CavesDiddyLowerCabin:
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xF)
             ROM_COPY.write(75)
@@ -521,33 +521,33 @@ def writeEnemy(spoiler, ROM_COPY: LocalROM, cont_map_spawner_address: int, new_e
                 if min_speed > 0 and max_speed > 0:
                     ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xD)
                     agg_speed = random.randint(min_speed, max_speed)
-                    ROM_COPY.writeMultipleBytes(agg_speed, 1)
+                    ROM_COPY.writeU8(agg_speed)
                     ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xC)
-                    ROM_COPY.writeMultipleBytes(random.randint(min_speed, agg_speed), 1)
+                    ROM_COPY.writeU8(random.randint(min_speed, agg_speed))
         if cont_map_id in bbbarrage_maps and ENABLE_BBBARRAGE_ENEMY_RANDO:
             # Reduce Speeds
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xC)
             speeds = []
             for x in range(2):
-                speeds.append(int.from_bytes(ROM_COPY.readBytes(1), "big"))
+                speeds.append(ROM_COPY.readU8())
             ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xC)
             for x in speeds:
-                ROM_COPY.writeMultipleBytes(int(x * 0.75), 1)
+                ROM_COPY.writeU8(int(x * 0.75))
         elif cont_map_id in minigame_maps_beavers and new_enemy_id == Enemies.BeaverGold:
             for speed_offset in [0xC, 0xD]:
                 ROM_COPY.seek(cont_map_spawner_address + spawner.offset + speed_offset)
-                default_speed = int.from_bytes(ROM_COPY.readBytes(1), "big")
+                default_speed = ROM_COPY.readU8()
                 new_speed = int(default_speed * 1.1)
                 if new_speed > 255:
                     new_speed = 255
                 ROM_COPY.seek(cont_map_spawner_address + spawner.offset + speed_offset)
-                ROM_COPY.writeMultipleBytes(new_speed, 1)
+                ROM_COPY.writeU8(new_speed)
     # Fix Tiny 5DI enemy to not respawn
     ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x13)
-    id = int.from_bytes(ROM_COPY.readBytes(1), "big")
+    id = ROM_COPY.readU8()
     if cont_map_id == Maps.CavesTinyIgloo and id == 2:
         ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0x14)
-        ROM_COPY.writeMultipleBytes(0, 1)  # Disable respawning
+        ROM_COPY.writeU8(0)  # Disable respawning
 
 
 def randomize_enemies_0(spoiler):
@@ -642,18 +642,18 @@ def randomize_enemies(spoiler, ROM_COPY: LocalROM):
             cont_map_spawner_address = getPointerLocation(TableNames.Spawners, cont_map_id)
             vanilla_spawners = []
             ROM_COPY.seek(cont_map_spawner_address)
-            fence_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
+            fence_count = ROM_COPY.readU16()
             offset = 2
             if fence_count > 0:
                 for x in range(fence_count):
                     ROM_COPY.seek(cont_map_spawner_address + offset)
-                    point_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
+                    point_count = ROM_COPY.readU16()
                     offset += (point_count * 6) + 2
                     ROM_COPY.seek(cont_map_spawner_address + offset)
-                    point0_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
+                    point0_count = ROM_COPY.readU16()
                     offset += (point0_count * 10) + 6
             ROM_COPY.seek(cont_map_spawner_address + offset)
-            spawner_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
+            spawner_count = ROM_COPY.readU16()
             # Generate Enemy Swaps lists
             enemy_swaps = {}
             for enemy_class in enemy_classes:
@@ -664,12 +664,12 @@ def randomize_enemies(spoiler, ROM_COPY: LocalROM):
             offset += 2
             for _ in range(spawner_count):
                 ROM_COPY.seek(cont_map_spawner_address + offset)
-                enemy_id = int.from_bytes(ROM_COPY.readBytes(1), "big")
+                enemy_id = ROM_COPY.readU8()
                 ROM_COPY.seek(cont_map_spawner_address + offset + 0x13)
-                enemy_index = int.from_bytes(ROM_COPY.readBytes(1), "big")
+                enemy_index = ROM_COPY.readU8()
                 init_offset = offset
                 ROM_COPY.seek(cont_map_spawner_address + offset + 0x11)
-                extra_count = int.from_bytes(ROM_COPY.readBytes(1), "big")
+                extra_count = ROM_COPY.readU8()
                 offset += 0x16 + (extra_count * 2)
                 vanilla_spawners.append(Spawner(enemy_id, init_offset, enemy_index))
             if spoiler.settings.enemy_rando and cont_map_id in spoiler.enemy_rando_data:
@@ -724,7 +724,7 @@ def randomize_enemies(spoiler, ROM_COPY: LocalROM):
                         writeEnemy(spoiler, ROM_COPY, cont_map_spawner_address, new_enemy_id, spawner, cont_map_id, crown_timer)
                     elif spawner.enemy_id == Enemies.BattleCrownController:
                         ROM_COPY.seek(cont_map_spawner_address + spawner.offset + 0xB)
-                        ROM_COPY.writeMultipleBytes(crown_timer, 1)  # Determine Crown length. DK64 caps at 255 seconds
+                        ROM_COPY.writeU8(crown_timer)  # Determine Crown length. DK64 caps at 255 seconds
         if spoiler.settings.win_condition_item == WinConditionComplex.krem_kapture:
             # Pkmn snap handler
             values = [0, 0, 0, 0, 0]
@@ -776,4 +776,4 @@ def randomize_enemies(spoiler, ROM_COPY: LocalROM):
                     values[offset] |= 1 << shift
             ROM_COPY.seek(spoiler.settings.rom_data + 0x117)
             for value in values:
-                ROM_COPY.writeMultipleBytes(value, 1)
+                ROM_COPY.writeU8(value)
@@ -4,10 +4,10 @@ from randomizer.Enums.Enemies import Enemies
 from randomizer.Lists.KasplatLocations import KasplatLocationList
 from randomizer.Enums.Maps import Maps
 from randomizer.Patching.Patcher import LocalROM
-from randomizer.Patching.Library.Assets import getPointerLocation, TableNames
+from randomizer.Patching.Library.MapData import MapData, wordsToBytes
 
 
-def randomize_kasplat_locations(spoiler, ROM_COPY: LocalROM):
+def randomize_kasplat_locations(spoiler, ROM_COPY: LocalROM, map_data: MapData = None):
     """Write replaced enemies to ROM."""
     kasplat_types = [
         Enemies.KasplatDK,
@@ -39,56 +39,28 @@ def randomize_kasplat_locations(spoiler, ROM_COPY: LocalROM):
     ]
     if spoiler.settings.kasplat_rando:
         selected_kasplat_names = [name for name in spoiler.shuffled_kasplat_map.keys()]
+        write_map_data = map_data is None
+        if write_map_data:
+            map_data = MapData(ROM_COPY)
         for cont_map_id in range(216):
-            cont_map_spawner_address = getPointerLocation(TableNames.Spawners, cont_map_id)
-            ROM_COPY.seek(cont_map_spawner_address)
-            fence_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            offset = 2
+            spawner_file = map_data.getSpawners(cont_map_id)
             fence_bytes = []
             used_fence_ids = []
-            if fence_count > 0:
-                for x in range(fence_count):
-                    fence = []
-                    fence_start = cont_map_spawner_address + offset
-                    ROM_COPY.seek(cont_map_spawner_address + offset)
-                    point_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                    offset += (point_count * 6) + 2
-                    ROM_COPY.seek(cont_map_spawner_address + offset)
-                    point0_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-                    offset += (point0_count * 10) + 6
-                    fence_finish = cont_map_spawner_address + offset
-                    fence_size = fence_finish - fence_start
-                    ROM_COPY.seek(fence_finish - 4)
-                    used_fence_ids.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    ROM_COPY.seek(fence_start)
-                    for y in range(int(fence_size / 2)):
-                        fence.append(int.from_bytes(ROM_COPY.readBytes(2), "big"))
-                    fence_bytes.append(fence)
-                    ROM_COPY.seek(fence_finish)
-            spawner_count_location = cont_map_spawner_address + offset
-            ROM_COPY.seek(spawner_count_location)
-            spawner_count = int.from_bytes(ROM_COPY.readBytes(2), "big")
-            offset += 2
+            for fence in spawner_file.fences:
+                used_fence_ids.append(int.from_bytes(fence[-4:-2], "big"))
+                fence_bytes.append(fence)
             spawner_bytes = []
             used_enemy_indexes = []
-            for x in range(spawner_count):
-                ROM_COPY.seek(cont_map_spawner_address + offset)
-                enemy_id = int.from_bytes(ROM_COPY.readBytes(1), "big")
-                ROM_COPY.seek(cont_map_spawner_address + offset + 0x4)
+            for spawner in spawner_file.spawners:
+                enemy_id = spawner[0]
                 enemy_coords = []
                 for y in range(3):
-                    coord = int.from_bytes(ROM_COPY.readBytes(2), "big")
+                    coord = int.from_bytes(spawner[4 + (y * 2) : 6 + (y * 2)], "big")
                     if coord > 32767:
                         coord -= 65536
                     enemy_coords.append(coord)
-                ROM_COPY.seek(cont_map_spawner_address + offset + 0x13)
-                enemy_index = int.from_bytes(ROM_COPY.readBytes(1), "big")
+                enemy_index = spawner[0x13]
                 used_enemy_indexes.append(enemy_index)
-                init_offset = offset
-                ROM_COPY.seek(cont_map_spawner_address + offset + 0x11)
-                extra_count = int.from_bytes(ROM_COPY.readBytes(1), "big")
-                offset += 0x16 + (extra_count * 2)
-                end_offset = offset
                 is_vanilla = False
                 new_id = 0
                 for level in KasplatLocationList:
@@ -105,16 +77,9 @@ def randomize_kasplat_locations(spoiler, ROM_COPY: LocalROM):
                                 new_id = kasplat_types[kong_idx]
 
                 if enemy_id not in kasplat_types or is_vanilla or cont_map_id not in vanilla_kasplat_maps:
-                    data_bytes = []
-                    spawner_size = end_offset - init_offset
-                    ROM_COPY.seek(cont_map_spawner_address + init_offset)
-                    for x in range(spawner_size):
-                        if x == 0 and is_vanilla:
-                            data_bytes.append(new_id)
-                            ROM_COPY.seek(cont_map_spawner_address + init_offset + 1)
-                        else:
-                            data_bytes.append(int.from_bytes(ROM_COPY.readBytes(1), "big"))
-                    spawner_bytes.append(data_bytes)
+                    if is_vanilla:
+                        spawner[0] = new_id
+                    spawner_bytes.append(spawner)
             spawn_index = 1
             fence_index = 1
             for level in KasplatLocationList:
@@ -154,7 +119,7 @@ def randomize_kasplat_locations(spoiler, ROM_COPY: LocalROM):
                         data_bytes.append(spawn_index)  # Spawn Index
                         data_bytes.append(0x1E)  # Init Respawn Timer
                         data_bytes.append(0)
-                        spawner_bytes.append(data_bytes)
+                        spawner_bytes.append(bytearray(wordsToBytes(data_bytes, 1)))
                         # Fence
                         new_fence_bytes = []
                         a_0 = [kasplat.bounds[0], 0, kasplat.bounds[2]]
@@ -180,13 +145,8 @@ def randomize_kasplat_locations(spoiler, ROM_COPY: LocalROM):
                         new_fence_bytes.append(0)
                         new_fence_bytes.append(fence_index)
                         new_fence_bytes.append(1)
-                        fence_bytes.append(new_fence_bytes)
-            ROM_COPY.seek(cont_map_spawner_address)
-            ROM_COPY.writeMultipleBytes(len(fence_bytes), 2)
-            for x in fence_bytes:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 2)
-            ROM_COPY.writeMultipleBytes(len(spawner_bytes), 2)
-            for x in spawner_bytes:
-                for y in x:
-                    ROM_COPY.writeMultipleBytes(y, 1)
+                        fence_bytes.append(bytearray(wordsToBytes(new_fence_bytes, 2)))
+            spawner_file.fences = fence_bytes
+            spawner_file.spawners = spawner_bytes
+        if write_map_data:
+            map_data.write()
@@ -1,12 +1,16 @@
 """Library functions for pointer tables (Heavily WIP)."""
 
+from __future__ import annotations
+
 import js
 import zlib
 import gzip
+import os
 from typing import Dict, List, Tuple, Union
 from enum import IntEnum, auto
 from randomizer.Patching.Patcher import ROM, LocalROM
 from randomizer.Patching.Library.DataTypes import float_to_hex
+from randomizer.Patching.Library.PointerIndex import PointerTableIndex
 
 
 class TableNames(IntEnum):
@@ -122,20 +126,54 @@ class PointerTableFile:
             self.is_compressed = table_functions[table].rando_compressed
 
 
+POINTER_JSON_PATH = "./static/patches/pointer_addresses.json"
+POINTER_INDEX_PATH = "./static/patches/pointer_index.bin"
+
+pointer_index = None
+
+
+def loadPointerIndex() -> PointerTableIndex:
+    """Load the pointer table index the base hack build writes alongside the pointer tables."""
+    if os.path.exists(POINTER_JSON_PATH) and os.path.exists(POINTER_INDEX_PATH):
+        with open(POINTER_INDEX_PATH, "rb") as fh:
+            index = PointerTableIndex.FromBytes(fh.read(), os.path.getsize(POINTER_JSON_PATH))
+        if index is not None:
+            return index
+        print("pointer_index.bin doesn't match pointer_addresses.json, rebuild the base hack to write a new one")
+    # In the browser, the pointer tables are only available through js
+    return PointerTableIndex.FromTables(js.pointer_addresses)
+
+
+def getPointerIndex() -> PointerTableIndex:
+    """Get the pointer table index, loading it on first use."""
+    global pointer_index
+    if pointer_index is None:
+        pointer_index = loadPointerIndex()
+    return pointer_index
+
+
+def setPointerTables(tables: list):
+    """Replace the pointer table data, such as after reading it back out of a ROM."""
+    global pointer_index
+    js.pointer_addresses = tables
+    pointer_index = PointerTableIndex.FromTables(tables)
+
+
+def getPointerFileCount(table: TableNames) -> int:
+    """Get the amount of files in a pointer table."""
+    return len(getPointerIndex().starts[table])
+
+
 def getPointerLocation(table: TableNames, file_index: int) -> int:
     """Get the address of a pointer table file."""
-    return js.pointer_addresses[table]["entries"][file_index]["pointing_to"]
+    return getPointerIndex().starts[table][file_index]
 
 
 def getPointerFile(table: TableNames, file_index: int, is_compressed: bool = None) -> PointerTableFile:
     """Get pointer table file information."""
-    start = getPointerLocation(table, file_index)
-    if "compressed_size" in js.pointer_addresses[table]["entries"][file_index]:
-        file_size = js.pointer_addresses[table]["entries"][file_index]["compressed_size"]
-    else:
-        file_end = getPointerLocation(table, file_index + 1)
-        file_size = file_end - start
-    end = start + file_size
+    index = getPointerIndex()
+    start = index.starts[table][file_index]
+    end = start + index.getSize(table, file_index)
     return PointerTableFile(table, start, end, is_compressed)
 
 
@@ -184,14 +222,11 @@ def encodeFile(ROM_COPY: LocalROM | ROM, table: TableNames, file_index: int, dat
 
 def getRawFile(ROM_COPY: Union[ROM, LocalROM], table_index: TableNames, file_index: int, compressed: bool):
     """Get raw file from ROM."""
-    file_start = getPointerLocation(table_index, file_index)
-    if "compressed_size" in js.pointer_addresses[table_index]["entries"][file_index]:
-        file_size = js.pointer_addresses[table_index]["entries"][file_index]["compressed_size"]
-        if file_size is None:
-            return bytes(bytearray([]))
-    else:
-        file_end = getPointerLocation(table_index, file_index + 1)
-        file_size = file_end - file_start
+    index = getPointerIndex()
+    file_start = index.starts[table_index][file_index]
+    file_size = index.getSize(table_index, file_index)
+    if file_size is None:
+        return bytes(bytearray([]))
     ROM_COPY.seek(file_start)
     data = ROM_COPY.readBytes(file_size)
     if compressed:
@@ -201,12 +236,9 @@ def getRawFile(ROM_COPY: Union[ROM, LocalROM], table_index: TableNames, file_ind
 
 def writeRawFile(table_index: TableNames, file_index: int, compressed: bool, data: bytearray, ROM_COPY):
     """Write raw file from ROM."""
-    file_start = getPointerLocation(table_index, file_index)
-    if "compressed_size" in js.pointer_addresses[table_index]["entries"][file_index]:
-        file_size = js.pointer_addresses[table_index]["entries"][file_index]["compressed_size"]
-    else:
-        file_end = getPointerLocation(table_index, file_index + 1)
-        file_size = file_end - file_start
+    index = getPointerIndex()
+    file_start = index.starts[table_index][file_index]
+    file_size = index.getSize(table_index, file_index)
     write_data = bytes(data)
     if compressed:
         write_data = gzip.compress(bytes(data), compresslevel=9)
@@ -7,7 +7,6 @@ from enum import IntEnum, auto
 from typing import TYPE_CHECKING, Any, List, Union
 from functools import lru_cache
 
-import js
 import random
 import math
 from randomizer.Enums.ScriptTypes import ScriptTypes
@@ -16,7 +15,7 @@ from randomizer.Enums.Items import Items
 from randomizer.Enums.Maps import Maps
 from randomizer.Enums.Types import BarrierItems, Types
 from randomizer.Enums.Settings import HardModeSelected, MiscChangesSelected, HelmDoorItem, IceTrapFrequency, ProgressiveHintItem
-from randomizer.Patching.Library.Assets import getPointerLocation, TableNames
+from randomizer.Patching.Library.Assets import getPointerLocation, setPointerTables, TableNames
 from randomizer.Patching.Library.DataTypes import short_to_ushort
 
 if TYPE_CHECKING:
@@ -581,7 +580,7 @@ def recalculatePointerJSON(ROM_COPY: ROM):
             local_data["compressed_size"] = next_file - local_data["pointing_to"]
             table_data["entries"].append(local_data)
         new_data[x] = table_data
-    js.pointer_addresses = new_data
+    setPointerTables(new_data)
 
 
 def setItemReferenceName(spoiler, item: Items, index: int, new_name: str):
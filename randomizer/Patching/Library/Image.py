@@ -10,6 +10,7 @@ from randomizer.Patching.Patcher import ROM, LocalROM
 from randomizer.Settings import ColorblindMode
 from randomizer.Enums.Kongs import Kongs
 from randomizer.Patching.Library.Assets import getPointerLocation, TableNames
+from randomizer.Patching.Library.TextureCache import getTextureCacheKey, texture_cache
 from typing import Tuple, Union
 
 
@@ -130,42 +131,125 @@ def getBonusSkinOffset(offset: int):
     return 6026 + (3 * len(barrel_skins)) + offset
 
 
+# Lookup tables turning each byte of a texture into one channel of its pixels, so whole textures go through bytes.translate instead of a loop
+RGBA5551_RED = bytes(x & 0xF8 for x in range(256))
+RGBA5551_GREEN_HIGH = bytes((x & 7) << 5 for x in range(256))
+RGBA5551_GREEN_LOW = bytes((x >> 6) << 3 for x in range(256))
+RGBA5551_BLUE = bytes(((x >> 1) & 31) << 3 for x in range(256))
+RGBA5551_ALPHA = bytes((x & 1) * 255 for x in range(256))
+HIGH_NIBBLE = bytes(x >> 4 for x in range(256))
+LOW_NIBBLE = bytes(x & 0xF for x in range(256))
+INTENSITY_4BIT = bytes(int((x / 0xF) * 255) for x in range(16)) + bytes(240)
+IA8_INTENSITY = bytes(INTENSITY_4BIT[x >> 4] for x in range(256))
+IA8_ALPHA = bytes(INTENSITY_4BIT[x & 0xF] for x in range(256))
+IA4_INTENSITY = bytes(int(((x >> 1) / 7) * 255) for x in range(16)) + bytes(240)
+IA4_ALPHA = bytes((x & 1) * 255 for x in range(16)) + bytes(240)
+# ... and the other way round, from one channel into the bits it takes up in a texture
+ENCODE_RGBA5551_GREEN_HIGH = bytes(x >> 5 for x in range(256))
+ENCODE_RGBA5551_GREEN_LOW = bytes(((x >> 3) & 3) << 6 for x in range(256))
+ENCODE_RGBA5551_BLUE = bytes((x >> 3) << 1 for x in range(256))
+ENCODE_IA4_INTENSITY = bytes((x >> 5) << 1 for x in range(256))
+ENCODE_HIGH_NIBBLE = bytes((x << 4) & 0xF0 for x in range(256))
+ENCODE_TOP_NIBBLE = bytes(x & 0xF0 for x in range(256))
+
+
+def orBytes(*planes: bytes) -> bytes:
+    """Bitwise or byte strings of the same length together."""
+    value = 0
+    for plane in planes:
+        value |= int.from_bytes(plane, "big")
+    return value.to_bytes(len(planes[0]), "big")
+
+
+def interleaveBytes(*planes: bytes) -> bytearray:
+    """Interleave byte strings of the same length, taking one byte from each in turn."""
+    output = bytearray(len(planes[0]) * len(planes))
+    for index, plane in enumerate(planes):
+        output[index :: len(planes)] = plane
+    return output
+
+
+def splitNibbles(data: bytes) -> bytearray:
+    """Split each byte into two, high nibble first."""
+    return interleaveBytes(data.translate(HIGH_NIBBLE), data.translate(LOW_NIBBLE))
+
+
+def packNibbles(data: bytes) -> bytes:
+    """Pack pairs of nibbles into bytes, high nibble first, dropping a nibble left without a pair."""
+    pair_count = len(data) >> 1
+    return orBytes(data[0 : pair_count * 2 : 2].translate(ENCODE_HIGH_NIBBLE), data[1 : pair_count * 2 : 2])
+
+
+def alphaBitTable(alpha_threshold: int) -> bytes:
+    """Get the table turning an alpha channel into a single alpha bit, set when the pixel is more opaque than the threshold."""
+    return bytes(int(x > alpha_threshold) for x in range(256))
+
+
+def decodeTexture(data: bytes, width: int, height: int, format: TextureFormat):
+    """Decode raw texture data into an RGBA image."""
+    size = (width, height)
+    px_count = width * height
+    if format == TextureFormat.RGBA32:
+        return Image.frombytes("RGBA", size, bytes(data[: px_count * 4]).ljust(px_count * 4, b"\x00"))
+    if format == TextureFormat.RGBA5551:
+        data = bytes(data[: px_count * 2]).ljust(px_count * 2, b"\x00")
+        high = data[0::2]
+        low = data[1::2]
+        channels = (
+            high.translate(RGBA5551_RED),
+            orBytes(high.translate(RGBA5551_GREEN_HIGH), low.translate(RGBA5551_GREEN_LOW)),
+            low.translate(RGBA5551_BLUE),
+            low.translate(RGBA5551_ALPHA),
+        )
+    elif format in (TextureFormat.IA8, TextureFormat.I8):
+        data = bytes(data[:px_count]).ljust(px_count, b"\x00")
+        if format == TextureFormat.IA8:
+            intensity = data.translate(IA8_INTENSITY)
+            channels = (intensity, intensity, intensity, data.translate(IA8_ALPHA))
+        else:
+            channels = (data, data, data, data)
+    elif format in (TextureFormat.IA4, TextureFormat.I4):
+        data = bytes(splitNibbles(data)[:px_count]).ljust(px_count, b"\x00")
+        if format == TextureFormat.IA4:
+            intensity = data.translate(IA4_INTENSITY)
+            channels = (intensity, intensity, intensity, data.translate(IA4_ALPHA))
+        else:
+            intensity = data.translate(INTENSITY_4BIT)
+            channels = (intensity, intensity, intensity, intensity)
+    else:
+        raise Exception(f"Unhandled Codec: {format}")
+    return Image.merge("RGBA", [Image.frombytes("L", size, channel) for channel in channels])
+
+
+def encodeTexture(im_f, format: TextureFormat, alpha_threshold: int = 0) -> bytearray:
+    """Encode an image into raw texture data, giving formats with a single alpha bit an opaque pixel wherever alpha is over the threshold."""
+    if im_f.mode != "RGBA":
+        im_f = im_f.convert("RGBA")
+    if format == TextureFormat.RGBA32:
+        return bytearray(im_f.tobytes())
+    red, green, blue, alpha = (channel.tobytes() for channel in im_f.split())
+    if format == TextureFormat.RGBA5551:
+        high = orBytes(red.translate(RGBA5551_RED), green.translate(ENCODE_RGBA5551_GREEN_HIGH))
+        low = orBytes(green.translate(ENCODE_RGBA5551_GREEN_LOW), blue.translate(ENCODE_RGBA5551_BLUE), alpha.translate(alphaBitTable(alpha_threshold)))
+        return interleaveBytes(high, low)
+    if format == TextureFormat.IA8:
+        return bytearray(orBytes(red.translate(ENCODE_TOP_NIBBLE), alpha.translate(HIGH_NIBBLE)))
+    if format == TextureFormat.I8:
+        return bytearray(red)
+    if format == TextureFormat.IA4:
+        return bytearray(packNibbles(orBytes(red.translate(ENCODE_IA4_INTENSITY), alpha.translate(alphaBitTable(alpha_threshold)))))
+    if format == TextureFormat.I4:
+        return bytearray(packNibbles(red.translate(HIGH_NIBBLE)))
+    raise Exception(f"Unhandled Codec: {format}")
+
+
 def getImageFromAddress(ROM_COPY: Union[LocalROM, ROM], rom_address: int, width: int, height: int, compressed: bool, file_size: int, format: TextureFormat):
     """Get image from a ROM address."""
     ROM_COPY.seek(rom_address)
     data = ROM_COPY.readBytes(file_size)
     if compressed:
         data = zlib.decompress(data, (15 + 32))
-    im_f = Image.new(mode="RGBA", size=(width, height))
-    pix = im_f.load()
-    for y in range(height):
-        for x in range(width):
-            if format == TextureFormat.RGBA32:
-                offset = ((y * width) + x) * 4
-                pix_data = int.from_bytes(data[offset : offset + 4], "big")
-                red = (pix_data >> 24) & 0xFF
-                green = (pix_data >> 16) & 0xFF
-                blue = (pix_data >> 8) & 0xFF
-                alpha = pix_data & 0xFF
-            elif format == TextureFormat.RGBA5551:
-                offset = ((y * width) + x) * 2
-                pix_data = int.from_bytes(data[offset : offset + 2], "big")
-                red = ((pix_data >> 11) & 31) << 3
-                green = ((pix_data >> 6) & 31) << 3
-                blue = ((pix_data >> 1) & 31) << 3
-                alpha = (pix_data & 1) * 255
-            elif format == TextureFormat.IA8:
-                offset = (y * width) + x
-                pix_data = int.from_bytes(data[offset : offset + 1], "big")
-                intensity = int(((pix_data >> 4) / 0xF) * 255)
-                alpha = int(((pix_data & 0xF) / 0xF) * 255)
-                red = intensity
-                green = intensity
-                blue = intensity
-            else:
-                raise Exception(f"Unhandled Codec: {format}")
-            pix[x, y] = (red, green, blue, alpha)
-    return im_f
+    return decodeTexture(data, width, height, format)
 
 
 def getImageFile(ROM_COPY: Union[LocalROM, ROM], table_index: TableNames, file_index: int, compressed: bool, width: int, height: int, format: TextureFormat):
@@ -176,6 +260,13 @@ def getImageFile(ROM_COPY: Union[LocalROM, ROM], table_index: TableNames, file_i
     return getImageFromAddress(ROM_COPY, file_start, width, height, compressed, file_size, format)
 
 
+def readImageFile(ROM_COPY: Union[LocalROM, ROM], table_index: TableNames, file_index: int) -> bytes:
+    """Read an image file as it's stored in the ROM."""
+    file_start = getPointerLocation(table_index, file_index)
+    ROM_COPY.seek(file_start)
+    return ROM_COPY.readBytes(getPointerLocation(table_index, file_index + 1) - file_start)
+
+
 def getRandomHueShift(min: int = -359, max: int = 359) -> int:
     """Get random hue shift."""
     return random.randint(min, max)
@@ -183,23 +274,12 @@ def getRandomHueShift(min: int = -359, max: int = 359) -> int:
 
 def hueShift(im, amount: int):
     """Apply a hue shift on an image."""
-    hsv_im = im.convert("HSV")
-    im_px = im.load()
-    w, h = hsv_im.size
-    hsv_px = hsv_im.load()
     amount = int(amount * (256 / 360))  # Truncate to within 256
-    for y in range(h):
-        for x in range(w):
-            old = list(hsv_px[x, y]).copy()
-            old[0] = (old[0] + amount) % 256
-            hsv_px[x, y] = (old[0], old[1], old[2])
-    rgb_im = hsv_im.convert("RGB")
-    rgb_px = rgb_im.load()
-    for y in range(h):
-        for x in range(w):
-            new = list(rgb_px[x, y])
-            new.append(list(im_px[x, y])[3])
-            im_px[x, y] = (new[0], new[1], new[2], new[3])
+    hue, sat, val = im.convert("HSV").split()
+    hue = hue.point([(x + amount) % 256 for x in range(256)])
+    shifted_im = Image.merge("HSV", (hue, sat, val)).convert("RGB")
+    shifted_im.putalpha(im.getchannel("A"))
+    im.paste(shifted_im)
     return im
 
 
@@ -212,23 +292,14 @@ def hueShiftImageFromAddress(ROM_COPY: Union[ROM, LocalROM], address: int, width
     data_size_per_px = size_per_px.get(format, None)
     if data_size_per_px is None:
         raise Exception(f"Texture Format unsupported by this function. Let the devs know if you see this. Attempted format: {format.name}")
-    loaded_im = getImageFromAddress(ROM_COPY, address, width, height, False, data_size_per_px * width * height, format)
-    loaded_im = hueShift(loaded_im, shift)
-    loaded_px = loaded_im.load()
-    bytes_array = []
-    for y in range(height):
-        for x in range(width):
-            pix_data = list(loaded_px[x, y])
-            if format == TextureFormat.RGBA32:
-                bytes_array.extend(pix_data)
-            elif format == TextureFormat.RGBA5551:
-                red = int((pix_data[0] >> 3) << 11)
-                green = int((pix_data[1] >> 3) << 6)
-                blue = int((pix_data[2] >> 3) << 1)
-                alpha = int(pix_data[3] != 0)
-                value = red | green | blue | alpha
-                bytes_array.extend([(value >> 8) & 0xFF, value & 0xFF])
-    px_data = bytearray(bytes_array)
+    ROM_COPY.seek(address)
+    source = ROM_COPY.readBytes(data_size_per_px * width * height)
+    key = getTextureCacheKey(source, "hueShiftImageFromAddress", width, height, int(format), shift)
+    px_data = texture_cache.get(key)
+    if px_data is None:
+        loaded_im = hueShift(decodeTexture(source, width, height, format), shift)
+        px_data = encodeTexture(loaded_im, format)
+        texture_cache.store(key, px_data)
     ROM_COPY.seek(address)
     ROM_COPY.writeBytes(px_data)
 
@@ -304,60 +375,40 @@ def writeColorImageToROM(im_f, table_index: TableNames, file_index: int, width:
     file_start = getPointerLocation(table_index, file_index)
     file_end = getPointerLocation(table_index, file_index + 1)
     file_size = file_end - file_start
-    ROM_COPY.seek(file_start)
-    pix = im_f.load()
     width, height = im_f.size
-    bytes_array = []
-    border = 1
-    right_border = 3
-    for y in range(height):
-        for x in range(width):
-            if transparent_border:
-                if ((x < border) or (y < border) or (x >= (width - border)) or (y >= (height - border))) or (x == (width - right_border)):
-                    pix_data = [0, 0, 0, 0]
-                else:
-                    pix_data = list(pix[x, y])
-            else:
-                pix_data = list(pix[x, y])
-            if format == TextureFormat.RGBA32:
-                bytes_array.extend(pix_data)
-            elif format == TextureFormat.RGBA5551:
-                red = int((pix_data[0] >> 3) << 11)
-                green = int((pix_data[1] >> 3) << 6)
-                blue = int((pix_data[2] >> 3) << 1)
-                alpha = int(pix_data[3] != 0)
-                value = red | green | blue | alpha
-                bytes_array.extend([(value >> 8) & 0xFF, value & 0xFF])
-            elif format == TextureFormat.IA4:
-                intensity = pix_data[0] >> 5
-                alpha = 0 if pix_data[3] == 0 else 1
-                data = ((intensity << 1) | alpha) & 0xF
-                bytes_array.append(data)
-    bytes_per_px = 2
-    if format == TextureFormat.IA4:
-        temp_ba = bytes_array.copy()
-        bytes_array = []
-        value_storage = 0
-        bytes_per_px = 0.5
-        for idx, val in enumerate(temp_ba):
-            polarity = idx % 2
-            if polarity == 0:
-                value_storage = val << 4
-            else:
-                value_storage |= val
-                bytes_array.append(value_storage)
-    data = bytearray(bytes_array)
-    if format == TextureFormat.RGBA32:
-        bytes_per_px = 4
-    if len(data) > (bytes_per_px * width * height):
-        print(f"Image too big error: {table_index} > {file_index}")
-    if table_index in (14, 25):
-        data = gzip.compress(data, compresslevel=9)
+    compressed = table_index in (14, 25)
+    key = getTextureCacheKey(im_f.tobytes(), "writeColorImageToROM", im_f.mode, width, height, transparent_border, int(format), compressed)
+    data = texture_cache.get(key)
+    if data is None:
+        data = encodeColorImage(im_f, transparent_border, format, compressed)
+        texture_cache.store(key, data)
     if len(data) > file_size:
         print(f"File too big error: {table_index} > {file_index}")
+    ROM_COPY.seek(file_start)
     ROM_COPY.writeBytes(data)
 
 
+def encodeColorImage(im_f, transparent_border: bool, format: TextureFormat, compressed: bool) -> bytes:
+    """Encode a texture the way writeColorImageToROM writes it."""
+    width, height = im_f.size
+    if transparent_border:
+        border = 1
+        right_border = 3
+        im_f = im_f.convert("RGBA")
+        for box in (
+            (0, 0, width, border),
+            (0, height - border, width, height),
+            (0, 0, border, height),
+            (width - border, 0, width, height),
+            (width - right_border, 0, width - right_border + 1, height),
+        ):
+            im_f.paste((0, 0, 0, 0), box)
+    data = encodeTexture(im_f, format)
+    if compressed:
+        data = gzip.compress(data, compresslevel=9)
+    return data
+
+
 def getNumberImage(number: int, ROM_COPY: Union[LocalROM, ROM]):
     """Get Number Image from number."""
     if number < 5:
@@ -426,6 +477,10 @@ def getRGBFromHash(hash: str):
 
 def maskImageWithColor(im_f: Image, mask: tuple):
     """Apply rgb mask to image using a rgb color tuple."""
+    key = getTextureCacheKey(im_f.tobytes(), "maskImageWithColor", im_f.mode, im_f.size, tuple(mask))
+    data = texture_cache.get(key)
+    if data is not None:
+        return Image.frombytes(im_f.mode, im_f.size, data)
     w, h = im_f.size
     converter = ImageEnhance.Color(im_f)
     im_f = converter.enhance(0)
@@ -442,6 +497,7 @@ def maskImageWithColor(im_f: Image, mask: tuple):
                 for channel in range(3):
                     base[channel] = int(mask[channel] * (base[channel] / 255))
                 pix[x, y] = (base[0], base[1], base[2], base[3])
+    texture_cache.store(key, im_f.tobytes())
     return im_f
 
 
@@ -466,6 +522,11 @@ def getKongItemColor(mode: ColorblindMode, kong: Kongs, output_as_list: bool = F
 
 def maskImage(im_f, base_index, min_y, keep_dark=False, mode=ColorblindMode.off):
     """Apply RGB mask to image."""
+    mask = getKongItemColor(mode, base_index, True)
+    key = getTextureCacheKey(im_f.tobytes(), "maskImage", im_f.mode, im_f.size, tuple(mask), min_y, keep_dark)
+    data = texture_cache.get(key)
+    if data is not None:
+        return Image.frombytes(im_f.mode, im_f.size, data)
     w, h = im_f.size
     converter = ImageEnhance.Color(im_f)
     im_f = converter.enhance(0)
@@ -475,7 +536,6 @@ def maskImage(im_f, base_index, min_y, keep_dark=False, mode=ColorblindMode.off)
         im_dupe = brightener.enhance(2)
     im_f.paste(im_dupe, (0, min_y), im_dupe)
     pix = im_f.load()
-    mask = getKongItemColor(mode, base_index, True)
     w, h = im_f.size
     for x in range(w):
         for y in range(min_y, h):
@@ -484,30 +544,23 @@ def maskImage(im_f, base_index, min_y, keep_dark=False, mode=ColorblindMode.off)
                 for channel in range(3):
                     base[channel] = int(mask[channel] * (base[channel] / 255))
                 pix[x, y] = (base[0], base[1], base[2], base[3])
+    texture_cache.store(key, im_f.tobytes())
     return im_f
 
 
 def hueShiftImageContainer(table: int, image: int, width: int, height: int, format: TextureFormat, shift: int, ROM_COPY: ROM):
     """Load an image, shift the hue and rewrite it back to ROM."""
-    loaded_im = getImageFile(ROM_COPY, table, image, table != 7, width, height, format)
-    loaded_im = hueShift(loaded_im, shift)
-    loaded_px = loaded_im.load()
-    bytes_array = []
-    for y in range(height):
-        for x in range(width):
-            pix_data = list(loaded_px[x, y])
-            if format == TextureFormat.RGBA32:
-                bytes_array.extend(pix_data)
-            elif format == TextureFormat.RGBA5551:
-                red = int((pix_data[0] >> 3) << 11)
-                green = int((pix_data[1] >> 3) << 6)
-                blue = int((pix_data[2] >> 3) << 1)
-                alpha = int(pix_data[3] != 0)
-                value = red | green | blue | alpha
-                bytes_array.extend([(value >> 8) & 0xFF, value & 0xFF])
-    px_data = bytearray(bytes_array)
-    if table != 7:
-        px_data = gzip.compress(px_data, compresslevel=9)
+    compressed = table != 7
+    source = readImageFile(ROM_COPY, table, image)
+    key = getTextureCacheKey(source, "hueShiftImageContainer", compressed, width, height, int(format), shift)
+    px_data = texture_cache.get(key)
+    if px_data is None:
+        data = zlib.decompress(source, (15 + 32)) if compressed else source
+        loaded_im = hueShift(decodeTexture(data, width, height, format), shift)
+        px_data = encodeTexture(loaded_im, format)
+        if compressed:
+            px_data = gzip.compress(px_data, compresslevel=9)
+        texture_cache.store(key, px_data)
     ROM_COPY.seek(getPointerLocation(table, image))
     ROM_COPY.writeBytes(px_data)
 
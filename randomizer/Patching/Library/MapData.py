@@ -0,0 +1,164 @@
+"""Parsed setup, path and spawner files of each map, shared between the patch stages that rewrite them."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple, Union
+
+from randomizer.Patching.Library.Assets import TableNames, getPointerLocation
+from randomizer.Patching.Patcher import LocalROM
+
+SETUP_MODEL_TWO_SIZE = 0x30
+SETUP_MYSTERY_SIZE = 0x24
+SETUP_ACTOR_SIZE = 0x38
+PATH_HEADER_SIZE = 6
+PATH_POINT_SIZE = 10
+SPAWNER_SIZE = 0x16
+
+
+def readRecord(ROM_COPY: LocalROM, size: int) -> bytearray:
+    """Read a record from the current position, treating anything past the end of the ROM as zeroes."""
+    record = bytearray(ROM_COPY.readSlice(size))
+    if len(record) < size:
+        record.extend(bytes(size - len(record)))
+    return record
+
+
+def wordsToBytes(words: List[int], word_size: int) -> bytes:
+    """Pack a list of values into big endian words of the given size, cutting each value down to its lowest bytes."""
+    mask = (1 << (8 * word_size)) - 1
+    return b"".join((word & mask).to_bytes(word_size, "big") for word in words)
+
+
+class SetupFile:
+    """The model two objects, mystery data and actors of a map setup, each held as the raw bytes of one entry."""
+
+    def __init__(self, model_two: List[bytearray], mystery: List[bytearray], actors: List[bytearray]):
+        """Initialize with given parameters."""
+        self.model_two = model_two
+        self.mystery = mystery
+        self.actors = actors
+
+    @staticmethod
+    def Read(ROM_COPY: LocalROM, start: int) -> SetupFile:
+        """Read a setup file from the ROM."""
+        ROM_COPY.seek(start)
+        blocks = []
+        for record_size in (SETUP_MODEL_TWO_SIZE, SETUP_MYSTERY_SIZE, SETUP_ACTOR_SIZE):
+            count = ROM_COPY.readU32()
+            data = readRecord(ROM_COPY, count * record_size)
+            blocks.append([data[x * record_size : (x + 1) * record_size] for x in range(count)])
+        return SetupFile(*blocks)
+
+    def ToBytes(self) -> bytes:
+        """Encode the setup file."""
+        chunks = []
+        for block in (self.model_two, self.mystery, self.actors):
+            chunks.append(len(block).to_bytes(4, "big"))
+            chunks.extend(block)
+        return b"".join(chunks)
+
+
+class PathFile:
+    """The paths of a map, each held as the raw bytes of its header and points."""
+
+    def __init__(self, paths: List[bytearray]):
+        """Initialize with given parameters."""
+        self.paths = paths
+
+    @staticmethod
+    def Read(ROM_COPY: LocalROM, start: int) -> PathFile:
+        """Read a path file from the ROM."""
+        ROM_COPY.seek(start)
+        paths = []
+        for _ in range(ROM_COPY.readU16()):
+            path = readRecord(ROM_COPY, PATH_HEADER_SIZE)
+            point_count = int.from_bytes(path[2:4], "big")
+            path.extend(readRecord(ROM_COPY, point_count * PATH_POINT_SIZE))
+            paths.append(path)
+        return PathFile(paths)
+
+    def ToBytes(self) -> bytes:
+        """Encode the path file."""
+        return len(self.paths).to_bytes(2, "big") + b"".join(self.paths)
+
+
+class SpawnerFile:
+    """The fences and enemy spawners of a map, each held as the raw bytes of one entry."""
+
+    def __init__(self, fences: List[bytearray], spawners: List[bytearray]):
+        """Initialize with given parameters."""
+        self.fences = fences
+        self.spawners = spawners
+
+    @staticmethod
+    def Read(ROM_COPY: LocalROM, start: int) -> SpawnerFile:
+        """Read a spawner file from the ROM."""
+        ROM_COPY.seek(start)
+        fences = []
+        for _ in range(ROM_COPY.readU16()):
+            fence = readRecord(ROM_COPY, 2)
+            fence.extend(readRecord(ROM_COPY, int.from_bytes(fence[0:2], "big") * 6))
+            point0_count = readRecord(ROM_COPY, 2)
+            fence.extend(point0_count)
+            fence.extend(readRecord(ROM_COPY, (int.from_bytes(point0_count, "big") * 10) + 4))
+            fences.append(fence)
+        spawners = []
+        for _ in range(ROM_COPY.readU16()):
+            spawner = readRecord(ROM_COPY, SPAWNER_SIZE)
+            spawner.extend(readRecord(ROM_COPY, spawner[0x11] * 2))
+            spawners.append(spawner)
+        return SpawnerFile(fences, spawners)
+
+    def ToBytes(self) -> bytes:
+        """Encode the spawner file."""
+        return len(self.fences).to_bytes(2, "big") + b"".join(self.fences) + len(self.spawners).to_bytes(2, "big") + b"".join(self.spawners)
+
+
+file_readers = {
+    TableNames.Setups: SetupFile.Read,
+    TableNames.Paths: PathFile.Read,
+    TableNames.Spawners: SpawnerFile.Read,
+}
+
+
+class MapData:
+    """Setup, path and spawner files parsed on first use and shared by every stage given the same instance.
+
+    Stages change the parsed files in place, and write sends back only the files which no longer encode to what was read.
+    Only the parsed blocks are written, anything the ROM holds after them is left where it is.
+    Nothing else may touch these files in the ROM between the first read and write.
+    """
+
+    def __init__(self, ROM_COPY: LocalROM):
+        """Initialize with given parameters."""
+        self.ROM_COPY = ROM_COPY
+        self.files: Dict[Tuple[TableNames, int], Tuple[Union[SetupFile, PathFile, SpawnerFile], bytes]] = {}
+
+    def getFile(self, table: TableNames, map_id: int) -> Union[SetupFile, PathFile, SpawnerFile]:
+        """Get the parsed file of a map, reading it from the ROM the first time it's asked for."""
+        key = (table, map_id)
+        if key not in self.files:
+            parsed = file_readers[table](self.ROM_COPY, getPointerLocation(table, map_id))
+            self.files[key] = (parsed, parsed.ToBytes())
+        return self.files[key][0]
+
+    def getSetup(self, map_id: int) -> SetupFile:
+        """Get the parsed setup file of a map."""
+        return self.getFile(TableNames.Setups, map_id)
+
+    def getPaths(self, map_id: int) -> PathFile:
+        """Get the parsed path file of a map."""
+        return self.getFile(TableNames.Paths, map_id)
+
+    def getSpawners(self, map_id: int) -> SpawnerFile:
+        """Get the parsed spawner file of a map."""
+        return self.getFile(TableNames.Spawners, map_id)
+
+    def write(self):
+        """Write every file that has changed back to the ROM, after which the ROM is the only copy again."""
+        for (table, map_id), (parsed, original) in self.files.items():
+            data = parsed.ToBytes()
+            if data != original:
+                self.ROM_COPY.seek(getPointerLocation(table, map_id))
+                self.ROM_COPY.writeBytes(data)
+        self.files = {}
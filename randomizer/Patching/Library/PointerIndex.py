@@ -0,0 +1,98 @@
+"""Binary index of the pointer tables, written by the base hack build alongside pointer_addresses.json.
+
+This only depends on the standard library, so the build scripts can write the index without importing the rest of the randomizer.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import Any, List, Optional
+
+# Magic, byte size of the pointer_addresses.json the index was written alongside and the number of tables
+POINTER_INDEX_HEADER = struct.Struct("<8sQI")
+POINTER_INDEX_MAGIC = b"DK64PTRI"
+# Stands in for files that have no size
+NO_FILE_SIZE = -1
+
+
+class PointerTableIndex:
+    """Start and size of every pointer table file, held in flat arrays so finding a file is a pair of index operations."""
+
+    def __init__(self, starts: List[array], sizes: List[array]):
+        """Initialize with given parameters."""
+        self.starts = starts
+        self.sizes = sizes
+
+    @staticmethod
+    def FromTables(tables: Any) -> PointerTableIndex:
+        """Build an index from pointer table data laid out like pointer_addresses.json."""
+        starts = []
+        sizes = []
+        for table in tables:
+            entries = table["entries"]
+            table_starts = array("q", [entry["pointing_to"] for entry in entries])
+            table_sizes = array("q")
+            for file_index, entry in enumerate(entries):
+                if "compressed_size" in entry:
+                    file_size = entry["compressed_size"]
+                elif file_index + 1 < len(entries):
+                    file_size = table_starts[file_index + 1] - table_starts[file_index]
+                else:
+                    file_size = None
+                table_sizes.append(NO_FILE_SIZE if file_size is None else file_size)
+            starts.append(table_starts)
+            sizes.append(table_sizes)
+        return PointerTableIndex(starts, sizes)
+
+    @staticmethod
+    def FromBytes(data: bytes, source_size: int) -> Optional[PointerTableIndex]:
+        """Load an index written by ToBytes, or None if it wasn't written alongside a pointer_addresses.json of the given size."""
+        if len(data) < POINTER_INDEX_HEADER.size:
+            return None
+        magic, size, table_count = POINTER_INDEX_HEADER.unpack_from(data)
+        if magic != POINTER_INDEX_MAGIC or size != source_size:
+            return None
+        offset = POINTER_INDEX_HEADER.size
+        values_offset = offset + (4 * table_count)
+        if len(data) < values_offset:
+            return None
+        counts = array("I")
+        counts.frombytes(data[offset:values_offset])
+        if sys.byteorder == "big":
+            counts.byteswap()
+        # A file cut short still has a valid header, so make sure every table's starts and sizes are there
+        values = array("q")
+        if len(data) - values_offset != values.itemsize * 2 * sum(counts):
+            return None
+        values.frombytes(data[values_offset:])
+        if sys.byteorder == "big":
+            values.byteswap()
+        starts = []
+        sizes = []
+        position = 0
+        for count in counts:
+            starts.append(values[position : position + count])
+            sizes.append(values[position + count : position + (2 * count)])
+            position += 2 * count
+        return PointerTableIndex(starts, sizes)
+
+    def ToBytes(self, source_size: int) -> bytes:
+        """Encode the index, tagged with the byte size of the pointer_addresses.json it's written alongside."""
+        counts = array("I", [len(table_starts) for table_starts in self.starts])
+        values = array("q")
+        for table_starts, table_sizes in zip(self.starts, self.sizes):
+            values.extend(table_starts)
+            values.extend(table_sizes)
+        if sys.byteorder == "big":
+            counts.byteswap()
+            values.byteswap()
+        return POINTER_INDEX_HEADER.pack(POINTER_INDEX_MAGIC, source_size, len(counts)) + counts.tobytes() + values.tobytes()
+
+    def getSize(self, table: int, file_index: int) -> Optional[int]:
+        """Get the size of a pointer table file, or None if it has no size."""
+        file_size = self.sizes[table][file_index]
+        if file_size == NO_FILE_SIZE:
+            return None
+        return file_size
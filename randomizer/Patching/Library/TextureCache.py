@@ -0,0 +1,131 @@
+"""Cache of transformed textures, so cosmetic work repeated across seeds is copied instead of recomputed.
+
+Entries are keyed by a hash of the texture being transformed along with a description of the transform,
+so an entry is only ever used for the exact input and transform that produced it.
+Recently used entries are kept in memory, and if TEXTURE_CACHE_DIR is set, also written to that directory so they outlive the process.
+The memory cache only lasts as long as the process, and the worker runs each seed in a freshly forked process which starts with it empty,
+so there it only saves repeating a transform within the same seed. Anything shared across seeds comes from the directory.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Optional
+
+# Bump whenever a cached transform changes its output, so entries made by the old code are never used
+TEXTURE_CACHE_VERSION = 1
+TEXTURE_CACHE_EXTENSION = ".tex"
+# Share of the directory's size a trim leaves it at, so the next few writes don't each have to list the directory again
+TEXTURE_CACHE_TRIM_TO = 0.9
+
+
+def getTextureCacheKey(source: bytes, *descriptor) -> str:
+    """Get the key of a transform, built from the texture it starts from and everything else its output depends on."""
+    hasher = hashlib.sha1(source)
+    hasher.update(repr((TEXTURE_CACHE_VERSION,) + descriptor).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class TextureCache:
+    """A least recently used cache of transformed textures, bounded in memory and optionally on disk."""
+
+    def __init__(self, memory_size: int, directory: Optional[str] = None, disk_size: int = 0):
+        """Initialize with given parameters, with both sizes in bytes."""
+        self.memory_size = memory_size
+        self.directory = directory
+        self.disk_size = disk_size
+        self.entries: OrderedDict[str, bytes] = OrderedDict()
+        self.memory_used = 0
+        # Bytes the directory held when last counted plus everything written since, worked out the first time it's needed
+        self.disk_used = None
+        self.hits = 0
+        self.misses = 0
+
+    def getPath(self, key: str) -> str:
+        """Get the path of an entry on disk."""
+        return os.path.join(self.directory, key + TEXTURE_CACHE_EXTENSION)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached texture, or None if it isn't cached."""
+        data = self.entries.get(key)
+        if data is not None:
+            self.entries.move_to_end(key)
+        elif self.directory is not None:
+            try:
+                with open(self.getPath(key), "rb") as fh:
+                    data = fh.read()
+                # Entries on disk are evicted oldest first, so mark this one as just used
+                os.utime(self.getPath(key))
+            except OSError:
+                data = None
+            if data is not None:
+                self.storeInMemory(key, data)
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    def store(self, key: str, data: bytes) -> None:
+        """Cache a transformed texture."""
+        data = bytes(data)
+        self.storeInMemory(key, data)
+        if self.directory is not None:
+            self.storeOnDisk(key, data)
+
+    def storeInMemory(self, key: str, data: bytes) -> None:
+        """Keep a texture in memory, evicting the least recently used textures to make room for it."""
+        if len(data) > self.memory_size:
+            return
+        if key in self.entries:
+            self.memory_used -= len(self.entries.pop(key))
+        self.entries[key] = data
+        self.memory_used += len(data)
+        while self.memory_used > self.memory_size:
+            self.memory_used -= len(self.entries.popitem(last=False)[1])
+
+    def storeOnDisk(self, key: str, data: bytes) -> None:
+        """Write a texture to the cache directory, evicting the least recently used files once the directory goes over its size."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Other processes may share the directory, so never leave a partly written entry under its real name
+            temp_path = f"{self.getPath(key)}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as fh:
+                fh.write(data)
+            os.replace(temp_path, self.getPath(key))
+        except OSError:
+            return
+        if self.disk_used is not None:
+            self.disk_used += len(data)
+        if self.disk_used is None or self.disk_used > self.disk_size:
+            self.trimDisk()
+
+    def trimDisk(self) -> None:
+        """Delete the least recently used files in the cache directory until it's back down to the share of its size a trim leaves it at."""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(TEXTURE_CACHE_EXTENSION):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        files.sort()
+        self.disk_used = sum(size for _, size, _ in files)
+        if self.disk_used <= self.disk_size:
+            return
+        for _, size, path in files:
+            if self.disk_used <= self.disk_size * TEXTURE_CACHE_TRIM_TO:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.disk_used -= size
+
+
+texture_cache = TextureCache(
+    int(float(os.environ.get("TEXTURE_CACHE_MEMORY_MB", 8)) * 1024 * 1024),
+    os.environ.get("TEXTURE_CACHE_DIR"),
+    int(float(os.environ.get("TEXTURE_CACHE_DISK_MB", 512)) * 1024 * 1024),
+)
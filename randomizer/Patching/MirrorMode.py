@@ -1,9 +1,8 @@
 """Changes for Mirror Mode."""
 
-import js
 from randomizer.Patching.Patcher import LocalROM
 from randomizer.Settings import Settings
-from randomizer.Patching.Library.Assets import TableNames, getRawFile, writeRawFile
+from randomizer.Patching.Library.Assets import TableNames, getPointerFileCount, getRawFile, writeRawFile
 
 
 def FlipDisplayList(ROM_COPY: LocalROM, data: bytearray, start: int, end: int, table: int, file: int):
@@ -35,7 +34,7 @@ def ApplyMirrorMode(settings: Settings, ROM_COPY: LocalROM):
     if not settings.mirror_mode:
         return
     for tbl in (TableNames.ActorGeometry, TableNames.ModelTwoGeometry, TableNames.MapGeometry):
-        file_count = len(js.pointer_addresses[tbl]["entries"])
+        file_count = getPointerFileCount(tbl)
         for file_index in range(file_count):
             data = bytearray(getRawFile(ROM_COPY, tbl, file_index, True))
             if len(data) == 0:
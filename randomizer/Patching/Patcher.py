@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import copy
 import os
-from io import BytesIO
+import struct
 from typing import TYPE_CHECKING, Union
 
 import js
@@ -18,6 +17,74 @@ if TYPE_CHECKING:
 patchedRom = None
 og_patched_rom = None
 
+U8 = struct.Struct(">B")
+S8 = struct.Struct(">b")
+U16 = struct.Struct(">H")
+S16 = struct.Struct(">h")
+U32 = struct.Struct(">I")
+S32 = struct.Struct(">i")
+FLOAT = struct.Struct(">f")
+
+
+class ROMBuffer:
+    """ROM held in memory as a single bytearray, behaving like the BytesIO it replaces.
+
+    Writing past the end zero fills the gap like BytesIO does, the capacity grows ahead of the size so a ROM that starts small isn't copied on every write.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray]) -> None:
+        """Initialize with given parameters."""
+        self.data = bytearray(data)
+        self.view = memoryview(self.data)
+        self.size = len(self.data)
+        self.position = 0
+
+    def __deepcopy__(self, memo: dict) -> ROMBuffer:
+        """Copy the contents into a new buffer."""
+        return ROMBuffer(self.view[: self.size])
+
+    def reserve(self, end: int) -> None:
+        """Make sure everything up to end is part of the ROM."""
+        if end > len(self.data):
+            # Views handed out before now keep pointing at the old data, which only happens while the test ROM grows
+            data = bytearray(max(end, 2 * len(self.data)))
+            data[: self.size] = self.view[: self.size]
+            self.data = data
+            self.view = memoryview(data)
+        self.size = max(self.size, end)
+
+    def seek(self, position: int) -> int:
+        """Seek to position in the ROM."""
+        self.position = position
+        return position
+
+    def tell(self) -> int:
+        """Get the current position in the ROM."""
+        return self.position
+
+    def read(self, size: int = -1) -> bytes:
+        """Read bytes from current position, stopping at the end of the ROM."""
+        start = self.position
+        end = self.size if size < 0 else min(start + size, self.size)
+        if end <= start:
+            return b""
+        self.position = end
+        return self.view[start:end].tobytes()
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        """Write bytes to current position."""
+        start = self.position
+        end = start + len(data)
+        if end > self.size:
+            self.reserve(end)
+        self.data[start:end] = data
+        self.position = end
+        return len(data)
+
+    def getvalue(self) -> bytes:
+        """Get the whole ROM."""
+        return bytes(self.view[: self.size])
+
 
 class ROM:
     """Patcher for ROM files loaded via Rompatcherjs."""
@@ -138,14 +205,14 @@ def load_base_rom(default_file: None = None) -> None:
 
             patch = open("./static/patches/shrink-dk64.bps", "rb")
             original = open("dk64.z64", "rb")
-            og_patched_rom = BytesIO(bps.patch(original, patch).read())
-            patchedRom = copy.deepcopy(og_patched_rom)
+            og_patched_rom = bps.patch(original, patch).read()
+            patchedRom = ROMBuffer(og_patched_rom)
         elif default_file is not None and patchedRom is None:
             print("Using default file")
-            og_patched_rom = default_file
-            patchedRom = copy.deepcopy(og_patched_rom)
+            og_patched_rom = default_file.getvalue()
+            patchedRom = ROMBuffer(og_patched_rom)
         else:
-            patchedRom = copy.deepcopy(og_patched_rom)
+            patchedRom = ROMBuffer(og_patched_rom)
     except Exception as e:
         pass
 
@@ -167,8 +234,7 @@ class LocalROM:
         if "PYTEST_CURRENT_TEST" in os.environ:
             data_size = 32 * 1024  # 32KB = 32 * 1024 bytes
             data = bytes(range(256)) * (data_size // 256)  # Repeat values from 0 to 255 to fill 32KB
-            # Create a BytesIO object
-            patchedRom = BytesIO(data)
+            patchedRom = ROMBuffer(data)
         else:
             if not os.path.exists("dk64.z64"):
                 raise Exception("No ROM was loaded, please make sure you have dk64.z64 in the root directory of the project.")
@@ -185,7 +251,12 @@ class LocalROM:
         Args:
             val (int): Int value to write.
         """
-        self.rom.write((val).to_bytes(1, byteorder="big", signed=False))
+        rom = self.rom
+        position = rom.position
+        if position >= rom.size:
+            rom.reserve(position + 1)
+        rom.data[position] = val
+        rom.position = position + 1
 
     def writeBytes(self, byte_data: Union[bytearray, bytes]) -> None:
         """Write an array a bytes to the current position.
@@ -195,7 +266,17 @@ class LocalROM:
         Args:
             byte_data (bytes): Bytes object to write to current position.
         """
-        self.rom.write(bytes(byte_data))
+        rom = self.rom
+        position = rom.position
+        try:
+            end = position + len(byte_data)
+        except TypeError:
+            byte_data = bytes(byte_data)
+            end = position + len(byte_data)
+        if end > rom.size:
+            rom.reserve(end)
+        rom.data[position:end] = byte_data
+        rom.position = end
 
     def writeMultipleBytes(self, value: Union[int, Enemies, Maps, Kongs, CustomActors], size: int) -> None:
         """Write multiple bytes of a size to the current position.
@@ -206,23 +287,16 @@ class LocalROM:
             value (int): Value to write.
             size (int): Size of the bytes to write.
         """
-        arr = []
-        temp = value
-        for x in range(size):
-            arr.append(0)
-        will_pass = True
-        idx = size - 1
-        while will_pass:
-            if temp is None:
-                temp = 0
-            write = temp % 256
-            arr[idx] = write
-            temp = int((temp - write) / 256)
-            if idx == 0 or temp == 0:
-                will_pass = False
-            idx -= 1
-        for x in arr:
-            self.write(x)
+        if value is None:
+            value = 0
+        # Values that don't fit are cut down to their lowest bytes, negative values end up in two's complement
+        rom = self.rom
+        position = rom.position
+        end = position + size
+        if end > rom.size:
+            rom.reserve(end)
+        rom.data[position:end] = (value & ((1 << (8 * size)) - 1)).to_bytes(size, byteorder="big")
+        rom.position = end
 
     def seek(self, val: int) -> None:
         """Seek to position in current file.
@@ -230,7 +304,7 @@ class LocalROM:
         Args:
             val (int): Position to seek to.
         """
-        self.rom.seek(val)
+        self.rom.position = val
 
     def readBytes(self, len: int) -> bytes:
         """Read bytes from current position.
@@ -243,4 +317,99 @@ class LocalROM:
         Returns:
             bytes: List of bytes read from current position.
         """
-        return bytes(self.rom.read(len))
+        rom = self.rom
+        position = rom.position
+        end = position + len
+        if end > rom.size or len < 0:
+            return rom.read(len)
+        rom.position = end
+        return rom.view[position:end].tobytes()
+
+    def readSlice(self, len: int) -> memoryview:
+        """Get a view of the bytes at the current position without copying them, and move past them."""
+        rom = self.rom
+        start = rom.position
+        end = min(start + len, rom.size)
+        rom.position = start + len
+        return rom.view[start:end]
+
+    def readValue(self, value_struct: struct.Struct) -> Union[int, float]:
+        """Read a big endian value of the given format from the current position."""
+        rom = self.rom
+        position = rom.position
+        end = position + value_struct.size
+        if end > rom.size:
+            # Comes up short past the end like readBytes does, giving what int.from_bytes makes of the bytes that are there
+            data = rom.read(value_struct.size)
+            if value_struct is FLOAT:
+                # Floats have no shorter form, so the bytes that are there are read as the low bytes like they are for ints
+                return FLOAT.unpack(data.rjust(FLOAT.size, b"\x00"))[0]
+            return int.from_bytes(data, "big", signed=value_struct.format[-1] in "bhi")
+        rom.position = end
+        return value_struct.unpack_from(rom.data, position)[0]
+
+    def writeValue(self, value_struct: struct.Struct, value: Union[int, float]) -> None:
+        """Write a big endian value of the given format to the current position."""
+        rom = self.rom
+        position = rom.position
+        end = position + value_struct.size
+        if end > rom.size:
+            rom.reserve(end)
+        value_struct.pack_into(rom.data, position, value)
+        rom.position = end
+
+    def readU8(self) -> int:
+        """Read an unsigned byte from the current position."""
+        return self.readValue(U8)
+
+    def readS8(self) -> int:
+        """Read a signed byte from the current position."""
+        return self.readValue(S8)
+
+    def readU16(self) -> int:
+        """Read an unsigned big endian short from the current position."""
+        return self.readValue(U16)
+
+    def readS16(self) -> int:
+        """Read a signed big endian short from the current position."""
+        return self.readValue(S16)
+
+    def readU32(self) -> int:
+        """Read an unsigned big endian word from the current position."""
+        return self.readValue(U32)
+
+    def readS32(self) -> int:
+        """Read a signed big endian word from the current position."""
+        return self.readValue(S32)
+
+    def readFloat(self) -> float:
+        """Read a big endian float from the current position."""
+        return self.readValue(FLOAT)
+
+    def writeU8(self, value: int) -> None:
+        """Write an unsigned byte to the current position."""
+        self.writeValue(U8, value)
+
+    def writeS8(self, value: int) -> None:
+        """Write a signed byte to the current position."""
+        self.writeValue(S8, value)
+
+    def writeU16(self, value: int) -> None:
+        """Write an unsigned big endian short to the current position."""
+        self.writeValue(U16, value)
+
+    def writeS16(self, value: int) -> None:
+        """Write a signed big endian short to the current position."""
+        self.writeValue(S16, value)
+
+    def writeU32(self, value: int) -> None:
+        """Write an unsigned big endian word to the current position."""
+        self.writeValue(U32, value)
+
+    def writeS32(self, value: int) -> None:
+        """Write a signed big endian word to the current position."""
+        self.writeValue(S32, value)
+
+    def writeFloat(self, value: float) -> None:
+        """Write a big endian float to the current position."""
+        self.writeValue(FLOAT, value)
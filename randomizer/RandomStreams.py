@@ -0,0 +1,35 @@
+"""Separate streams of random numbers for each part of generation."""
+
+from __future__ import annotations
+
+import random
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+
+class RandomStreams:
+    """Hands each part of generation its own stream of random numbers, which only depends on the seed and the name of the stream.
+
+    The randomizer draws from the random module directly, so a stream swaps its state into the module for the duration of a block.
+    What one part draws then can't shift the numbers any other part gets, so parts can be skipped, reordered or run elsewhere without changing the seed.
+    """
+
+    def __init__(self, seed: Any) -> None:
+        """Initialize with given parameters."""
+        self.seed = seed
+        self.states: Dict[str, tuple] = {}
+
+    @contextmanager
+    def Stream(self, name: str) -> Iterator[None]:
+        """Draw every random number inside this block from the named stream, picking up where that stream last left off."""
+        outer_state = random.getstate()
+        if name in self.states:
+            random.setstate(self.states[name])
+        else:
+            random.seed(f"{self.seed}-{name}")
+        try:
+            yield
+        finally:
+            self.states[name] = random.getstate()
+            # Whatever runs after this block draws the same numbers whether or not it ran
+            random.setstate(outer_state)
@@ -0,0 +1,123 @@
+"""Binary file holding everything the server stores for a generated seed.
+
+The file starts with a fixed header holding what's needed to decide whether to serve the seed, followed by a table of sections.
+Each section is compressed on its own, so one can be read by seeking straight to it without touching the rest of the file.
+
+Header (little endian):
+    8s  magic, b"DK64SEED"
+    H   format version
+    d   unlock time of the spoiler log
+    d   time the seed was generated
+    I   seed number
+    B   length of the hash, followed by that many hash bytes
+    H   number of sections, followed by that many section entries
+
+Section entry:
+    B   length of the name, followed by that many bytes of UTF-8 name
+    B   codec, 0 for stored and 1 for zlib
+    Q   offset from the start of the file
+    Q   stored length
+    Q   length once decompressed
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from typing import BinaryIO, Dict, List, NamedTuple
+
+ARTIFACT_MAGIC = b"DK64SEED"
+ARTIFACT_VERSION = 1
+ARTIFACT_EXTENSION = ".dk64seed"
+
+HEADER_FORMAT = struct.Struct("<8sHddIB")
+SECTION_COUNT_FORMAT = struct.Struct("<H")
+SECTION_FORMAT = struct.Struct("<BQQQ")
+
+CODEC_STORED = 0
+CODEC_ZLIB = 1
+
+# Spoiler log sections are stored one per section, under this prefix followed by their name
+SPOILER_SECTION_PREFIX = "spoiler/"
+
+
+class SectionEntry(NamedTuple):
+    """Where a section is in the file and how it is stored."""
+
+    codec: int
+    offset: int
+    length: int
+    raw_length: int
+
+
+class SeedArtifactHeader(NamedTuple):
+    """Everything in a seed artifact ahead of its section data."""
+
+    version: int
+    unlock_time: float
+    generated_time: float
+    seed_number: int
+    hash: List[int]
+    sections: Dict[str, SectionEntry]
+
+
+def WriteSeedArtifact(fh: BinaryIO, unlock_time: float, generated_time: float, seed_number: int, hash: List[int], sections: Dict[str, bytes]) -> None:
+    """Write a seed artifact with the given header values and sections, compressing each section unless that doesn't make it smaller."""
+    stored = {}
+    for name, data in sections.items():
+        compressed = zlib.compress(data)
+        if len(compressed) < len(data):
+            stored[name] = (CODEC_ZLIB, compressed, len(data))
+        else:
+            stored[name] = (CODEC_STORED, data, len(data))
+    encoded_names = {name: name.encode("utf-8") for name in stored}
+    header_length = HEADER_FORMAT.size + len(hash) + SECTION_COUNT_FORMAT.size
+    header_length += sum(1 + len(encoded_name) + SECTION_FORMAT.size for encoded_name in encoded_names.values())
+    fh.write(HEADER_FORMAT.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, unlock_time, generated_time, seed_number, len(hash)))
+    fh.write(bytes(hash))
+    fh.write(SECTION_COUNT_FORMAT.pack(len(stored)))
+    offset = header_length
+    for name, (codec, data, raw_length) in stored.items():
+        fh.write(bytes([len(encoded_names[name])]))
+        fh.write(encoded_names[name])
+        fh.write(SECTION_FORMAT.pack(codec, offset, len(data), raw_length))
+        offset += len(data)
+    for codec, data, raw_length in stored.values():
+        fh.write(data)
+
+
+def ReadSeedArtifactHeader(fh: BinaryIO) -> SeedArtifactHeader:
+    """Read the header and section table of a seed artifact, leaving the section data unread."""
+    magic, version, unlock_time, generated_time, seed_number, hash_length = HEADER_FORMAT.unpack(fh.read(HEADER_FORMAT.size))
+    if magic != ARTIFACT_MAGIC:
+        raise ValueError("Not a seed artifact.")
+    if version > ARTIFACT_VERSION:
+        raise ValueError(f"Seed artifact version {version} is newer than this reader supports.")
+    hash = list(fh.read(hash_length))
+    (section_count,) = SECTION_COUNT_FORMAT.unpack(fh.read(SECTION_COUNT_FORMAT.size))
+    sections = {}
+    for _ in range(section_count):
+        name = fh.read(fh.read(1)[0]).decode("utf-8")
+        sections[name] = SectionEntry(*SECTION_FORMAT.unpack(fh.read(SECTION_FORMAT.size)))
+    return SeedArtifactHeader(version, unlock_time, generated_time, seed_number, hash, sections)
+
+
+def ReadSeedArtifactSection(fh: BinaryIO, header: SeedArtifactHeader, name: str) -> bytes:
+    """Read a single section of a seed artifact by seeking straight to it."""
+    entry = header.sections[name]
+    fh.seek(entry.offset)
+    data = fh.read(entry.length)
+    if entry.codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    return data
+
+
+def ReadSpoilerLog(fh: BinaryIO, header: SeedArtifactHeader) -> str:
+    """Put the spoiler log of a seed artifact back together as a JSON object from its sections, without decoding any of them."""
+    chunks = []
+    for name in header.sections:
+        if name.startswith(SPOILER_SECTION_PREFIX):
+            # Each section holds the JSON encoded value of one entry of the log, laid out the way json.dumps would
+            chunks.append(f"{json.dumps(name[len(SPOILER_SECTION_PREFIX):])}: {ReadSeedArtifactSection(fh, header, name).decode('utf-8')}")
+    return "{" + ", ".join(chunks) + "}"
@@ -10,6 +10,7 @@ from randomizer.Enums.Settings import (
     SettingsStringEnum,
     SettingsStringIntRangeMap,
     SettingsStringListTypeMap,
+    SettingsMap,
     SettingsStringTypeMap,
     SpoilerHints,
 )
@@ -399,3 +400,26 @@ def decrypt_settings_string_enum(encrypted_string: str) -> Dict[str, Any]:
         if key_enum != SettingsStringEnum.enable_plandomizer:
             settings_dict[key_name] = val
     return settings_dict
+
+
+def cleanup_settings(settings):
+    """Cleanup the settings dictionary."""
+    # Convert string data to enums where possible.
+    for k, v in settings.items():
+        if k in SettingsMap:
+            if type(v) is list:
+                values = []
+                for val in v:
+                    if type(val) is int:
+                        values.append(SettingsMap[k](val))
+                    else:
+                        values.append(SettingsMap[k][val])
+                settings[k] = values
+            elif type(v) is int:
+                settings[k] = SettingsMap[k](v)
+            else:
+                try:
+                    settings[k] = SettingsMap[k][v]
+                except Exception:
+                    pass
+    return settings
@@ -82,11 +82,20 @@ class Settings:
         self.generate_misc()
         self.rom_data = 0x1FED020
         self.move_location_data = 0x1FEF000
-        self.form_data = form_data
+        # Kept as it was given, the settings below share and change some of its lists, and processes rebuild these settings from it
+        self.form_data = deepcopy(form_data)
 
         # Debugging
         self.version = version
         self.branch = os.environ.get("BRANCH", "LOCAL")
+        # Processes used to calculate Way of the Hoard paths, this never changes the generated seed
+        self.woth_path_processes = int(os.environ.get("WOTH_PATH_PROCESSES", 1))
+        # Processes used to check which playthrough items are required in item rando, this never changes the generated seed
+        self.pare_playthrough_processes = int(os.environ.get("PARE_PLAYTHROUGH_PROCESSES", 1))
+        # Fill attempts run at once, the lowest numbered one to succeed is kept so the seed stays reproducible
+        self.fill_attempt_processes = int(os.environ.get("FILL_ATTEMPT_PROCESSES", 1))
+        # Time every logic rule and print the slowest at the end of generation, this slows generation down considerably
+        self.profile_logic = bool(int(os.environ.get("PROFILE_LOGIC", 0)))
 
         self.apply_form_data(form_data)
         self.seed_id = str(self.seed)
@@ -2229,6 +2238,7 @@ class Settings:
         self.starting_region = random.choice(valid_starting_regions)
         for x in range(2):
             spoiler.RegionList[Regions.GameStart].exits[x + 1].dest = self.starting_region["region"]
+        spoiler.InvalidateLogicCaches()
 
     def ApplyPlandomizerSettings(self):
         """Apply settings specified by the plandomizer."""
@@ -303,6 +303,8 @@ def ShuffleCBs(spoiler):
             if total_bunches + total_singles > PLACEMENT_LIMIT:
                 print(f"WARNING: {total_bunches + total_singles} banana objects placed, exceeding cap of {PLACEMENT_LIMIT}")
                 raise Ex.CBFillFailureException
+            # Nothing searched on the previous layout holds for this one
+            spoiler.InvalidateLogicCaches()
             spoiler.Reset()
             if not Fill.VerifyWorld(spoiler):
                 raise Ex.CBFillFailureException
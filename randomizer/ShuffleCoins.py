@@ -116,6 +116,8 @@ def ShuffleCoins(spoiler):
 
                 # Placement is valid
                 coin_data.extend(level_placement.copy())
+            # Nothing searched on the previous layout holds for this one
+            spoiler.InvalidateLogicCaches()
             spoiler.Reset()
             if not Fill.VerifyWorld(spoiler):
                 raise Ex.CoinFillFailureException
@@ -33,8 +33,9 @@ def addCrate(spoiler, MelonCrate: CustomLocation, enum_val: int, name: str, leve
         Levels.HideoutHelm: "Helm",
     }
     spoiler.RegionList[MelonCrate.logic_region].locations.append(LocationLogic(enum_val, MelonCrate.logic))
+    spoiler.InvalidateLogicCaches()
     spoiler.LocationList[enum_val].name = f"{level_to_name[level]} Melon Crate: {name}"
-    spoiler.LocationList[enum_val].default_mapid_data[0].map = MelonCrate.map
+    spoiler.LocationList[enum_val].SetDefaultMap(MelonCrate.map)
     spoiler.LocationList[enum_val].level = level
 
 
@@ -55,6 +56,7 @@ def removeMelonCrate(spoiler):
         for region in level:
             region_data = spoiler.RegionList[region]
             region_data.locations = [x for x in region_data.locations if x.id < Locations.MelonCrate_Location00 or x.id > Locations.MelonCrate_Location12]
+    spoiler.InvalidateLogicCaches()
 
 
 def fillPlandoDict(plando_dict: dict, plando_input):
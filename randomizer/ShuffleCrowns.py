@@ -37,6 +37,7 @@ def ShuffleCrowns(spoiler, crown_selection, human_crowns):
     # Remove crowns from their original logic region
     for id, region in spoiler.RegionList.items():
         region.locations = [loclogic for loclogic in region.locations if loclogic.id not in crown_locations]
+    spoiler.InvalidateLogicCaches()
     global_crown_idx = 0
     for level in CustomLocations:
         level_lst = CustomLocations[level]
@@ -95,4 +96,5 @@ def ShuffleCrowns(spoiler, crown_selection, human_crowns):
             crownRegion = spoiler.RegionList[crown_obj.logic_region]
             # Add crowns to their updated logic region
             crownRegion.locations.append(LocationLogic(crown_locations[global_crown_idx], crown_obj.logic))
+            spoiler.InvalidateLogicCaches()
             global_crown_idx += 1
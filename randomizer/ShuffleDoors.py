@@ -219,6 +219,7 @@ def ShuffleDoors(spoiler, vanilla_doors_placed: bool):
                     doorLocation = GetDoorLocationForKongAndLevel(kong, level)  # If testing all locations, replace "kong" with "kong % 5"
                     region = spoiler.RegionList[selected_door.logicregion]
                     region.locations.append(LocationLogic(doorLocation, selected_door.logic))
+                    spoiler.InvalidateLogicCaches()
                     spoiler.LocationList[doorLocation].name = f"{level_to_name[level]} Hint Door: {selected_door.name}"
         elif disable_wrinkly_puzzles:
             # place vanilla wrinkly doors
@@ -332,6 +333,7 @@ def ShuffleVanillaDoors(spoiler):
             doorLocation = GetDoorLocationForKongAndLevel(kong, level)
             region = spoiler.RegionList[selected_door.logicregion]
             region.locations.append(LocationLogic(doorLocation, selected_door.logic))
+            spoiler.InvalidateLogicCaches()
             spoiler.LocationList[doorLocation].name = f"{level_to_name[level]} Hint Door: {selected_door.name}"
         # Any remaining vanilla door that isn't occupied and is a T&S door will get a T&S - the number of doors here will vary based on how many hints were placed in lobby vs level
         placed_tns_count = 1
@@ -356,6 +358,7 @@ def ClearHintDoorLogic(spoiler):
     """Remove existing hint door locations from the logic in preparation for custom door locations to be added."""
     for id, region in spoiler.RegionList.items():
         region.locations = [loclogic for loclogic in region.locations if loclogic.id < Locations.JapesDonkeyDoor or loclogic.id > Locations.CastleChunkyDoor]
+    spoiler.InvalidateLogicCaches()
 
 
 def SetProgressiveHintDoorLogic(spoiler):
@@ -405,3 +408,4 @@ def SetProgressiveHintDoorLogic(spoiler):
     spoiler.RegionList[Regions.GameStart].locations.append(LocationLogic(Locations.ProgressiveHint_33, lambda l: l.canFulfillProgHint(hint_costs[32])))
     spoiler.RegionList[Regions.GameStart].locations.append(LocationLogic(Locations.ProgressiveHint_34, lambda l: l.canFulfillProgHint(hint_costs[33])))
     spoiler.RegionList[Regions.GameStart].locations.append(LocationLogic(Locations.ProgressiveHint_35, lambda l: l.canFulfillProgHint(hint_costs[34])))
+    spoiler.InvalidateLogicCaches()
@@ -41,11 +41,13 @@ def GetRootExit(spoiler, exitId):
 def RemoveRootExit(spoiler, exit):
     """Remove an exit from the world root."""
     spoiler.RegionList[root].exits.remove(exit)
+    spoiler.InvalidateLogicCaches()
 
 
 def AddRootExit(spoiler, exit):
     """Add an exit to the world root."""
     spoiler.RegionList[root].exits.append(exit)
+    spoiler.InvalidateLogicCaches()
 
 
 def Reset(spoiler):
@@ -53,6 +55,7 @@ def Reset(spoiler):
     for exit in ShufflableExits.values():
         exit.shuffledId = None
         exit.shuffled = False
+    spoiler.InvalidateLogicCaches()
     assumedExits = []
     for exit in [x for x in spoiler.RegionList[root].exits if x.assumed]:
         assumedExits.append(exit)
@@ -80,6 +83,7 @@ def AttemptConnect(spoiler, frontExit, frontId, backExit, backId):
         backReverse = ShufflableExits[backExit.back.reverse]
         backReverse.shuffled = True
         backReverse.shuffledId = frontExit.back.reverse
+    spoiler.InvalidateLogicCaches()
     # Attempt to verify world
     valid = Fill.VerifyWorld(spoiler)
     # If world is not valid, restore root connections and undo new connections
@@ -91,6 +95,7 @@ def AttemptConnect(spoiler, frontExit, frontId, backExit, backId):
             AddRootExit(spoiler, frontReverse)
             backReverse.shuffled = False
             backReverse.shuffledId = None
+        spoiler.InvalidateLogicCaches()
     return valid
 
 
@@ -257,6 +262,7 @@ def ShuffleExits(spoiler):
     # If levels rando is on, need to update Blocker and T&S requirements to match
     if settings.shuffle_loading_zones == ShuffleLoadingZones.levels:
         UpdateLevelProgression(settings)
+    spoiler.InvalidateLogicCaches()
 
 
 def ExitShuffle(spoiler):
@@ -275,6 +281,7 @@ def ExitShuffle(spoiler):
                 js.postMessage("Entrance placement failed, out of retries.")
                 raise Ex.EntranceAttemptCountExceeded
             retries += 1
+            spoiler.metrics.entrance_retries += 1
             js.postMessage("Entrance placement failed. Retrying. Tries: " + str(retries))
             Reset(spoiler)
 
@@ -159,6 +159,7 @@ def ShuffleFairyLocations(spoiler):
                         # Insert into logic
                         new_region = fairy_locations[level][x].region
                         spoiler.RegionList[new_region].locations.append(LocationLogic(data.location, fairy_locations[level][x].logic))
+                        spoiler.InvalidateLogicCaches()
                         spoiler.LocationList[data.location].name = f"{level_to_name[level]} Fairy ({fairy_locations[level][x].name})"
                         # Resolve location-item combinations for plando
                         if len(plando_dict[level]) > 0:
@@ -171,6 +172,7 @@ def ClearFairyLogic(spoiler):
     """Clear out any fairy locations in preparation for filling custom ones."""
     for id, region in spoiler.RegionList.items():
         region.locations = [loc for loc in region.locations if loc.id not in all_fairy_locations]
+    spoiler.InvalidateLogicCaches()
 
 
 def fillPlandoDict(plando_dict: dict, plando_input):
@@ -139,6 +139,7 @@ def ShuffleKasplatsAndLocations(spoiler, LogicVariables):
                     # Insert the Location into the Region
                     kasplatRegion = spoiler.RegionList[kasplat.region_id]
                     kasplatRegion.locations.append(LocationLogic(location_id, kasplat.additional_logic))
+                    spoiler.InvalidateLogicCaches()
                     # Update logic variables for remainder of the Fill
                     LogicVariables.kasplat_map[location_id] = kong
                     spoiler.shuffled_kasplat_map[kasplat.name] = int(kong)
@@ -170,6 +171,7 @@ def ShuffleKasplatsInVanillaLocations(spoiler, LogicVariables):
             # Insert the rando Location into the Region
             kasplatRegion = spoiler.RegionList[kasplat.region_id]
             kasplatRegion.locations.append(LocationLogic(rando_location_id, kasplat.additional_logic))
+            spoiler.InvalidateLogicCaches()
             LogicVariables.kasplat_map[rando_location_id] = chosenKong
             spoiler.shuffled_kasplat_map[kasplat.name] = int(chosenKong)
             availableKongs.remove(chosenKong)
@@ -186,6 +188,7 @@ def ResetShuffledKasplatLocations(spoiler):
                 kasplat.setKasplat(state=False)
                 randomKasplatRegion = spoiler.RegionList[kasplat.region_id]
                 randomKasplatRegion.locations = [loc for loc in randomKasplatRegion.locations if loc.id < Locations.JapesDonkeyKasplatRando or loc.id > Locations.IslesChunkyKasplatRando]
+    spoiler.InvalidateLogicCaches()
 
 
 def ShuffleKasplats(spoiler):
@@ -31,8 +31,9 @@ def addPatch(spoiler, patch: CustomLocation, enum_val: int, name: str, level: Le
         Levels.CreepyCastle: "Castle",
     }
     spoiler.RegionList[patch.logic_region].locations.append(LocationLogic(enum_val, patch.logic))
+    spoiler.InvalidateLogicCaches()
     spoiler.LocationList[enum_val].name = f"{level_to_name[level]} Dirt: {name}"
-    spoiler.LocationList[enum_val].default_mapid_data[0].map = patch.map
+    spoiler.LocationList[enum_val].SetDefaultMap(patch.map)
     spoiler.LocationList[enum_val].level = level
 
 
@@ -52,6 +53,7 @@ def removePatches(spoiler):
         for region in level:
             region_data = spoiler.RegionList[region]
             region_data.locations = [x for x in region_data.locations if x.id < Locations.RainbowCoin_Location00 or x.id > Locations.RainbowCoin_Location15]
+    spoiler.InvalidateLogicCaches()
 
 
 def fillPlandoDict(plando_dict: dict, plando_input):
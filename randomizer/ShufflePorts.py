@@ -76,6 +76,7 @@ PortShufflerData = {
 def addPort(spoiler, warp: CustomLocation, event_enum: Events):
     """Add bananaport to relevant Logic Region."""
     spoiler.RegionList[warp.logic_region].events.append(Event(event_enum, warp.logic))
+    spoiler.InvalidateLogicCaches()
     for k in BananaportVanilla:
         if BananaportVanilla[k].event == event_enum:
             BananaportVanilla[k].region_id = warp.logic_region
@@ -107,6 +108,7 @@ def removePorts(spoiler, permitted_maps: list[Maps]):
             region_data.events = [
                 x for x in region_data.events if x.name < Events.JapesW1aTagged or x.name > Events.IslesW5bTagged or x.name in BANNED_PORT_SHUFFLE_EVENTS or x.name in persisted_events
             ]
+    spoiler.InvalidateLogicCaches()
 
 
 def ResetPorts():
@@ -157,3 +157,4 @@ def ShuffleShopLocations(spoiler):
         assortment[level] = assortment_in_level
     # Write Assortment to spoiler
     spoiler.shuffled_shop_locations = assortment
+    spoiler.InvalidateLogicCaches()
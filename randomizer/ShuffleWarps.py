@@ -210,6 +210,7 @@ def LinkWarps(spoiler):
     # Remove all existing transitions that are warp transitions - this prevents warp logic from bleeding between seed gens
     for region in spoiler.RegionList.values():
         region.exits = [exit for exit in region.exits if not exit.isBananaportTransition]
+    spoiler.InvalidateLogicCaches()
     # For each warp, identify the source and destination regions
     for warp_data in BananaportVanilla.values():
         destination_id, destination_warp_data = getWarpFromSwapIndex(warp_data.tied_index)
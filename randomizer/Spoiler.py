@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import json
-from copy import deepcopy
-from typing import TYPE_CHECKING, Dict, List, Optional, OrderedDict, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, OrderedDict, Union
 
 import randomizer.Lists.Exceptions as Ex
 from randomizer.Enums.Events import Events
@@ -52,6 +51,10 @@ from randomizer.Lists.Minigame import (
 from randomizer.Lists.Multiselectors import FasterCheckSelector, RemovedBarrierSelector, QoLSelector
 from randomizer.Lists.EnemyTypes import EnemySelector
 from randomizer.Logic import CollectibleRegionsOriginal, LogicVarHolder, RegionsOriginal
+from randomizer.LogicClasses import ReachabilityCache
+from randomizer.LogicProfiler import LogicProfiler
+from randomizer.Metrics import GenerationMetrics
+from randomizer.RandomStreams import RandomStreams
 from randomizer.Prices import ProgressiveMoves
 from randomizer.Settings import Settings
 from randomizer.ShuffleBosses import HardBossesEnabled
@@ -104,9 +107,18 @@ class Spoiler:
         self.enemy_replacements = []
         self.cb_placements = []
         self.LogicVariables = LogicVarHolder(self)
-        self.RegionList = deepcopy(RegionsOriginal)
-        self.CollectibleRegions = deepcopy(CollectibleRegionsOriginal)
-        self.LocationList = deepcopy(LocationListOriginal)
+        # The world definitions are shared by every seed, each seed only copies the parts it changes
+        self.RegionList = {id: region.Copy() for id, region in RegionsOriginal.items()}
+        self.CollectibleRegions = {id: [collectible.Copy() for collectible in collectibles] for id, collectibles in CollectibleRegionsOriginal.items()}
+        self.LocationList = {id: location.Copy() for id, location in LocationListOriginal.items()}
+        self.compiled_logic = None
+        self.region_graph = None
+        self.reachability_cache = ReachabilityCache()
+        # Searches only use the cache when they start from a freshly reset state
+        self.fresh_search_state = False
+        self.metrics = GenerationMetrics()
+        self.logic_profiler = LogicProfiler() if settings.profile_logic else None
+        self.random_streams = RandomStreams(settings.seed)
 
         self.move_data = []
         # 0: Cranky, 1: Funky, 2: Candy
@@ -159,6 +171,12 @@ class Spoiler:
         self.LogicVariables.Reset()
         self.ResetRegionAccess()
         self.ResetCollectibleRegions()
+        self.fresh_search_state = True
+
+    def InvalidateLogicCaches(self) -> None:
+        """Forget the region graph, its rule dependencies and every cached search, needed whenever regions, exits, locations or collectibles change."""
+        self.region_graph = None
+        self.reachability_cache.Clear()
 
     def ResetRegionAccess(self) -> None:
         """Reset kong access for all regions."""
@@ -247,7 +265,7 @@ class Spoiler:
         return toggle
 
     def createJson(self) -> None:
-        """Convert spoiler to JSON and save it."""
+        """Convert spoiler data into the human-readable spoiler log and save it."""
         # We want to convert raw spoiler data into the important bits and in human-readable formats.
         humanspoiler = OrderedDict()
         # Settings data
@@ -1009,7 +1027,40 @@ class Spoiler:
             #     humanspoiler["Potentially Awful Locations"][location_description] = self.poor_scoring_locations[location_description]
             # if hasattr(self, "hint_swap_advisory"):
             #     humanspoiler["Hint Swap Advisory"] = self.hint_swap_advisory
-        self.json = json.dumps(humanspoiler, indent=4)
+        self.human_spoiler = humanspoiler
+
+    @property
+    def json(self) -> str:
+        """Get the full spoiler log as a JSON string."""
+        return json.dumps(self.human_spoiler, indent=4)
+
+    def EncodeJsonSections(self, extra: Optional[dict] = None) -> OrderedDict[str, str]:
+        """Encode each top level section of the spoiler log, along with any extra ones, on its own.
+
+        Any subset of the sections can then be written out with JoinJsonSections without encoding the log again.
+        """
+        sections = OrderedDict((name, json.dumps(section)) for name, section in self.human_spoiler.items())
+        if extra is not None:
+            sections.update((name, json.dumps(section)) for name, section in extra.items())
+        return sections
+
+    @staticmethod
+    def IterJsonSections(sections: OrderedDict[str, str], names: Optional[List[str]] = None) -> Iterator[str]:
+        """Yield the chunks of a JSON object holding the encoded sections, or only the named ones, exactly as json.dumps would write it."""
+        yield "{"
+        first = True
+        for name, encoded in sections.items():
+            if names is not None and name not in names:
+                continue
+            yield f"{'' if first else ', '}{json.dumps(name)}: "
+            yield encoded
+            first = False
+        yield "}"
+
+    @staticmethod
+    def JoinJsonSections(sections: OrderedDict[str, str], names: Optional[List[str]] = None) -> str:
+        """Get a JSON object holding the encoded sections, or only the named ones."""
+        return "".join(Spoiler.IterJsonSections(sections, names))
 
     def UpdateKasplats(self, kasplat_map: Dict[Locations, Kongs]) -> None:
         """Update kasplat data."""
@@ -0,0 +1,18 @@
+"""Benchmark seed generation, run with --benchmark-seeds N."""
+
+import json
+
+import pytest
+
+from benchmark import load_presets, run_benchmark
+
+
+def test_benchmark(pytestconfig):
+    """Generate a range of seeds for each preset and write the benchmark results."""
+    seed_count = pytestconfig.getoption("--benchmark-seeds")
+    if seed_count <= 0:
+        pytest.skip("Benchmark not requested, run with --benchmark-seeds N")
+    results = run_benchmark(load_presets(), seed_start=0, seed_count=seed_count)
+    with open(pytestconfig.getoption("--benchmark-output"), "w") as outfile:
+        json.dump(results, outfile, indent=4)
+    assert results["overall"]["seeds"] == seed_count * len(results["presets"])
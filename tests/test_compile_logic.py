@@ -0,0 +1,93 @@
+"""Test that compiled logic rules give the same answers as the rules they were compiled from."""
+
+import random
+import unittest
+
+import randomizer.ItemPool as ItemPool
+from randomizer.CompileLogic import CompileLogic, EnsureLogicCompiled, RestoreLogic
+from randomizer.Enums.Events import Events
+from randomizer.Enums.Kongs import GetKongs
+from randomizer.Enums.Settings import LogicType
+from tests.test_search import CreateSpoiler
+
+
+def Evaluate(rule, logicVariables):
+    """Evaluate a rule, returning whether it passed or the type of exception it raised."""
+    try:
+        return bool(rule(logicVariables))
+    except Exception as ex:
+        return type(ex)
+
+
+class TestCompileLogic(unittest.TestCase):
+    """Test compiling the logic rules of a spoiler against its settings."""
+
+    def assertMatchesOriginals(self, spoiler, states=6):
+        """Compare every compiled rule with its original over random item, event and kong states."""
+        rng = random.Random(0)
+        record = spoiler.compiled_logic
+        self.assertGreater(len(record.originals), 0)
+        logicVariables = spoiler.LogicVariables
+        items = ItemPool.AllItemsUnrestricted(spoiler.settings)
+        events = list(Events)
+        for state in range(states):
+            spoiler.Reset()
+            share = (state + 1) / (states + 1)
+            logicVariables.Update([item for item in items if rng.random() < share])
+            for event in events:
+                if rng.random() < share:
+                    logicVariables.AddEvent(event)
+            for kong in GetKongs():
+                logicVariables.SetKong(kong)
+                mismatches = [original for holder, original in record.originals if Evaluate(holder.logic, logicVariables) != Evaluate(original, logicVariables)]
+                self.assertEqual(mismatches, [], f"{len(mismatches)} rules differ with {share:.0%} of items and events as {kong.name}")
+
+    def test_compiled_rules(self):
+        """Confirm that compiled rules match the originals."""
+        spoiler = CreateSpoiler()
+        CompileLogic(spoiler)
+        self.assertMatchesOriginals(spoiler)
+
+    def test_glitch_rules(self):
+        """Confirm that compiled rules match the originals with every glitch enabled, and are recompiled when a glitch flag changes."""
+        spoiler = CreateSpoiler(logic_type=LogicType.glitch, glitches_selected=[])
+        CompileLogic(spoiler)
+        self.assertMatchesOriginals(spoiler)
+        record = spoiler.compiled_logic
+        spoiler.LogicVariables.phasewalk = not spoiler.LogicVariables.phasewalk
+        EnsureLogicCompiled(spoiler)
+        self.assertIsNot(spoiler.compiled_logic, record)
+        self.assertMatchesOriginals(spoiler)
+
+    def test_volatile_settings(self):
+        """Confirm that compiled rules follow settings the fill changes, and are recompiled when a folded setting changes."""
+        spoiler = CreateSpoiler()
+        CompileLogic(spoiler)
+        settings = spoiler.settings
+        settings.kongs_for_progression = not settings.kongs_for_progression
+        settings.BLockerEntryCount = [0] * len(settings.BLockerEntryCount)
+        settings.BossBananas = [0] * len(settings.BossBananas)
+        settings.medal_requirement = 0
+        settings.rareware_gb_fairies = 0
+        self.assertMatchesOriginals(spoiler)
+        # Changing a setting which was folded into the rules moves it to the volatile settings
+        record = spoiler.compiled_logic
+        name = next(name for name, value in sorted(record.settings_snapshot.items()) if isinstance(value, bool))
+        setattr(settings, name, not getattr(settings, name))
+        EnsureLogicCompiled(spoiler)
+        self.assertIsNot(spoiler.compiled_logic, record)
+        self.assertIn(name, spoiler.compiled_logic.volatile)
+        self.assertNotIn(name, spoiler.compiled_logic.settings_snapshot)
+        self.assertMatchesOriginals(spoiler)
+
+    def test_restore_logic(self):
+        """Confirm that restoring a compiled spoiler puts back every original rule."""
+        spoiler = CreateSpoiler()
+        CompileLogic(spoiler)
+        originals = list(spoiler.compiled_logic.originals)
+        compiled = {id(holder.logic) for holder, _ in originals}
+        RestoreLogic(spoiler)
+        self.assertEqual(spoiler.compiled_logic.originals, [])
+        for holder, original in originals:
+            self.assertIs(holder.logic, original)
+            self.assertNotIn(id(holder.logic), compiled)
@@ -0,0 +1,57 @@
+"""Test that the logic variables count owned items the same however they're updated."""
+
+import random
+import unittest
+from collections import Counter
+
+import randomizer.ItemPool as ItemPool
+from randomizer.Enums.Items import Items
+from randomizer.Logic import ITEM_COUNT
+from randomizer.LogicClasses import LogicSnapshot
+from tests.test_search import CreateSpoiler
+
+
+class TestUpdate(unittest.TestCase):
+    """Test updating the logic variables with owned items."""
+
+    def setUp(self):
+        """Create a spoiler and a list of owned items with empty locations mixed in."""
+        rng = random.Random(0)
+        self.spoiler = CreateSpoiler()
+        self.ownedItems = ItemPool.AllItemsUnrestricted(self.spoiler.settings) + [None] * 10 + [Items.NoItem] * 10
+        rng.shuffle(self.ownedItems)
+
+    def assertCounts(self, logicVariables, ownedItems):
+        """Compare the item count arrays with a count of the owned items."""
+        counts = Counter(item for item in ownedItems if item is not None and item != Items.NoItem)
+        self.assertEqual(logicVariables.item_counts, [counts[item] for item in range(ITEM_COUNT)])
+        self.assertEqual(logicVariables.Blueprints, [item for item in ownedItems if item is not None and Items.JungleJapesDonkeyBlueprint <= item <= Items.DKIslesChunkyBlueprint])
+        self.assertEqual(logicVariables.Hints, [item for item in ownedItems if item is not None and Items.JapesDonkeyHint <= item <= Items.CastleChunkyHint])
+        self.assertEqual(logicVariables.latest_owned_items, ownedItems)
+
+    def test_empty_locations(self):
+        """Confirm that empty locations in the owned items are skipped."""
+        logicVariables = self.spoiler.LogicVariables
+        logicVariables.Update(self.ownedItems)
+        self.assertCounts(logicVariables, self.ownedItems)
+        self.assertEqual(logicVariables.item_counts[Items.NoItem], 0)
+
+    def test_incremental_update(self):
+        """Confirm that updating with more owned items at a time counts the same as updating with all of them at once."""
+        logicVariables = self.spoiler.LogicVariables
+        logicVariables.Update(self.ownedItems)
+        expected = {key: LogicSnapshot.CopyValue(value) for key, value in vars(logicVariables).items()}
+        self.spoiler.Reset()
+        for end in range(0, len(self.ownedItems) + 1, 25):
+            logicVariables.Update(self.ownedItems[:end])
+            self.assertCounts(logicVariables, self.ownedItems[:end])
+        logicVariables.Update(self.ownedItems)
+        self.assertEqual([key for key, value in vars(logicVariables).items() if value != expected[key]], [])
+
+    def test_recount(self):
+        """Confirm that owned items which don't continue the last update are counted again from nothing."""
+        logicVariables = self.spoiler.LogicVariables
+        logicVariables.Update(self.ownedItems)
+        ownedItems = self.ownedItems[1::2]
+        logicVariables.Update(ownedItems)
+        self.assertCounts(logicVariables, ownedItems)
@@ -0,0 +1,101 @@
+"""Test that the in memory ROM behaves like the BytesIO it replaced."""
+
+import copy
+import io
+import struct
+import unittest
+
+from randomizer.Patching.Patcher import LocalROM, ROMBuffer
+
+
+class TestROMBuffer(unittest.TestCase):
+    """Test the bytearray holding the ROM."""
+
+    def test_growth(self):
+        """Confirm that writing past the end zero fills the gap like BytesIO, and growing keeps everything written before."""
+        buffer = ROMBuffer(b"\x01\x02\x03\x04")
+        expected = io.BytesIO(b"\x01\x02\x03\x04")
+        for position, data in ((2, b"\xaa\xbb\xcc"), (10, b"\xdd"), (40, bytes(range(100))), (0, b"\xee")):
+            for stream in (buffer, expected):
+                stream.seek(position)
+                stream.write(data)
+            self.assertEqual(buffer.getvalue(), expected.getvalue())
+            self.assertEqual(buffer.tell(), expected.tell())
+        # Capacity grows ahead of the size, but nothing past the size is part of the ROM
+        self.assertGreaterEqual(len(buffer.data), buffer.size)
+        self.assertEqual(buffer.size, len(expected.getvalue()))
+        buffer.seek(buffer.size - 2)
+        self.assertEqual(buffer.read(10), expected.getvalue()[-2:])
+        self.assertEqual(buffer.read(10), b"")
+        self.assertEqual(copy.deepcopy(buffer).getvalue(), expected.getvalue())
+
+
+class TestLocalROM(unittest.TestCase):
+    """Test reading and writing the ROM through LocalROM."""
+
+    def setUp(self):
+        """Load the test ROM."""
+        self.rom = LocalROM()
+        self.size = self.rom.rom.size
+
+    def readBack(self, position: int, size: int) -> bytes:
+        """Read the bytes at a position."""
+        self.rom.seek(position)
+        return self.rom.readBytes(size)
+
+    def test_write_multiple_bytes(self):
+        """Confirm that values which don't fit are cut down to their lowest bytes, and negative values end up in two's complement."""
+        for value, size, expected in (
+            (0x1234, 2, b"\x12\x34"),
+            (0x123456, 2, b"\x34\x56"),
+            (0x1FF, 1, b"\xff"),
+            (-1, 2, b"\xff\xff"),
+            (-2, 4, b"\xff\xff\xff\xfe"),
+            (None, 2, b"\x00\x00"),
+            (7, 4, b"\x00\x00\x00\x07"),
+        ):
+            self.rom.seek(0x100)
+            self.rom.writeMultipleBytes(value, size)
+            self.assertEqual(self.rom.rom.tell(), 0x100 + size)
+            self.assertEqual(self.readBack(0x100, size), expected)
+
+    def test_write_past_end(self):
+        """Confirm that writing past the end of the ROM grows it and zero fills the gap."""
+        self.rom.seek(self.size + 3)
+        self.rom.writeMultipleBytes(0xABCD, 2)
+        self.assertEqual(self.rom.rom.size, self.size + 5)
+        self.assertEqual(self.readBack(self.size, 5), b"\x00\x00\x00\xab\xcd")
+        self.rom.seek(self.size + 8)
+        self.rom.writeU32(0xDEADBEEF)
+        self.assertEqual(self.readBack(self.size + 5, 7), b"\x00\x00\x00\xde\xad\xbe\xef")
+
+    def test_typed_values(self):
+        """Confirm that each typed accessor reads back what it wrote, and matches the bytes it's made of."""
+        for write, read, value, expected in (
+            (self.rom.writeU8, self.rom.readU8, 0xFE, b"\xfe"),
+            (self.rom.writeS8, self.rom.readS8, -2, b"\xfe"),
+            (self.rom.writeU16, self.rom.readU16, 0xFFFE, b"\xff\xfe"),
+            (self.rom.writeS16, self.rom.readS16, -2, b"\xff\xfe"),
+            (self.rom.writeU32, self.rom.readU32, 0x80000001, b"\x80\x00\x00\x01"),
+            (self.rom.writeS32, self.rom.readS32, -0x7FFFFFFF, b"\x80\x00\x00\x01"),
+            (self.rom.writeFloat, self.rom.readFloat, 1.5, b"\x3f\xc0\x00\x00"),
+        ):
+            self.rom.seek(0x200)
+            write(value)
+            self.assertEqual(self.readBack(0x200, len(expected)), expected)
+            self.rom.seek(0x200)
+            self.assertEqual(read(), value)
+            self.assertEqual(self.rom.rom.tell(), 0x200 + len(expected))
+
+    def test_read_past_end(self):
+        """Confirm that values read past the end of the ROM come up short like readBytes does."""
+        for position in (self.size - 1, self.size, self.size + 10):
+            self.rom.seek(position)
+            expected = int.from_bytes(self.rom.readBytes(2), "big")
+            self.rom.seek(position)
+            self.assertEqual(self.rom.readU16(), expected)
+            self.rom.seek(position)
+            self.assertEqual(bytes(self.rom.readSlice(2)), self.readBack(position, 2))
+            self.rom.seek(position)
+            self.assertEqual(self.rom.readFloat(), struct.unpack(">f", self.readBack(position, 4).rjust(4, b"\x00"))[0])
+            self.assertEqual(self.rom.rom.tell(), max(position, self.size))
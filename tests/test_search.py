@@ -0,0 +1,157 @@
+"""Test that searches answered from the cache or resumed from a checkpoint match a fresh search."""
+
+import random
+import unittest
+from unittest import mock
+
+import randomizer.Fill as Fill
+import randomizer.ItemPool as ItemPool
+from randomizer.Enums.Locations import Locations
+from randomizer.Enums.SearchMode import SearchMode
+from randomizer.Enums.Types import Types
+from randomizer.Enums.Settings import ProgressiveHintItem
+from randomizer.LogicClasses import LogicSnapshot, PurchaseCheckpoints, RecordedSet, SearchState
+from randomizer.Settings import Settings
+from randomizer.SettingStrings import decrypt_settings_string_enum
+from randomizer.ShuffleCBs import ShuffleCBs
+from randomizer.ShuffleWarps import LinkWarps
+from randomizer.Spoiler import Spoiler
+
+# The settings string tests/test_spoiler.py generates
+SETTINGS_STRING = "fjNPw8MxDKY6IJUtjnqSszmCCXBHofUA4IhkQlS2Nc+EZ+PxGiUiWxClFcdqgQmC9AAO/AAbBAADDAADFAACbzgSGIyGOhbgKQWiltsC3ASSAaZM1UQoxSClFMBkyyvV+CgLcAQYCbwEDgbgAwgEcQIEgrkBQoGcwMFg7oBwwIuQQmQ1AdWRXgAynEpq1hJQlHdVqyWJGZitIEcnaFalL0VEWARMRQBWLLHI3ZLxd5FA5DsZe09AzycYcgDKpwRCAAXCgAXDAATDgATEAAPWgAPEgALFAAHFgAPGAALGgAHXAAWnyvQJLlS2eyyejYfAwjmSu1gYDOXVYDiqKymVFoxxSgBQVg0oBOKi0SRcQyKnjWlkGkRGujsADoBeEIQEhQWHVhGWCAiJEhaKCosSlwwMjRMXjg6PE5gQEJEUFN8DGpoGBpWZYAGVGZjhAGIAToBZACiAA"
+
+
+def CreateSpoiler(**overrides) -> Spoiler:
+    """Create a spoiler with vanilla item placement and linked warps, ready to be searched."""
+    settings_dict = decrypt_settings_string_enum(SETTINGS_STRING)
+    settings_dict["seed"] = 1
+    # Progressive hint doors are only added to the world by the misc shuffles
+    settings_dict["progressive_hint_item"] = ProgressiveHintItem.off
+    settings_dict.update(overrides)
+    spoiler = Spoiler(Settings(settings_dict))
+    spoiler.ResetLocationList()
+    spoiler.InitKasplatMap()
+    LinkWarps(spoiler)
+    return spoiler
+
+
+def SearchUnreachable(spoiler: Spoiler) -> tuple:
+    """Search for every unreachable location with all items owned, returning them with the colored bananas found in each level."""
+    spoiler.Reset()
+    unreachable = Fill.GetAccessibleLocations(spoiler, ItemPool.AllItemsUnrestricted(spoiler.settings), SearchMode.GetUnreachable)
+    return sorted(unreachable), [sum(kongs) for kongs in spoiler.LogicVariables.ColoredBananas]
+
+
+class TestReachabilityCache(unittest.TestCase):
+    """Test the cache of finished searches."""
+
+    def test_cb_reroll(self):
+        """Confirm that every layout the CB shuffle verifies is searched as it is and not as a cached layout was."""
+        verifyWorld = Fill.VerifyWorld
+        searches = []
+
+        def CompareSearches(spoiler):
+            cached = SearchUnreachable(spoiler)
+            spoiler.reachability_cache.Clear()
+            fresh = SearchUnreachable(spoiler)
+            searches.append((cached, fresh))
+            return verifyWorld(spoiler)
+
+        random.seed(5)
+        spoiler = CreateSpoiler(cb_rando_enabled=True)
+        with mock.patch.object(Fill, "VerifyWorld", CompareSearches):
+            # Re-roll until a layout is rejected, so the layouts searched don't all give the same result
+            for rerolls in range(1, 21):
+                ShuffleCBs(spoiler)
+                if len(searches) > rerolls:
+                    break
+        self.assertGreater(len(searches), rerolls)
+        for cached, fresh in searches:
+            self.assertEqual(cached, fresh)
+
+
+# Logic variables listing items in the order the search collected them, which a resumed search collects in a different order
+COLLECTION_ORDER = {"latest_owned_items", "Blueprints"}
+
+
+def Search(spoiler: Spoiler, ownedItems: list, searchType: SearchMode, purchaseList: list = None, **resume) -> tuple:
+    """Search from a reset spoiler, returning the locations found with the logic variables the search left behind."""
+    spoiler.Reset()
+    result = Fill.GetAccessibleLocations(spoiler, ownedItems[:], searchType, purchaseList, **resume)
+    logicVariables = {key: sorted(value) if key in COLLECTION_ORDER else LogicSnapshot.CopyValue(value) for key, value in vars(spoiler.LogicVariables).items()}
+    return sorted(result), logicVariables
+
+
+def FreshSearch(spoiler: Spoiler, ownedItems: list, searchType: SearchMode, purchaseList: list = None) -> tuple:
+    """Search from the game start, without resuming or using the cache."""
+    spoiler.reachability_cache.Clear()
+    return Search(spoiler, ownedItems, searchType, purchaseList)
+
+
+class TestResumedSearch(unittest.TestCase):
+    """Test resuming a search from the checkpoint an earlier search left behind."""
+
+    def assertSameSearch(self, resumed, fresh):
+        """Compare the locations two searches found and the logic variables they left behind."""
+        self.assertEqual(resumed[0], fresh[0])
+        self.assertEqual([key for key, value in resumed[1].items() if value != fresh[1][key]], [])
+
+    def test_search_state(self):
+        """Confirm that a search resumed after filling reached locations finds the same as a fresh search."""
+        rng = random.Random(0)
+        spoiler = CreateSpoiler()
+        spoiler.ClearAllLocations()
+        items = ItemPool.AllItemsUnrestricted(spoiler.settings)
+        ownedItems = rng.sample(items, len(items) // 3)
+        itemsToPlace = [item for item in items if item not in ownedItems]
+        searchState = SearchState()
+        resumedSearches = 0
+        for _ in range(12):
+            resumed = Search(spoiler, ownedItems, SearchMode.GetReachableForFilling, searchState=searchState)
+            self.assertSameSearch(resumed, FreshSearch(spoiler, ownedItems, SearchMode.GetReachableForFilling))
+            resumedSearches += searchState.GetNewlyFilledLocations(spoiler, ownedItems, SearchMode.GetReachableForFilling, []) is not None
+            # Fill some of the reached locations, like a forward fill placing the next few items
+            for locationId in rng.sample(resumed[0], min(len(resumed[0]), 5)):
+                if itemsToPlace:
+                    spoiler.LocationList[locationId].PlaceItem(spoiler, itemsToPlace.pop(rng.randrange(len(itemsToPlace))))
+        self.assertGreater(resumedSearches, 0)
+        # Lowering the B. Locker requirements keeps the checkpoint usable
+        Search(spoiler, ownedItems, SearchMode.GetReachableForFilling, searchState=searchState)
+        spoiler.settings.BLockerEntryCount = [0] * len(spoiler.settings.BLockerEntryCount)
+        self.assertIsNotNone(searchState.GetNewlyFilledLocations(spoiler, ownedItems, SearchMode.GetReachableForFilling, []))
+        resumed = Search(spoiler, ownedItems, SearchMode.GetReachableForFilling, searchState=searchState)
+        self.assertSameSearch(resumed, FreshSearch(spoiler, ownedItems, SearchMode.GetReachableForFilling))
+
+    def test_purchase_checkpoints(self):
+        """Confirm that a search buying more shops, resumed from the round they were first reached, finds the same as a fresh search."""
+        spoiler = CreateSpoiler()
+        checkpoints = PurchaseCheckpoints()
+        purchaseList: list = []
+        resumedSearches = 0
+        while True:
+            checkpoints = checkpoints.Branch(purchaseList)
+            resumedSearches += checkpoints.resumeRound is not None
+            resumed = Search(spoiler, [], SearchMode.GetReachableWithControlledPurchases, purchaseList, checkpoints=checkpoints)
+            self.assertSameSearch(resumed, FreshSearch(spoiler, [], SearchMode.GetReachableWithControlledPurchases, purchaseList))
+            shops = [x for x in resumed[0] if spoiler.LocationList[x].type == Types.Shop and x not in purchaseList and spoiler.LocationList[x].item is not None]
+            if not shops:
+                break
+            # Buy the shop reached last, so the next search resumes as late as possible
+            purchaseList.append(max(shops, key=lambda x: (checkpoints.firstReached[x], x)))
+        self.assertGreater(resumedSearches, 1)
+
+    def test_recorded_set(self):
+        """Confirm that a copy of a recorded set iterates in the same order as the original."""
+        recorded = RecordedSet()
+        locations = list(Locations)
+        for location in reversed(locations):
+            recorded.add(location)
+        # Adding an item again doesn't move it
+        recorded.add(locations[-1])
+        self.assertEqual(recorded.order, locations[::-1])
+        copy = recorded.copy()
+        self.assertEqual(copy, recorded)
+        self.assertEqual(copy.order, recorded.order)
+        self.assertEqual(list(copy), list(recorded))
+        copy.add(None)
+        self.assertNotIn(None, recorded)
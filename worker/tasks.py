@@ -10,12 +10,14 @@ import logging
 from datetime import timezone, datetime
 from io import BytesIO
 import sys
+from opentelemetry import metrics
 from vidua import bps
 from rq import get_current_job
-from randomizer.Enums.Settings import SettingsMap
 from randomizer.Fill import Generate_Spoiler
 from randomizer.Patching.Patcher import load_base_rom
+from randomizer.SeedArtifact import ARTIFACT_EXTENSION, SPOILER_SECTION_PREFIX, WriteSeedArtifact
 from randomizer.Settings import Settings
+from randomizer.SettingStrings import cleanup_settings
 from randomizer.Spoiler import Spoiler
 from version import version
 
@@ -23,6 +25,14 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 logger.addHandler(logging.StreamHandler(sys.stdout))
 
+# These are exported through the meter provider set up in worker.py, and do nothing if there isn't one.
+meter = metrics.get_meter(__name__)
+phase_wall_time = meter.create_histogram("seed.phase.wall_time", unit="s", description="Wall time spent in each phase of seed generation")
+phase_cpu_time = meter.create_histogram("seed.phase.cpu_time", unit="s", description="CPU time spent in each phase of seed generation")
+search_counter = meter.create_counter("seed.searches", description="Calls to GetAccessibleLocations, by search mode")
+fill_retry_counter = meter.create_counter("seed.fill_retries", description="Fill attempts that had to be retried")
+peak_memory = meter.create_histogram("seed.peak_rss", unit="By", description="Peak resident set size of the process that generated the seed")
+
 
 def generate_seed(settings_dict):
     """Generate a seed with the given settings."""
@@ -52,6 +62,7 @@ def generate_seed(settings_dict):
         spoiler = Spoiler(settings_obj)
         patch, spoiler, password = Generate_Spoiler(spoiler)
         spoiler.FlushAllExcessSpoilerData()
+        record_metrics(spoiler.metrics.ToDict())
         return update_seed_results(patch, spoiler, settings_dict, password, delayed_timestamp)
 
     except Exception as e:
@@ -62,27 +73,22 @@ def generate_seed(settings_dict):
         # queue.put(error)
 
 
-def cleanup_settings(settings):
-    """Cleanup the settings dictionary."""
-    # Convert string data to enums where possible.
-    for k, v in settings.items():
-        if k in SettingsMap:
-            if type(v) is list:
-                values = []
-                for val in v:
-                    if type(val) is int:
-                        values.append(SettingsMap[k](val))
-                    else:
-                        values.append(SettingsMap[k][val])
-                settings[k] = values
-            elif type(v) is int:
-                settings[k] = SettingsMap[k](v)
-            else:
-                try:
-                    settings[k] = SettingsMap[k][v]
-                except Exception:
-                    pass
-    return settings
+def record_metrics(generation_metrics):
+    """Record the metrics from generating a seed with OpenTelemetry."""
+    try:
+        for phase, timings in generation_metrics["phases"].items():
+            phase_wall_time.record(timings["wall"], {"phase": phase})
+            phase_cpu_time.record(timings["cpu"], {"phase": phase})
+        for mode, count in generation_metrics["searches"].items():
+            search_counter.add(count, {"mode": mode})
+        fill_retry_counter.add(generation_metrics["fill_retries"])
+        peak_memory.record(generation_metrics["peak_rss"])
+        # Jobs run in a forked work horse that exits before the periodic reader would get to export these.
+        provider = metrics.get_meter_provider()
+        if hasattr(provider, "force_flush"):
+            provider.force_flush()
+    except Exception as e:
+        logger.info(e)
 
 
 def update_seed_results(patch, spoiler, settings_dict, password, delayed_timestamp):
@@ -103,17 +109,12 @@ def update_seed_results(patch, spoiler, settings_dict, password, delayed_timesta
         unlock_time = 0
 
     hash = spoiler.settings.seed_hash
-    spoiler_log = json.loads(spoiler.json)
     # Encrypt the time and hash with the encryption key.
 
     current_seed_number = update_total()
     file_name = str(current_seed_number)
-    spoiler_log["Unlock Time"] = unlock_time
-    spoiler_log["Generated Time"] = timestamp
-
-    # write the spoiler log to a file in generated_seeds folder. Create the folder if it doesn't exist.
-    with open("generated_seeds/" + file_name + ".json", "w") as f:
-        f.write(str(json.dumps(spoiler_log)))
+    # Each section is encoded once and shared by the full log on disk and the log sent back with the patch.
+    spoiler_sections = spoiler.EncodeJsonSections({"Unlock Time": unlock_time, "Generated Time": timestamp})
 
     sections_to_retain = [
         "Settings",
@@ -124,19 +125,13 @@ def update_seed_results(patch, spoiler, settings_dict, password, delayed_timesta
         "Item Pool",
     ]
     if spoiler.settings.generate_spoilerlog is False:
-        spoiler_log = {k: v for k, v in spoiler_log.items() if k in sections_to_retain}
+        retained_sections = [name for name in spoiler_sections if name in sections_to_retain]
     else:
-        del spoiler_log["Unlock Time"]
+        retained_sections = [name for name in spoiler_sections if name != "Unlock Time"]
 
     # Always remove Password from the spoiler log.
     if spoiler.settings.has_password:
-        try:
-            del spoiler_log["Password"]
-        except Exception:
-            try:
-                del spoiler_log["password"]
-            except Exception:
-                pass
+        retained_sections = [name for name in retained_sections if name not in ("Password", "password")]
 
     # Zip all the data into a single file.
     # Create a new zip file
@@ -146,7 +141,7 @@ def update_seed_results(patch, spoiler, settings_dict, password, delayed_timesta
         # Write each variable to the zip file
         zip_file.writestr("patch", patch)
         zip_file.writestr("hash", str(hash))
-        zip_file.writestr("spoiler_log", str(json.dumps(spoiler_log)))
+        zip_file.writestr("spoiler_log", spoiler.JoinJsonSections(spoiler_sections, retained_sections))
         zip_file.writestr("seed_id", str(spoiler.settings.seed_id))
         zip_file.writestr("generated_time", str(timestamp))
         zip_file.writestr("version", version)
@@ -155,12 +150,18 @@ def update_seed_results(patch, spoiler, settings_dict, password, delayed_timesta
     # Convert the zip to a string of base64 data
     zip_conv = codecs.encode(zip_data.getvalue(), "base64").decode()
 
-    # Store the patch file in generated_seeds folder.
-    with open("generated_seeds/" + file_name + ".lanky", "w") as f:
-        f.write(zip_conv)
+    # Store the patch and the full spoiler log in generated_seeds folder, the patch is only base64 encoded again when it is downloaded.
+    artifact_sections = {
+        "patch": zip_data.getvalue(),
+        "metadata": json.dumps({"seed_id": str(spoiler.settings.seed_id), "version": version}).encode("utf-8"),
+    }
+    for name, encoded in spoiler_sections.items():
+        artifact_sections[SPOILER_SECTION_PREFIX + name] = encoded.encode("utf-8")
+    with open("generated_seeds/" + file_name + ARTIFACT_EXTENSION, "wb") as f:
+        WriteSeedArtifact(f, unlock_time, timestamp, current_seed_number, hash, artifact_sections)
     if password:
-        return {"patch": zip_conv, "hash": hash, "seed_number": current_seed_number, "password": password}
-    return {"patch": zip_conv, "hash": hash, "seed_number": current_seed_number}
+        return {"patch": zip_conv, "hash": hash, "seed_number": current_seed_number, "password": password, "metrics": spoiler.metrics.ToDict()}
+    return {"patch": zip_conv, "hash": hash, "seed_number": current_seed_number, "metrics": spoiler.metrics.ToDict()}
 
 
 def update_total():
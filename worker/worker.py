@@ -5,6 +5,7 @@ from redis import Redis
 from rq import Queue, Worker
 import threading
 import json
+import multiprocessing
 import os
 from waitress import serve
 from opentelemetry import trace
@@ -22,6 +23,7 @@ from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry._logs import set_logger_provider
 from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from randomizer.Feasibility import SettingsInfeasibility
 from randomizer.SettingStrings import decrypt_settings_string_enum, encrypt_settings_string_enum
 from randomizer.Enums.Types import ItemRandoSelector, KeySelector
 from randomizer.Lists.EnemyTypes import EnemySelector
@@ -49,52 +51,62 @@ if BRANCH == "master":
 else:
     listen_branch = "dev"
 listen = [f"tasks_high_priority_{listen_branch}", f"tasks_low_priority_{listen_branch}"]  # High-priority first
-redis_conn = Redis(host="redis", port=6379)
 job_timeout = 300  # Timeout in seconds (5 minutes)
-app = Flask(__name__)
-app.config["JSON_SORT_KEYS"] = False
-# Define a resource to identify your service
-resource = Resource(
-    attributes={
-        "service.name": "worker-" + BRANCH,
-        "service.version": str(version),
-        "deployment.environment": BRANCH,
-        "container.id": next((l.rsplit("/", 1)[-1] for l in open("/proc/self/cgroup") if "docker" in l), "") if os.path.exists("/proc/self/cgroup") else "",
-        "container.name": socket.gethostname(),
-    }
-)
+api = Blueprint("worker_api", __name__)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+# A settings check takes tens of milliseconds, anything slower than this means the process running them is stuck
+SETTINGS_CHECK_TIMEOUT = 2
+settings_check_pool = None
+settings_check_started = None
+settings_check_lock = threading.Lock()
 
 
-app.wsgi_app = OpenTelemetryMiddleware(app.wsgi_app)
-api = Blueprint("worker_api", __name__)
+def setupTelemetry():
+    """Set up the trace, metric and log providers, exporting to the collector outside of local runs."""
+    # Define a resource to identify your service
+    resource = Resource(
+        attributes={
+            "service.name": "worker-" + BRANCH,
+            "service.version": str(version),
+            "deployment.environment": BRANCH,
+            "container.id": next((l.rsplit("/", 1)[-1] for l in open("/proc/self/cgroup") if "docker" in l), "") if os.path.exists("/proc/self/cgroup") else "",
+            "container.name": socket.gethostname(),
+        }
+    )
+    trace.set_tracer_provider(TracerProvider(resource=resource))
+    tracer_provider = trace.get_tracer_provider()
 
+    # # Configure OTLP Exporter for sending traces to the collector
+    otlp_exporter = OTLPSpanExporter(endpoint="http://host.docker.internal:4318/v1/traces")
 
-span = trace.get_current_span()
-trace.set_tracer_provider(TracerProvider(resource=resource))
-tracer_provider = trace.get_tracer_provider()
+    # # Add the BatchSpanProcessor to the TracerProvider
+    span_processor = BatchSpanProcessor(otlp_exporter)
+    tracer_provider.add_span_processor(span_processor)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+    if BRANCH != "LOCAL":
+        reader = PeriodicExportingMetricReader(OTLPMetricExporter(endpoint="http://host.docker.internal:4318/v1/metrics"))
+        meterProvider = MeterProvider(resource=resource, metric_readers=[reader])
+        metrics.set_meter_provider(meterProvider)
+        RQInstrumentor().instrument()
+        RedisInstrumentor().instrument()
+        # create the providers
+        logger_provider = LoggerProvider(resource=resource)
+        # set the providers
+        set_logger_provider(logger_provider)
+        handler = LoggingHandler(level=logging.DEBUG, logger_provider=logger_provider)
+        logger.addHandler(handler)
 
-# # Configure OTLP Exporter for sending traces to the collector
-otlp_exporter = OTLPSpanExporter(endpoint="http://host.docker.internal:4318/v1/traces")
 
-# # Add the BatchSpanProcessor to the TracerProvider
-span_processor = BatchSpanProcessor(otlp_exporter)
-tracer_provider.add_span_processor(span_processor)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-logger.addHandler(logging.StreamHandler(sys.stdout))
-if __name__ == "__main__" and os.environ.get("BRANCH", "LOCAL") != "LOCAL":
-    reader = PeriodicExportingMetricReader(OTLPMetricExporter(endpoint="http://host.docker.internal:4318/v1/metrics"))
-    meterProvider = MeterProvider(resource=resource, metric_readers=[reader])
-    metrics.set_meter_provider(meterProvider)
-    FlaskInstrumentor().instrument_app(app)
-    RQInstrumentor().instrument()
-    RedisInstrumentor().instrument()
-    # create the providers
-    logger_provider = LoggerProvider(resource=resource)
-    # set the providers
-    set_logger_provider(logger_provider)
-    handler = LoggingHandler(level=logging.DEBUG, logger_provider=logger_provider)
-    logger.addHandler(handler)
+def createApp():
+    """Create the Flask app serving the worker's API."""
+    app = Flask(__name__)
+    app.config["JSON_SORT_KEYS"] = False
+    app.wsgi_app = OpenTelemetryMiddleware(app.wsgi_app)
+    app.register_blueprint(api)
+    if BRANCH != "LOCAL":
+        FlaskInstrumentor().instrument_app(app)
+    return app
 
 
 @api.route("/get_selector_info", methods=["GET"])
@@ -150,15 +162,69 @@ def convert_settings():
         return jsonify({"error": "Invalid data"}), 400
 
 
-def runWaitressWorker():
+@api.route("/check_settings", methods=["POST"])
+def check_settings():
+    """Check if settings can generate a seed at all, without generating one."""
+    data = request.get_json()
+    if not data or "settings_data" not in data:
+        return jsonify({"error": "Invalid data"}), 400
+    settings_data = data["settings_data"]
+    if isinstance(settings_data, str):
+        settings_data = json.loads(settings_data)
+    infeasible = checkSettingsInProcess(settings_data)
+    if infeasible is False:
+        return jsonify({"error": "Unable to check the settings right now"}), 503
+    if infeasible is not None:
+        return jsonify({"feasible": False, "error": infeasible})
+    return jsonify({"feasible": True})
+
+
+def getSettingsCheckPool():
+    """Get the process settings are checked in, starting it if there isn't one, or None while it's still starting."""
+    global settings_check_pool, settings_check_started
+    if settings_check_pool is None:
+        settings_check_pool = multiprocessing.get_context("spawn").Pool(1)
+        # The process imports this file and the randomizer before it takes anything, which takes longer than a check is given
+        settings_check_started = settings_check_pool.apply_async(int)
+    if not settings_check_started.ready():
+        return None
+    return settings_check_pool
+
+
+def checkSettingsInProcess(settings_data):
+    """Check the settings in a process of their own, returning why they can't generate a seed, None if they can, or False if there's no answer.
+
+    Building settings and a spoiler changes module level tables and the global random state.
+    Doing that here, next to the RQ worker, would carry it into every seed forked from this process afterwards.
+    Checks run one at a time, and a check that takes too long replaces the process, so a stuck one can't hold up the ones after it.
+    """
+    global settings_check_pool
+    if not settings_check_lock.acquire(timeout=SETTINGS_CHECK_TIMEOUT):
+        return False
+    try:
+        pool = getSettingsCheckPool()
+        if pool is None:
+            return False
+        try:
+            return pool.apply_async(SettingsInfeasibility, (settings_data,)).get(SETTINGS_CHECK_TIMEOUT)
+        except multiprocessing.TimeoutError:
+            logger.info("Settings check timed out, restarting the process running them")
+            pool.terminate()
+            settings_check_pool = None
+            return False
+    finally:
+        settings_check_lock.release()
+
+
+def runWaitressWorker(app):
     """Run the worker using Waitress."""
     # Start the Flask server
-    app.register_blueprint(api)
     serve(app, host="0.0.0.0", port=8000)
 
 
 def runWorker(jobs):
     """Run the worker using RQ."""
+    redis_conn = Redis(host="redis", port=6379)
     # Create queues for high- and low-priority tasks
     queues = [Queue(name, connection=redis_conn, default_timeout=job_timeout) for name in listen]
 
@@ -179,10 +245,13 @@ def runWorker(jobs):
     worker.work(max_jobs=jobs, with_scheduler=False)
 
 
+# Everything with side effects only happens here, processes the fill spawns import this file again as __mp_main__ and mustn't repeat it
 if __name__ == "__main__":
-
+    setupTelemetry()
+    # Started now so the first check doesn't wait on the process importing the randomizer
+    getSettingsCheckPool()
     # Start the worker in a separate thread
-    worker_thread = threading.Thread(target=runWaitressWorker)
+    worker_thread = threading.Thread(target=runWaitressWorker, args=(createApp(),))
     worker_thread.start()
     runWorker(None)
     # Close the worker thread instead of waiting for it to finish